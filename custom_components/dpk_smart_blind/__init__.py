@@ -7,31 +7,65 @@ https://github.com/dpktjf/eto-irrigation
 
 from __future__ import annotations
 
-from datetime import timedelta
+import time
+from datetime import datetime, timedelta
 from typing import TYPE_CHECKING
+from zoneinfo import ZoneInfo
 
 from homeassistant.const import (
     CONF_NAME,
     Platform,
 )
+from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers import discovery
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
 from homeassistant.helpers.event import (
     async_track_state_change_event,
 )
 
+from .analytics import async_get_analytics_store
 from .api import DPKSmartBlindAPI
-from .const import _LOGGER, CONF_ENTITY, CONF_WEATHER_ENTITY
+from .batch import async_get_batcher
+from .chart import chart_directory, remove_charts
+from .command_queue import async_get_command_queue
+from .const import (
+    _LOGGER,
+    CONF_COMMAND_CONCURRENCY,
+    CONF_COMMAND_GROUP,
+    CONF_COMMAND_SPACING,
+    CONF_COMMAND_TIMEOUT,
+    CONF_ENTITY,
+    CONF_IRRADIANCE_ENTITY,
+    CONF_TICK_LOG,
+    CONF_WEATHER_ENTITY,
+    DEFAULT_COMMAND_CONCURRENCY,
+    DEFAULT_COMMAND_SPACING,
+    DEFAULT_COMMAND_TIMEOUT,
+    DOMAIN,
+    SUN_ENTITY,
+)
 from .coordinator import DPKTradingDataUpdateCoordinator
 from .data import DPKSmartBlindData
+from .irradiance import async_get_clear_sky
+from .lifecycle import EntryLifecycle
+from .memo import async_get_memo
+from .settings import async_get_settings
+from .solar import async_get_solar
+from .sun_filter import SunOutFilter
+from .tick_log import async_get_tick_log_writer
+from .websocket_api import async_get_state_stream
+from .websocket_api import async_setup as async_setup_websocket_api
 
 if TYPE_CHECKING:
     from homeassistant.core import HomeAssistant
+    from homeassistant.helpers.typing import ConfigType
 
     from .data import DPKSmartBlindConfigEntry
 
 PLATFORMS: list[Platform] = [
     Platform.SENSOR,
     Platform.BINARY_SENSOR,
+    Platform.IMAGE,
 ]
 
 # https://homeassistantapi.readthedocs.io/en/latest/api.html
@@ -39,6 +73,31 @@ PLATFORMS: list[Platform] = [
 
 DEFAULT_SCAN_INTERVAL = timedelta(minutes=10)
 
+# Longest boot-time wait for every blind to join the shared first refresh.
+SETUP_BATCH_TIMEOUT = 2.0
+
+CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
+
+
+async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
+    """Set up the domain-wide pieces shared by all blinds."""
+    batcher = async_get_batcher(hass)
+    await async_get_settings(hass).async_load()
+    """Entries set up concurrently next; give them one first refresh."""
+    batcher.async_hold(
+        len(
+            hass.config_entries.async_entries(
+                DOMAIN, include_ignore=False, include_disabled=False
+            )
+        ),
+        SETUP_BATCH_TIMEOUT,
+    )
+    async_setup_websocket_api(hass)
+    hass.async_create_task(
+        discovery.async_load_platform(hass, Platform.SENSOR, DOMAIN, {}, config)
+    )
+    return True
+
 
 # https://developers.home-assistant.io/docs/config_entries_index/#setting-up-an-entry
 async def async_setup_entry(
@@ -53,37 +112,97 @@ async def async_setup_entry(
         session=async_get_clientsession(hass),
         states=hass.states,
         hass=hass,
+        solar=async_get_solar(hass),
+        batcher=async_get_batcher(hass),
+        memo=async_get_memo(hass),
+        clear_sky=async_get_clear_sky(hass),
     )
 
-    coordinator = DPKTradingDataUpdateCoordinator(api, hass)
+    """Every timer and subscription the blind takes out is owned here."""
+    lifecycle = EntryLifecycle(hass, entry.data[CONF_NAME])
+    entry.async_on_unload(lifecycle.async_close)
+
+    """Covers on the same bridge share a group; default is one per cover."""
+    command_group = async_get_command_queue(hass).async_get_group(
+        entry.entry_id,
+        entry.options.get(CONF_COMMAND_GROUP) or entry.options[CONF_ENTITY],
+        concurrency=entry.options.get(
+            CONF_COMMAND_CONCURRENCY, DEFAULT_COMMAND_CONCURRENCY
+        ),
+        spacing=entry.options.get(CONF_COMMAND_SPACING, DEFAULT_COMMAND_SPACING),
+        timeout=entry.options.get(CONF_COMMAND_TIMEOUT, DEFAULT_COMMAND_TIMEOUT),
+    )
+    lifecycle.async_add(
+        "command_group",
+        lambda: async_get_command_queue(hass).async_release(entry.entry_id),
+    )
+
+    sun_filter = SunOutFilter(entry.options)
     _weather_entity = entry.options.get(CONF_WEATHER_ENTITY)
-    _entities = ["sun.sun"]
-    for entity in [_weather_entity]:
+    _irradiance_entity = entry.options.get(CONF_IRRADIANCE_ENTITY)
+    if _weather_entity:
+        sun_filter.update_weather(hass.states.get(_weather_entity), time.monotonic())
+    if _irradiance_entity:
+        sun_filter.update_irradiance(
+            hass.states.get(_irradiance_entity), time.monotonic()
+        )
+
+    analytics_store = async_get_analytics_store(hass)
+    analytics = await analytics_store.async_get(
+        entry.entry_id, datetime.now(ZoneInfo(hass.config.time_zone)).date()
+    )
+    lifecycle.async_add(
+        "analytics", analytics_store.async_register(entry.entry_id, analytics)
+    )
+
+    tick_log = None
+    if entry.options.get(CONF_TICK_LOG):
+        writer = async_get_tick_log_writer(hass)
+        tick_log = writer.async_register(entry.entry_id)
+        lifecycle.async_add("tick_log", lambda: writer.async_unregister(entry.entry_id))
+
+    coordinator = DPKTradingDataUpdateCoordinator(
+        api, hass, command_group, sun_filter, analytics, tick_log, lifecycle
+    )
+    coordinator.async_seed_cover_state(hass.states.get(entry.options[CONF_ENTITY]))
+    _entities = [SUN_ENTITY]
+    for entity in [_weather_entity, _irradiance_entity]:
         if entity is not None:
             _entities.append(entity)  # noqa: PERF401
-    entry.async_on_unload(
+    lifecycle.async_add(
+        "entity_state",
         async_track_state_change_event(
             hass,
             _entities,
             coordinator.async_check_entity_state_change,
-        )
+        ),
     )
 
     _covers = []
     _covers.append(entry.options.get(CONF_ENTITY))
-    entry.async_on_unload(
+    lifecycle.async_add(
+        "cover_state",
         async_track_state_change_event(
             hass,
             _covers,
             coordinator.async_check_cover_state_change,
-        )
+        ),
     )
 
     await coordinator.async_config_entry_first_refresh()
 
-    entry.async_on_unload(entry.add_update_listener(async_update_options))
+    lifecycle.async_add(
+        "update_listener", entry.add_update_listener(async_update_options)
+    )
 
-    entry.runtime_data = DPKSmartBlindData(entry.data[CONF_NAME], api, coordinator)
+    entry.runtime_data = DPKSmartBlindData(
+        entry.data[CONF_NAME], api, coordinator, lifecycle
+    )
+
+    lifecycle.async_add(
+        "state_stream",
+        async_get_state_stream(hass).async_register(entry.entry_id, coordinator),
+    )
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
@@ -94,6 +213,7 @@ async def async_update_options(
     hass: HomeAssistant, entry: DPKSmartBlindConfigEntry
 ) -> None:
     """Update options."""
+    async_get_memo(hass).clear()
     await hass.config_entries.async_reload(entry.entry_id)
 
 
@@ -104,5 +224,17 @@ async def async_unload_entry(
     """Handle removal of an entry."""
     _LOGGER.debug("removing...")
     coordinator = entry.runtime_data.coordinator
-    coordinator.async_cancel_update_listener()
+    if coordinator.command_group is not None:
+        coordinator.command_group.async_cancel(entry.options[CONF_ENTITY])
     return await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
+
+
+async def async_remove_entry(
+    hass: HomeAssistant,
+    entry: DPKSmartBlindConfigEntry,
+) -> None:
+    """Drop a deleted blind's stored analytics and sun charts."""
+    await async_get_analytics_store(hass).async_remove(entry.entry_id)
+    await hass.async_add_executor_job(
+        remove_charts, chart_directory(hass), entry.entry_id
+    )
@@ -0,0 +1,274 @@
+"""Incremental daily analytics for dpk_smart_blind."""
+
+from __future__ import annotations
+
+from collections import deque
+from dataclasses import dataclass, field
+from datetime import date, datetime, time, timedelta
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.dispatcher import async_dispatcher_send
+from homeassistant.helpers.event import async_track_time_change
+from homeassistant.helpers.storage import Store
+
+from .const import _LOGGER, DEFAULT_ANALYTICS_DAYS, DOMAIN, SIGNAL_ANALYTICS
+
+if TYPE_CHECKING:
+    import asyncio
+    from collections.abc import Iterable
+
+DATA_ANALYTICS = f"{DOMAIN}_analytics"
+STORAGE_KEY = f"{DOMAIN}.analytics"
+STORAGE_VERSION = 1
+
+# Saves are coalesced; a busy tick across many blinds is one write.
+SAVE_DELAY = 60
+
+# Time at position is kept in 10% bands named by their lower edge, so 0 is
+# 0..9% and 100 only fully open.
+POSITION_BAND = 10
+
+
+@dataclass(slots=True)
+class DailyTotals:
+    """One blind's running totals for one local day."""
+
+    day: date
+    sun_in_window: float = 0.0  # seconds
+    moves: int = 0
+    overrides: int = 0
+    position_time: dict[int, float] = field(default_factory=dict)  # band: seconds
+
+    @property
+    def sun_in_window_minutes(self) -> int:
+        """Whole minutes the sun was in the window."""
+        return int(self.sun_in_window // 60)
+
+    @property
+    def position_minutes(self) -> dict[int, int]:
+        """Whole minutes spent in each position band."""
+        return {
+            band: int(seconds // 60)
+            for band, seconds in sorted(self.position_time.items())
+        }
+
+    def as_dict(self) -> dict[str, Any]:
+        """Serialise for storage."""
+        return {
+            "day": self.day.isoformat(),
+            "sun_in_window": round(self.sun_in_window, 1),
+            "moves": self.moves,
+            "overrides": self.overrides,
+            "position_time": {
+                str(band): round(seconds, 1)
+                for band, seconds in self.position_time.items()
+            },
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> DailyTotals:
+        """Restore from storage."""
+        return cls(
+            day=date.fromisoformat(data["day"]),
+            sun_in_window=data.get("sun_in_window", 0.0),
+            moves=data.get("moves", 0),
+            overrides=data.get("overrides", 0),
+            position_time={
+                int(band): seconds
+                for band, seconds in data.get("position_time", {}).items()
+            },
+        )
+
+
+class BlindAnalytics:
+    """
+    O(1) running accumulators for one blind.
+
+    Durations are integrated between calls: whatever held since the last call
+    (sun in the window, the cover's position band) is credited with the time
+    elapsed, so nothing is sampled or scanned. Crossing local midnight splits
+    the interval, closes the day into the history and starts a new one.
+    """
+
+    __slots__ = ("_history", "_mark", "_position", "_sun_in_window", "today")
+
+    def __init__(
+        self,
+        today: DailyTotals,
+        history: Iterable[DailyTotals] = (),
+        days: int = DEFAULT_ANALYTICS_DAYS,
+    ) -> None:
+        """Initialize."""
+        self.today = today
+        self._history: deque[DailyTotals] = deque(history, maxlen=days)
+        self._mark: datetime | None = None
+        self._sun_in_window = False
+        self._position: int | None = None
+
+    @property
+    def history(self) -> list[DailyTotals]:
+        """Closed days, oldest first."""
+        return list(self._history)
+
+    @property
+    def position(self) -> int | None:
+        """Last settled cover position."""
+        return self._position
+
+    def advance(self, now: datetime) -> bool:
+        """Credit elapsed time up to `now`; return True if a day was closed."""
+        rolled = False
+        while now.date() > self.today.day:
+            midnight = datetime.combine(
+                self.today.day + timedelta(days=1), time.min, now.tzinfo
+            )
+            self._accrue(midnight)
+            self._history.append(self.today)
+            self.today = DailyTotals(midnight.date())
+            rolled = True
+        self._accrue(now)
+        return rolled
+
+    def _accrue(self, until: datetime) -> None:
+        if self._mark is not None and until > self._mark:
+            elapsed = (until - self._mark).total_seconds()
+            if self._sun_in_window:
+                self.today.sun_in_window += elapsed
+            if self._position is not None:
+                band = int(self._position // POSITION_BAND) * POSITION_BAND
+                self.today.position_time[band] = (
+                    self.today.position_time.get(band, 0.0) + elapsed
+                )
+        self._mark = until
+
+    def record_tick(self, now: datetime, *, sun_in_window: bool) -> None:
+        """Account up to a calculation tick, then take its sun state."""
+        self.advance(now)
+        self._sun_in_window = sun_in_window
+
+    def record_position(self, now: datetime, position: int) -> bool:
+        """Account up to a settled cover position; return True if it moved."""
+        self.advance(now)
+        moved = self._position is not None and position != self._position
+        if moved:
+            self.today.moves += 1
+        self._position = position
+        return moved
+
+    def record_override(self, now: datetime) -> None:
+        """Count a move the integration did not ask for."""
+        self.advance(now)
+        self.today.overrides += 1
+
+    def as_dict(self) -> dict[str, Any]:
+        """Serialise for storage."""
+        return {
+            "today": self.today.as_dict(),
+            "history": [day.as_dict() for day in self._history],
+        }
+
+    @classmethod
+    def from_dict(
+        cls,
+        data: dict[str, Any] | None,
+        today: date,
+        days: int = DEFAULT_ANALYTICS_DAYS,
+    ) -> BlindAnalytics:
+        """Restore from storage, or start afresh for `today`."""
+        if not data:
+            return cls(DailyTotals(today), days=days)
+        return cls(
+            DailyTotals.from_dict(data["today"]),
+            (DailyTotals.from_dict(day) for day in data.get("history", [])),
+            days,
+        )
+
+
+class AnalyticsStore:
+    """Persist every blind's analytics and roll them over at local midnight."""
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize."""
+        self._hass = hass
+        self._store: Store[dict[str, Any]] = Store(hass, STORAGE_VERSION, STORAGE_KEY)
+        self._load_task: asyncio.Task[dict[str, Any] | None] | None = None
+        self._stored: dict[str, Any] = {}
+        self._blinds: dict[str, BlindAnalytics] = {}
+        self._midnight_unsub: CALLBACK_TYPE | None = None
+        self._save_pending = False
+
+    async def _async_load(self) -> None:
+        if self._load_task is None:
+            """Entries set up concurrently share one read."""
+            self._load_task = self._hass.async_create_task(self._store.async_load())
+        self._stored = await self._load_task or self._stored
+
+    async def async_get(self, entry_id: str, today: date) -> BlindAnalytics:
+        """Return an entry's analytics, restored from storage when present."""
+        await self._async_load()
+        return BlindAnalytics.from_dict(self._stored.get(entry_id), today)
+
+    @callback
+    def async_register(self, entry_id: str, analytics: BlindAnalytics) -> CALLBACK_TYPE:
+        """Track an entry's analytics; return a callable to stop tracking."""
+        self._blinds[entry_id] = analytics
+        if self._midnight_unsub is None:
+            self._midnight_unsub = async_track_time_change(
+                self._hass, self._async_midnight, hour=0, minute=0, second=0
+            )
+
+        @callback
+        def unregister() -> None:
+            if self._blinds.pop(entry_id, None) is not None:
+                self._stored[entry_id] = analytics.as_dict()
+                self.async_schedule_save()
+            if not self._blinds and self._midnight_unsub is not None:
+                self._midnight_unsub()
+                self._midnight_unsub = None
+
+        return unregister
+
+    async def async_remove(self, entry_id: str) -> None:
+        """Forget a deleted entry's history."""
+        await self._async_load()
+        self._blinds.pop(entry_id, None)
+        if self._stored.pop(entry_id, None) is not None:
+            self.async_schedule_save()
+
+    @callback
+    def async_schedule_save(self) -> None:
+        """Write everything once the current burst of changes has settled."""
+        if not self._save_pending:
+            self._save_pending = True
+            self._store.async_delay_save(self._data_to_save, SAVE_DELAY)
+
+    @callback
+    def _data_to_save(self) -> dict[str, Any]:
+        self._save_pending = False
+        for entry_id, analytics in self._blinds.items():
+            self._stored[entry_id] = analytics.as_dict()
+        return self._stored
+
+    @callback
+    def _async_midnight(self, now: datetime) -> None:
+        """Close the day for every blind, so sensors reset on time."""
+        _LOGGER.debug("rolling over analytics for %d blinds", len(self._blinds))
+        for entry_id, analytics in self._blinds.items():
+            if analytics.advance(now):
+                async_dispatcher_send(
+                    self._hass,
+                    SIGNAL_ANALYTICS.format(entry_id),
+                    True,  # noqa: FBT003
+                )
+        self.async_schedule_save()
+
+
+@callback
+def async_get_analytics_store(hass: HomeAssistant) -> AnalyticsStore:
+    """Return the shared analytics store."""
+    store: AnalyticsStore | None = hass.data.get(DATA_ANALYTICS)
+    if store is None:
+        store = AnalyticsStore(hass)
+        hass.data[DATA_ANALYTICS] = store
+    return store
@@ -4,44 +4,71 @@ from __future__ import annotations
 
 import logging
 from datetime import datetime as dt
-from datetime import timedelta as td
-from typing import TYPE_CHECKING, Any
-from zoneinfo import ZoneInfo
-
-import astral.sun
-from homeassistant.helpers.sun import get_astral_location
-from numpy import radians as rad
-from numpy import tan
+from typing import TYPE_CHECKING
 
 from custom_components.dpk_smart_blind.const import (
-    ATTR_AZIMUTH,
-    ATTR_COVER_HEIGHT,
-    ATTR_COVER_SETTING,
-    ATTR_ELEVATION,
-    ATTR_MANUAL_OVERRIDE,
-    ATTR_NOW,
-    ATTR_SHADOW_LENGTH,
-    ATTR_SUN_IN_WINDOW,
-    ATTR_SUN_STATE,
     CONF_AZIMUTH,
     CONF_DEFAULT_HEIGHT,
+    CONF_DELTA_POSITION,
+    CONF_DELTA_TILT,
     CONF_DELTA_TIME,
     CONF_DISTANCE,
+    CONF_ENTITY,
     CONF_FOV_LEFT,
     CONF_FOV_RIGHT,
     CONF_HEIGHT_WIN,
-    StateOfSunInWindow,
+    CONF_IRRADIANCE_ENTITY,
+    CONF_SLAT_SPACING,
+    CONF_SLAT_WIDTH,
+    CONF_TILT_MODE,
+    CONF_WEATHER_ENTITY,
+    CONF_ZONE_DISTANCE,
+    CONF_ZONE_HEIGHT,
+    CONF_ZONES,
+    DEFAULT_DELTA_TILT,
+    DEFAULT_SLAT_SPACING,
+    DEFAULT_SLAT_WIDTH,
 )
+from custom_components.dpk_smart_blind.core.config import WindowConfig
+from custom_components.dpk_smart_blind.core.snapshot import BlindSnapshot
+from custom_components.dpk_smart_blind.core.window import WindowCalculator
 
 if TYPE_CHECKING:
+    from collections.abc import Mapping
+    from typing import Any
+
     import aiohttp
     from homeassistant.core import HomeAssistant, StateMachine
 
+    from .batch import CalculationBatcher
+    from .core.irradiance import ClearSkyCurve
+    from .core.memo import CalculationMemo
     from .data import DPKSmartBlindConfigEntry
+    from .solar import SolarPosition
 
 _LOGGER = logging.getLogger(__name__)
 
 
+def window_config(options: Mapping[str, Any]) -> WindowConfig:
+    """Plain window settings from config entry options."""
+    return WindowConfig(
+        azimuth=float(options[CONF_AZIMUTH]),
+        fov_left=float(options[CONF_FOV_LEFT]),
+        fov_right=float(options[CONF_FOV_RIGHT]),
+        distance=float(options[CONF_DISTANCE]),
+        window_height=float(options[CONF_HEIGHT_WIN]),
+        default_height=float(options[CONF_DEFAULT_HEIGHT]),
+        delta_time=float(options[CONF_DELTA_TIME]),
+        tilt_mode=bool(options.get(CONF_TILT_MODE)),
+        slat_width=float(options.get(CONF_SLAT_WIDTH, DEFAULT_SLAT_WIDTH)),
+        slat_spacing=float(options.get(CONF_SLAT_SPACING, DEFAULT_SLAT_SPACING)),
+        zones=tuple(
+            (float(zone[CONF_ZONE_DISTANCE]), float(zone.get(CONF_ZONE_HEIGHT, 0)))
+            for zone in options.get(CONF_ZONES) or ()
+        ),
+    )
+
+
 class DPKSmartBlindError(Exception):
     """Exception to indicate a general API error."""
 
@@ -71,39 +98,43 @@ class DPKSmartBlindStartupError(
 
 
 class DPKSmartBlindAPI:
-    """API Client."""
+    """
+    API Client.
+
+    Adapts a config entry and Home Assistant's state machine to the
+    calculation core, which does the work in `WindowCalculator`.
+    """
 
-    def __init__(
+    def __init__(  # noqa: PLR0913
         self,
         config: DPKSmartBlindConfigEntry,
         name: str,
         session: aiohttp.ClientSession,
         states: StateMachine,
         hass: HomeAssistant,
+        solar: SolarPosition,
+        batcher: CalculationBatcher | None = None,
+        memo: CalculationMemo | None = None,
+        clear_sky: ClearSkyCurve | None = None,
     ) -> None:
         """Sample API Client."""
-        location, elevation = get_astral_location(hass)
-        self._location = location  # astral.location.Location
-        self._elevation = elevation
+        self._solar = solar
         self._hass = hass
+        self._batcher = batcher
+        self._cloud_coverage: float | None = None
 
         self._name = name
         self._config = config
+        self._calculator = WindowCalculator(
+            window_config(config.options), solar, memo=memo, clear_sky=clear_sky
+        )
         self._session = session
         self._states = states
 
-        self._last_azimuth = None
-        self._now = dt.now(ZoneInfo(self._hass.config.time_zone))
+        self._now = dt.now(solar.time_zone)
 
-        self._calc_data = {}
-        self._calc_data[ATTR_AZIMUTH] = None
-        self._calc_data[ATTR_ELEVATION] = None
-        self._calc_data[ATTR_SHADOW_LENGTH] = None
-        self._calc_data[ATTR_COVER_HEIGHT] = None
-        self._calc_data[ATTR_COVER_SETTING] = None
-        self._calc_data[ATTR_SUN_STATE] = None
-        self._calc_data[ATTR_SUN_IN_WINDOW] = None
-        self._calc_data[ATTR_MANUAL_OVERRIDE] = None
+        self._snapshot = BlindSnapshot()
+        self._previous: BlindSnapshot | None = None
 
     async def _get(self, ent: str) -> float:
         st = self._states.get(ent)
@@ -120,12 +151,12 @@ class DPKSmartBlindAPI:
             msg,
         )
 
-    async def collect_calculation_data(self) -> None:
+    async def collect_calculation_data(self) -> BlindSnapshot:
         """Collect all the necessary calculation data."""
         try:
-            await self.calc_return()
+            snapshot = await self.calc_return()
 
-            _LOGGER.debug("collect_calculation_data: %s", self._calc_data)
+            _LOGGER.debug("collect_calculation_data: %s", snapshot)
         except ValueError as exception:
             msg = f"Value error fetching information - {exception}"
             _LOGGER.exception(msg)
@@ -138,116 +169,99 @@ class DPKSmartBlindAPI:
             raise DPKSmartBlindError(
                 msg,
             ) from exception
+        return snapshot
+
+    async def async_get_data(
+        self, *, sun_out: bool = True, cloud_coverage: float | None = None
+    ) -> BlindSnapshot:
+        """Get data from the API; geometry only runs while the sun is out."""
+        self._cloud_coverage = cloud_coverage
+        if sun_out:
+            snapshot = await self.collect_calculation_data()
+        else:
+            self._now = dt.now(self._solar.time_zone)
+            snapshot = self._calculator.hold(
+                self._now, self._snapshot, self._cloud_coverage
+            )
+        self._previous = self._snapshot
+        self._snapshot = snapshot
+        return snapshot
 
-    async def async_get_data(self) -> Any:
-        """Get data from the API."""
-        await self.collect_calculation_data()
-        return self._calc_data
-
-    async def calc_return(self) -> None:
-        """Perform performance calculation."""
-        """
-            tan(angleElevation) = windowHeight / shadedArea
-            TODO: desk area is different height to cover, so might need
-            to play around with that a bit... for now, assume same height
-            meaning the blind is actually a little higher than it really is...
-            keen to see what happens with that.
-
-            fovleft = self._config.options[CONF_AZIMUTH]-FOV_LEFT
-            if attr_azimuth < fovleft:
-                early
-            elseif attr_azimuth >= fovleft and <= fovright
-                in front
-            else
-                later
-                if just moved past fovright
-                    set position to default
-            azimuth 109.7 / unknown
-            110.7 / 110.3
-        """
-
-        self._now = dt.now(ZoneInfo(self._hass.config.time_zone))
-        self._calc_data[ATTR_NOW] = self._now.isoformat()
-        _azimuth = self.azimuth
-        _elevation: float = self.elevation
-        self._calc_data[ATTR_AZIMUTH] = round(_azimuth, 1)
-        self._calc_data[ATTR_ELEVATION] = round(_elevation, 1)
-        _LOGGER.debug(
-            "Azi window-%s/min-%s/max-%s/current-%s",
-            self._config.options[CONF_AZIMUTH],
-            self.azi_min_abs,
-            self.azi_max_abs,
-            round(_azimuth, 1),
-        )
+    async def calc_return(self) -> BlindSnapshot:
+        """Perform performance calculation, batched with other blinds."""
+        if self._batcher is None:
+            return self.calculate(dt.now(self._solar.time_zone))
+        return await self._batcher.async_run(self.calculate)
 
-        self._calc_data[ATTR_SUN_STATE] = self.sun_in_window_state(
-            _azimuth, self.last_azimuth
-        )
-        self._calc_data[ATTR_SUN_IN_WINDOW] = (
-            self._calc_data[ATTR_SUN_STATE] == StateOfSunInWindow.IN_FRONT
-        )
-        self._last_azimuth = _azimuth
-
-        self._calc_data[ATTR_SHADOW_LENGTH] = round(
-            self.shadow_length(
-                float(self._config.options[CONF_HEIGHT_WIN]), _elevation
-            ),
-            1,
-        )
-        """
-        TODO: when early, then need some default calcs, such as whatever
-        the blind position is should be the cover height and associated
-        settings...
-        That comes from coordinator.async_check_cover_state_change()
-        """
-        if self._calc_data[ATTR_SUN_STATE] == StateOfSunInWindow.JUST_LEFT:
-            """Need to reset the blind to its default"""
-            self._calc_data[ATTR_COVER_HEIGHT] = (
-                self._config.options[CONF_DEFAULT_HEIGHT]
-                * self._config.options[CONF_HEIGHT_WIN]
-                / 100
-            )
-            self._calc_data[ATTR_COVER_SETTING] = self.cover_setting
-        elif self._calc_data[ATTR_SUN_STATE] == StateOfSunInWindow.IN_FRONT:
-            """Need to calc these values, but only move if > than last cover
-            setting - CONF_DELTA_POSITION"""
-            self._calc_data[ATTR_COVER_HEIGHT] = round(
-                self._config.options[CONF_DISTANCE] * tan(rad(_elevation)), 1
-            )
-            self._calc_data[ATTR_COVER_SETTING] = self.cover_setting
+    def calculate(self, now: dt) -> BlindSnapshot:
+        """Calculate at `now` from the latest snapshot; safe in the executor."""
+        self._now = now
+        return self._calculator.calculate(now, self._snapshot, self._cloud_coverage)
 
     @property
     def name(self) -> str:
         """Getter to return name."""
         return self._name
 
+    @property
+    def calculator(self) -> WindowCalculator:
+        """Getter for the Home Assistant-free calculation."""
+        return self._calculator
+
+    @property
+    def solar(self) -> SolarPosition:
+        """Getter for the shared sun position."""
+        return self._solar
+
     @property
     def azimuth(self) -> float:
         """Compute sun azimuth for current time."""
-        return astral.sun.azimuth(self._location.observer, self._now)
+        return self._solar.position(self._now)[0]
 
     @property
     def elevation(self) -> float:
         """Compute sun elevation for current time."""
-        return astral.sun.elevation(self._location.observer, self._now)
+        return self._solar.position(self._now)[1]
 
     @property
-    def azi_min_abs(self) -> int:
+    def azi_min_abs(self) -> float:
         """Calculate min azimuth."""
-        return (
-            self._config.options[CONF_AZIMUTH]
-            - self._config.options[CONF_FOV_LEFT]
-            + 360
-        ) % 360
+        return self._calculator.config.azi_min_abs
 
     @property
-    def azi_max_abs(self) -> int:
+    def azi_max_abs(self) -> float:
         """Calculate max azimuth."""
-        return (
-            self._config.options[CONF_AZIMUTH]
-            + self._config.options[CONF_FOV_RIGHT]
-            + 360
-        ) % 360
+        return self._calculator.config.azi_max_abs
+
+    @property
+    def cover_entity(self) -> str:
+        """Getter for the cover entity controlled by this blind."""
+        return self._config.options[CONF_ENTITY]
+
+    @property
+    def weather_entity(self) -> str | None:
+        """Getter for the weather entity gating this blind."""
+        return self._config.options.get(CONF_WEATHER_ENTITY)
+
+    @property
+    def irradiance_entity(self) -> str | None:
+        """Getter for the optional irradiance sensor."""
+        return self._config.options.get(CONF_IRRADIANCE_ENTITY)
+
+    @property
+    def delta_position(self) -> int:
+        """Getter for the smallest cover move worth making, %."""
+        return self._config.options[CONF_DELTA_POSITION]
+
+    @property
+    def tilt_mode(self) -> bool:
+        """Whether the cover's slats are tilted rather than the cover moved."""
+        return self._calculator.tilt_mode
+
+    @property
+    def delta_tilt(self) -> int:
+        """Getter for the smallest slat tilt change worth making, %."""
+        return self._config.options.get(CONF_DELTA_TILT, DEFAULT_DELTA_TILT)
 
     @property
     def delta_time(self) -> int:
@@ -257,38 +271,14 @@ class DPKSmartBlindAPI:
     @property
     def last_azimuth(self) -> float:
         """Calculate azimuth from last invocation."""
-        if self._last_azimuth is None:
-            local_last = dt.now(ZoneInfo(self._hass.config.time_zone))
-            local_last -= td(minutes=self.delta_time)
-            _LOGGER.debug("local_last=%s", local_last)
-            self._last_azimuth = round(
-                astral.sun.azimuth(self._location.observer, local_last), 1
-            )
-        return float(self._last_azimuth)
+        return self._calculator.last_azimuth(self._now)
 
     @property
-    def cover_setting(self) -> float:
-        """Calculate cover setting % from window and cover height."""
-        return round(
-            self._calc_data[ATTR_COVER_HEIGHT]
-            / self._config.options[CONF_HEIGHT_WIN]
-            * 100,
-            0,
-        )
+    def snapshot(self) -> BlindSnapshot:
+        """Getter for the latest calculation snapshot."""
+        return self._snapshot
 
-    def shadow_length(self, window_height: float, elevation: float) -> float:
-        """Calculate shadow length from window height and sun elevation."""
-        return window_height / tan(rad(elevation))
-
-    def sun_in_window_state(
-        self, azimuth: float, last_azimuth: float
-    ) -> StateOfSunInWindow:
-        """Calculate where sun is in relation to window field of view."""
-        ret: StateOfSunInWindow = StateOfSunInWindow.PASSED
-        if azimuth < self.azi_min_abs:
-            ret = StateOfSunInWindow.EARLY
-        elif azimuth >= self.azi_min_abs and azimuth < self.azi_max_abs:
-            ret = StateOfSunInWindow.IN_FRONT
-        elif last_azimuth < self.azi_max_abs and azimuth >= self.azi_max_abs:
-            ret = StateOfSunInWindow.JUST_LEFT
-        return ret
+    @property
+    def previous_snapshot(self) -> BlindSnapshot | None:
+        """Getter for the snapshot before the latest one."""
+        return self._previous
@@ -0,0 +1,145 @@
+"""Batched executor offload of per-tick calculations."""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import datetime
+from typing import TYPE_CHECKING, Any
+from zoneinfo import ZoneInfo
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later
+
+from .const import _LOGGER, DEFAULT_EXECUTOR_THRESHOLD, DOMAIN
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+DATA_BATCHER = f"{DOMAIN}_batcher"
+
+type _Job = tuple[Callable[[datetime], Any], asyncio.Future[Any]]
+
+
+def _run_batch(
+    jobs: list[Callable[[datetime], Any]], now: datetime
+) -> list[tuple[bool, Any]]:
+    """Run every job at the same `now`, capturing results and exceptions alike."""
+    results: list[tuple[bool, Any]] = []
+    for job in jobs:
+        try:
+            results.append((True, job(now)))
+        except Exception as exception:  # noqa: BLE001
+            results.append((False, exception))
+    return results
+
+
+class CalculationBatcher:
+    """
+    Gather calculations requested in the same loop iteration into one job.
+
+    Small batches run inline, where the executor round trip would cost more
+    than the work itself; from `threshold` jobs up the whole batch goes to the
+    executor as a single submission and every caller is woken with its result.
+    Every job in a batch is handed the same timestamp.
+
+    While setup is held, jobs accumulate until the expected number has
+    queued, so blinds set up together at boot share one first refresh.
+    """
+
+    def __init__(
+        self, hass: HomeAssistant, threshold: int = DEFAULT_EXECUTOR_THRESHOLD
+    ) -> None:
+        """Initialize."""
+        self._hass = hass
+        self._threshold = threshold
+        self._pending: list[_Job] = []
+        self._flush_handle: asyncio.Handle | None = None
+        self._hold = 0
+        self._hold_unsub: CALLBACK_TYPE | None = None
+
+    @property
+    def threshold(self) -> int:
+        """Batch size from which calculations are sent to the executor."""
+        return self._threshold
+
+    @threshold.setter
+    def threshold(self, threshold: int) -> None:
+        self._threshold = threshold
+
+    @callback
+    def async_hold(self, count: int, timeout: float) -> None:
+        """Hold flushing until `count` jobs have queued or `timeout` passes."""
+        self._async_release_hold()
+        if count < 2:  # noqa: PLR2004
+            return
+        self._hold = count
+        self._hold_unsub = async_call_later(
+            self._hass, timeout, self._async_release_hold
+        )
+
+    @callback
+    def _async_release_hold(self, _now: Any = None) -> None:
+        if self._hold_unsub is not None:
+            self._hold_unsub()
+            self._hold_unsub = None
+        if not self._hold:
+            return
+        self._hold = 0
+        if self._pending and self._flush_handle is None:
+            self._flush_handle = self._hass.loop.call_soon(self._async_flush)
+
+    async def async_run[T](self, job: Callable[[datetime], T]) -> T:
+        """Queue a calculation for the current batch and wait for its result."""
+        future: asyncio.Future[T] = self._hass.loop.create_future()
+        self._pending.append((job, future))
+        if self._hold:
+            if len(self._pending) >= self._hold:
+                self._async_release_hold()
+        elif self._flush_handle is None:
+            self._flush_handle = self._hass.loop.call_soon(self._async_flush)
+        return await future
+
+    @callback
+    def _async_flush(self) -> None:
+        self._flush_handle = None
+        batch, self._pending = self._pending, []
+        jobs = [job for job, _ in batch]
+        now = datetime.now(ZoneInfo(self._hass.config.time_zone))
+        if len(batch) < self._threshold:
+            self._deliver(batch, _run_batch(jobs, now))
+            return
+        _LOGGER.debug("offloading %d calculations to the executor", len(batch))
+        self._hass.async_add_executor_job(_run_batch, jobs, now).add_done_callback(
+            lambda done: self._deliver(batch, self._batch_results(batch, done))
+        )
+
+    @staticmethod
+    def _batch_results(
+        batch: list[_Job], done: asyncio.Future[list[tuple[bool, Any]]]
+    ) -> list[tuple[bool, Any]]:
+        """Fan a failed or cancelled executor job out to every caller."""
+        if done.cancelled():
+            return [(False, asyncio.CancelledError())] * len(batch)
+        if (exception := done.exception()) is not None:
+            return [(False, exception)] * len(batch)
+        return done.result()
+
+    @staticmethod
+    def _deliver(batch: list[_Job], results: list[tuple[bool, Any]]) -> None:
+        for (_, future), (ok, value) in zip(batch, results, strict=True):
+            if future.done():
+                continue
+            if ok:
+                future.set_result(value)
+            else:
+                future.set_exception(value)
+
+
+@callback
+def async_get_batcher(hass: HomeAssistant) -> CalculationBatcher:
+    """Return the shared calculation batcher."""
+    batcher: CalculationBatcher | None = hass.data.get(DATA_BATCHER)
+    if batcher is None:
+        batcher = CalculationBatcher(hass)
+        hass.data[DATA_BATCHER] = batcher
+    return batcher
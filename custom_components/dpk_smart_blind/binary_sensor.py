@@ -2,19 +2,19 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING
 
 from homeassistant.components.binary_sensor import (
     BinarySensorDeviceClass,
     BinarySensorEntity,
     BinarySensorEntityDescription,
 )
+from homeassistant.const import EntityCategory
 from homeassistant.core import HomeAssistant
-from homeassistant.helpers.device_registry import DeviceEntryType, DeviceInfo
+from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import (
-    _LOGGER,
     ATTR_MANUAL_OVERRIDE,
     ATTR_SUN_IN_WINDOW,
     ATTRIBUTION,
@@ -42,6 +42,8 @@ SENSOR_TYPES: tuple[BinarySensorEntityDescription, ...] = (
         name="Smart Blind Manual Override",
         icon="mdi:blinds",
         device_class=BinarySensorDeviceClass.RUNNING,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
     ),
 )
 
@@ -60,9 +62,9 @@ async def async_setup_entry(
         DPKSmartBlindBinarySensor(
             name,
             config_entry.entry_id,
-            False,
-            binary_sensor,
-            coordinator,
+            state=False,
+            binary_sensor=binary_sensor,
+            coordinator=coordinator,
         )
         for binary_sensor in SENSOR_TYPES
     ]
@@ -112,8 +114,5 @@ class DPKSmartBlindBinarySensor(
     @property
     def is_on(self) -> bool | None:
         """Return the native value of the sensor."""
-        return (
-            False
-            if self.coordinator.data.get(self._key) is None
-            else self.coordinator.data.get(self._key)
-        )
+        value = self.coordinator.data[self._key]
+        return False if value is None else value
@@ -0,0 +1,71 @@
+"""Daily sun-path chart files for dpk_smart_blind."""
+
+from __future__ import annotations
+
+import hashlib
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from homeassistant.core import HomeAssistant, callback
+
+from .const import _LOGGER, DOMAIN
+from .core.chart import SunTrackCache
+from .solar import async_get_solar
+
+if TYPE_CHECKING:
+    from datetime import date
+
+DATA_SUN_TRACK = f"{DOMAIN}_sun_track"
+
+
+@callback
+def async_get_sun_track(hass: HomeAssistant) -> SunTrackCache:
+    """Return the shared sun track, created on first use."""
+    tracks: SunTrackCache | None = hass.data.get(DATA_SUN_TRACK)
+    if tracks is None:
+        tracks = SunTrackCache(async_get_solar(hass))
+        hass.data[DATA_SUN_TRACK] = tracks
+    return tracks
+
+
+def chart_directory(hass: HomeAssistant) -> Path:
+    """Directory under `www/` the charts are written to, served at /local."""
+    return Path(hass.config.path("www", DOMAIN))
+
+
+def chart_url(name: str) -> str:
+    """URL a chart file is served at."""
+    return f"/local/{DOMAIN}/{name}"
+
+
+def write_chart(directory: Path, entry_id: str, day: date, svg: str) -> str | None:
+    """
+    Write a blind's chart under a name that changes with its content.
+
+    The name carries the day and a hash of the SVG, so a browser never shows
+    a cached chart for the wrong day or old options. Older charts for the
+    blind are removed. Returns the file name, or None if it could not be
+    written.
+    """
+    digest = hashlib.sha1(svg.encode(), usedforsecurity=False).hexdigest()[:10]
+    name = f"{entry_id}-{day.isoformat()}-{digest}.svg"
+    path = directory / name
+    try:
+        directory.mkdir(parents=True, exist_ok=True)
+        if not path.exists():
+            partial = path.with_suffix(".tmp")
+            partial.write_text(svg, encoding="utf-8")
+            partial.replace(path)
+    except OSError:
+        _LOGGER.exception("Could not write sun chart %s", path)
+        return None
+    for old in directory.glob(f"{entry_id}-*.svg"):
+        if old.name != name:
+            old.unlink(missing_ok=True)
+    return name
+
+
+def remove_charts(directory: Path, entry_id: str) -> None:
+    """Remove every chart written for a blind."""
+    for old in directory.glob(f"{entry_id}-*.svg"):
+        old.unlink(missing_ok=True)
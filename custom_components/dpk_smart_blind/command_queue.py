@@ -0,0 +1,343 @@
+"""Cover command queue for dpk_smart_blind."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.components.cover import ATTR_POSITION, ATTR_TILT_POSITION
+from homeassistant.components.cover import DOMAIN as COVER_DOMAIN
+from homeassistant.const import (
+    ATTR_ENTITY_ID,
+    SERVICE_SET_COVER_POSITION,
+    SERVICE_SET_COVER_TILT_POSITION,
+)
+from homeassistant.exceptions import HomeAssistantError
+
+from .const import (
+    _LOGGER,
+    DEFAULT_COMMAND_CONCURRENCY,
+    DEFAULT_COMMAND_SPACING,
+    DEFAULT_COMMAND_TIMEOUT,
+    DOMAIN,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from homeassistant.core import HomeAssistant
+
+DATA_COMMAND_QUEUE = f"{DOMAIN}_command_queue"
+
+
+@dataclass
+class CoverCommand:
+    """A pending service call for a single cover."""
+
+    entity_id: str
+    service: str
+    data: dict[str, Any]
+    enqueued: float = field(default_factory=time.monotonic)
+
+
+class CoverCommandGroup:
+    """
+    Serialise cover commands for covers sharing one bridge.
+
+    Pending commands are keyed on the cover entity and service, so a newer
+    target for a cover replaces the one still waiting in the queue rather
+    than queueing behind it, while a tilt and a move can both be pending.
+    At most `concurrency` commands are in flight at once, and consecutive
+    commands start at least `spacing` seconds apart.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        name: str,
+        concurrency: int = DEFAULT_COMMAND_CONCURRENCY,
+        spacing: float = DEFAULT_COMMAND_SPACING,
+        timeout: float = DEFAULT_COMMAND_TIMEOUT,
+    ) -> None:
+        """Initialize."""
+        self._hass = hass
+        self._name = name
+        self._concurrency = max(1, int(concurrency))
+        self._spacing = float(spacing)
+        self._timeout = float(timeout)
+
+        self._queue: asyncio.Queue[tuple[str, str]] = asyncio.Queue()
+        self._pending: dict[tuple[str, str], CoverCommand] = {}
+        self._workers: list[asyncio.Task] = []
+        self._busy: set[asyncio.Task] = set()
+        self._slot_lock = asyncio.Lock()
+        self._next_slot = 0.0
+
+        self._sent = 0
+        self._coalesced = 0
+        self._failed = 0
+        self._timeouts = 0
+        self._latency_last: float | None = None
+        self._latency_max = 0.0
+        self._latency_total = 0.0
+
+    @property
+    def name(self) -> str:
+        """Getter to return group name."""
+        return self._name
+
+    @property
+    def depth(self) -> int:
+        """Number of commands waiting to be sent."""
+        return len(self._pending)
+
+    @property
+    def stats(self) -> dict[str, Any]:
+        """Queue depth and latency statistics."""
+        completed = self._sent + self._failed + self._timeouts
+        return {
+            "group": self._name,
+            "depth": self.depth,
+            "sent": self._sent,
+            "coalesced": self._coalesced,
+            "failed": self._failed,
+            "timeouts": self._timeouts,
+            "latency_last": None
+            if self._latency_last is None
+            else round(self._latency_last, 3),
+            "latency_avg": round(self._latency_total / completed, 3)
+            if completed
+            else None,
+            "latency_max": round(self._latency_max, 3),
+        }
+
+    def configure(self, concurrency: int, spacing: float, timeout: float) -> None:
+        """Apply new limits; takes effect for the next command sent."""
+        self._spacing = float(spacing)
+        self._timeout = float(timeout)
+        concurrency = max(1, int(concurrency))
+        if concurrency != self._concurrency:
+            self._concurrency = concurrency
+            if self._workers:
+                self._resize()
+
+    def start(self) -> None:
+        """Start the worker tasks."""
+        if self._workers:
+            return
+        self._resize()
+
+    def _resize(self) -> None:
+        """
+        Match the workers to the concurrency.
+
+        Surplus workers that are idle are cancelled; one with a command in
+        hand is dropped from the list and exits once that command is sent.
+        """
+        while len(self._workers) < self._concurrency:
+            self._workers.append(
+                self._hass.async_create_background_task(
+                    self._worker(),
+                    f"{DOMAIN} command queue {self._name} #{len(self._workers)}",
+                )
+            )
+        for worker in self._workers[self._concurrency :]:
+            if worker not in self._busy:
+                worker.cancel()
+        del self._workers[self._concurrency :]
+
+    def stop(self) -> None:
+        """Cancel the worker tasks; pending commands are kept."""
+        for worker in self._workers:
+            worker.cancel()
+        self._workers = []
+
+    def async_set_position(self, entity_id: str, position: int) -> None:
+        """Queue a set_cover_position call, replacing any pending target."""
+        self.async_enqueue(
+            CoverCommand(
+                entity_id,
+                SERVICE_SET_COVER_POSITION,
+                {ATTR_ENTITY_ID: entity_id, ATTR_POSITION: position},
+            )
+        )
+
+    def async_set_tilt_position(self, entity_id: str, tilt_position: int) -> None:
+        """Queue a set_cover_tilt_position call, replacing any pending tilt."""
+        self.async_enqueue(
+            CoverCommand(
+                entity_id,
+                SERVICE_SET_COVER_TILT_POSITION,
+                {ATTR_ENTITY_ID: entity_id, ATTR_TILT_POSITION: tilt_position},
+            )
+        )
+
+    def async_enqueue(self, command: CoverCommand) -> None:
+        """Queue a command, coalescing with a pending one for the same cover."""
+        key = (command.entity_id, command.service)
+        pending = self._pending.get(key)
+        if pending is not None:
+            """Keep the original enqueue time so latency stays honest."""
+            command.enqueued = pending.enqueued
+            self._pending[key] = command
+            self._coalesced += 1
+            _LOGGER.debug(
+                "%s: coalesced %s %s", self._name, command.entity_id, command.data
+            )
+            return
+        self._pending[key] = command
+        self._queue.put_nowait(key)
+
+    def async_cancel(self, entity_id: str) -> None:
+        """Drop any pending commands for a cover."""
+        for key in [key for key in self._pending if key[0] == entity_id]:
+            del self._pending[key]
+
+    async def _wait_for_slot(self) -> None:
+        """Enforce the minimum spacing between command starts."""
+        async with self._slot_lock:
+            delay = self._next_slot - time.monotonic()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            self._next_slot = time.monotonic() + self._spacing
+
+    async def _worker(self) -> None:
+        task = asyncio.current_task()
+        while True:
+            key = await self._queue.get()
+            self._busy.add(task)
+            try:
+                await self._take(key)
+            finally:
+                self._busy.discard(task)
+                self._queue.task_done()
+            if task not in self._workers:
+                return
+
+    async def _take(self, key: tuple[str, str]) -> None:
+        if key not in self._pending:
+            return
+        await self._wait_for_slot()
+        command = self._pending.pop(key, None)
+        if command is not None:
+            await self._send(command)
+
+    async def _send(self, command: CoverCommand) -> None:
+        _LOGGER.debug("%s: sending %s %s", self._name, command.service, command.data)
+        try:
+            async with asyncio.timeout(self._timeout):
+                await self._hass.services.async_call(
+                    COVER_DOMAIN, command.service, command.data, blocking=True
+                )
+        except TimeoutError:
+            self._timeouts += 1
+            _LOGGER.warning(
+                "%s: %s timed out after %ss",
+                self._name,
+                command.entity_id,
+                self._timeout,
+            )
+        except HomeAssistantError as exception:
+            self._failed += 1
+            _LOGGER.warning(
+                "%s: %s failed - %s", self._name, command.entity_id, exception
+            )
+        except Exception:  # noqa: BLE001
+            """Anything else is a bug in the cover; keep the worker alive."""
+            self._failed += 1
+            _LOGGER.exception("%s: %s failed", self._name, command.entity_id)
+        else:
+            self._sent += 1
+        latency = time.monotonic() - command.enqueued
+        self._latency_last = latency
+        self._latency_total += latency
+        self._latency_max = max(self._latency_max, latency)
+
+
+@dataclass(frozen=True, slots=True)
+class CommandLimits:
+    """One entry's concurrency, spacing and timeout for its command group."""
+
+    concurrency: int = DEFAULT_COMMAND_CONCURRENCY
+    spacing: float = DEFAULT_COMMAND_SPACING
+    timeout: float = DEFAULT_COMMAND_TIMEOUT
+
+    @classmethod
+    def combine(cls, limits: Iterable[CommandLimits]) -> CommandLimits:
+        """Most conservative of several entries' limits."""
+        limits = list(limits)
+        return cls(
+            concurrency=min(limit.concurrency for limit in limits),
+            spacing=max(limit.spacing for limit in limits),
+            timeout=max(limit.timeout for limit in limits),
+        )
+
+
+class CoverCommandQueue:
+    """
+    Domain-wide registry of cover command groups.
+
+    Every entry using a group states its own limits, and the group runs with
+    the most conservative of them: the fewest concurrent commands, the widest
+    spacing and the longest timeout. They are worked out again whenever an
+    entry joins or leaves, so the result does not depend on load order.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize."""
+        self._hass = hass
+        self._groups: dict[str, CoverCommandGroup] = {}
+        self._limits: dict[str, dict[str, CommandLimits]] = {}
+
+    def async_get_group(
+        self,
+        entry_id: str,
+        name: str,
+        concurrency: int = DEFAULT_COMMAND_CONCURRENCY,
+        spacing: float = DEFAULT_COMMAND_SPACING,
+        timeout: float = DEFAULT_COMMAND_TIMEOUT,
+    ) -> CoverCommandGroup:
+        """Return the named group, creating and starting it if needed."""
+        users = self._limits.setdefault(name, {})
+        users[entry_id] = CommandLimits(concurrency, spacing, timeout)
+        limits = CommandLimits.combine(users.values())
+        group = self._groups.get(name)
+        if group is None:
+            group = CoverCommandGroup(
+                self._hass, name, limits.concurrency, limits.spacing, limits.timeout
+            )
+            self._groups[name] = group
+            group.start()
+        else:
+            group.configure(limits.concurrency, limits.spacing, limits.timeout)
+        return group
+
+    def async_release(self, entry_id: str) -> None:
+        """Release an entry's group; stop groups no longer in use."""
+        for name in [n for n, users in self._limits.items() if entry_id in users]:
+            users = self._limits[name]
+            del users[entry_id]
+            if not users:
+                self._groups.pop(name).stop()
+                del self._limits[name]
+                continue
+            limits = CommandLimits.combine(users.values())
+            self._groups[name].configure(
+                limits.concurrency, limits.spacing, limits.timeout
+            )
+
+    @property
+    def stats(self) -> dict[str, dict[str, Any]]:
+        """Statistics for every group."""
+        return {name: group.stats for name, group in self._groups.items()}
+
+
+def async_get_command_queue(hass: HomeAssistant) -> CoverCommandQueue:
+    """Return the shared cover command queue."""
+    queue: CoverCommandQueue | None = hass.data.get(DATA_COMMAND_QUEUE)
+    if queue is None:
+        queue = CoverCommandQueue(hass)
+        hass.data[DATA_COMMAND_QUEUE] = queue
+    return queue
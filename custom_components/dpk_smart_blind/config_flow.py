@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+from datetime import date
 from typing import Any
+from zoneinfo import ZoneInfo
 
 import voluptuous as vol
 from homeassistant.config_entries import (
@@ -13,26 +15,80 @@ from homeassistant.config_entries import (
 )
 
 # https://github.com/home-assistant/core/blob/master/homeassistant/const.py
-from homeassistant.const import CONF_NAME, DEGREE, PERCENTAGE, UnitOfLength, UnitOfTime
+from homeassistant.const import (
+    CONF_NAME,
+    DEGREE,
+    PERCENTAGE,
+    UnitOfIrradiance,
+    UnitOfLength,
+    UnitOfTime,
+)
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers import selector
+from homeassistant.helpers.sun import get_astral_location
+from homeassistant.util import dt as dt_util
 
 from .const import (
     _LOGGER,
     CONF_AZIMUTH,
+    CONF_CLOUD_ENTER,
+    CONF_CLOUD_EXIT,
+    CONF_COMMAND_CONCURRENCY,
+    CONF_COMMAND_GROUP,
+    CONF_COMMAND_SPACING,
+    CONF_COMMAND_TIMEOUT,
     CONF_DEFAULT_HEIGHT,
     CONF_DELTA_POSITION,
+    CONF_DELTA_TILT,
     CONF_DELTA_TIME,
     CONF_DISTANCE,
     CONF_ENTITY,
+    CONF_EXECUTOR_THRESHOLD,
     CONF_FOV_LEFT,
     CONF_FOV_RIGHT,
     CONF_HEIGHT_WIN,
+    CONF_IRRADIANCE_ENTER,
+    CONF_IRRADIANCE_ENTITY,
+    CONF_IRRADIANCE_EXIT,
+    CONF_SLAT_SPACING,
+    CONF_SLAT_WIDTH,
+    CONF_SUN_HIDDEN_DWELL,
+    CONF_SUN_OUT_DWELL,
+    CONF_SUN_POSITION_ENTITY,
+    CONF_TICK_LOG,
+    CONF_TILT_MODE,
     CONF_WEATHER_ENTITY,
+    CONF_WEATHER_SMOOTHING,
     CONF_WEATHER_STATE,
+    CONF_ZONE_DISTANCE,
+    CONF_ZONE_HEIGHT,
+    CONF_ZONE_NAME,
+    CONF_ZONES,
     CONFIG_FLOW_VERSION,
+    DEFAULT_CLOUD_ENTER,
+    DEFAULT_CLOUD_EXIT,
+    DEFAULT_COMMAND_CONCURRENCY,
+    DEFAULT_COMMAND_SPACING,
+    DEFAULT_COMMAND_TIMEOUT,
+    DEFAULT_DELTA_TILT,
+    DEFAULT_EXECUTOR_THRESHOLD,
+    DEFAULT_IRRADIANCE_ENTER,
+    DEFAULT_IRRADIANCE_EXIT,
+    DEFAULT_SLAT_SPACING,
+    DEFAULT_SLAT_WIDTH,
+    DEFAULT_SUN_HIDDEN_DWELL,
+    DEFAULT_SUN_OUT_DWELL,
+    DEFAULT_WEATHER_SMOOTHING,
     DOMAIN,
 )
+from .preview import cover_curve, preview_placeholders, solar_track
+from .settings import async_get_settings
+
+PREVIEW_DATE = "preview_date"
+PREVIEW_ACTION = "preview_action"
+PREVIEW_ACCEPT = "accept"
+PREVIEW_UPDATE = "update"
+PREVIEW_EDIT = "edit"
 
 CONFIG_SCHEMA = vol.Schema(
     {
@@ -112,9 +168,46 @@ WINDOW_OPTIONS = vol.Schema(
                 unit_of_measurement=PERCENTAGE,
             )
         ),
+        vol.Required(CONF_TILT_MODE, default=False): selector.BooleanSelector(),
+        vol.Required(CONF_SLAT_WIDTH, default=DEFAULT_SLAT_WIDTH): (
+            selector.NumberSelector(
+                selector.NumberSelectorConfig(
+                    min=5,
+                    max=150,
+                    step=1,
+                    mode=selector.NumberSelectorMode.BOX,
+                    unit_of_measurement=UnitOfLength.MILLIMETERS,
+                )
+            )
+        ),
+        vol.Required(CONF_SLAT_SPACING, default=DEFAULT_SLAT_SPACING): (
+            selector.NumberSelector(
+                selector.NumberSelectorConfig(
+                    min=5,
+                    max=150,
+                    step=1,
+                    mode=selector.NumberSelectorMode.BOX,
+                    unit_of_measurement=UnitOfLength.MILLIMETERS,
+                )
+            )
+        ),
+        vol.Optional(CONF_ZONES): selector.ObjectSelector(),
     }
 ).extend(OPTIONS.schema)
 
+"""Entered as YAML, so checked by hand once the form is submitted."""
+ZONE_SCHEMA = vol.Schema(
+    [
+        {
+            vol.Optional(CONF_ZONE_NAME): str,
+            vol.Required(CONF_ZONE_DISTANCE): vol.All(
+                vol.Coerce(float), vol.Range(min=0)
+            ),
+            vol.Optional(CONF_ZONE_HEIGHT, default=0): vol.Coerce(float),
+        }
+    ]
+)
+
 CLIMATE_OPTIONS = vol.Schema(
     {
         vol.Required(
@@ -148,6 +241,86 @@ CLIMATE_OPTIONS = vol.Schema(
                 ],
             )
         ),
+        vol.Required(CONF_CLOUD_ENTER, default=DEFAULT_CLOUD_ENTER): (
+            selector.NumberSelector(
+                selector.NumberSelectorConfig(
+                    min=0,
+                    max=100,
+                    step=1,
+                    mode=selector.NumberSelectorMode.SLIDER,
+                    unit_of_measurement=PERCENTAGE,
+                )
+            )
+        ),
+        vol.Required(CONF_CLOUD_EXIT, default=DEFAULT_CLOUD_EXIT): (
+            selector.NumberSelector(
+                selector.NumberSelectorConfig(
+                    min=0,
+                    max=100,
+                    step=1,
+                    mode=selector.NumberSelectorMode.SLIDER,
+                    unit_of_measurement=PERCENTAGE,
+                )
+            )
+        ),
+        vol.Optional(CONF_IRRADIANCE_ENTITY): selector.EntitySelector(
+            selector.EntitySelectorConfig(domain="sensor", device_class="irradiance")
+        ),
+        vol.Required(CONF_IRRADIANCE_ENTER, default=DEFAULT_IRRADIANCE_ENTER): (
+            selector.NumberSelector(
+                selector.NumberSelectorConfig(
+                    min=0,
+                    max=1200,
+                    step=10,
+                    mode=selector.NumberSelectorMode.BOX,
+                    unit_of_measurement=UnitOfIrradiance.WATTS_PER_SQUARE_METER,
+                )
+            )
+        ),
+        vol.Required(CONF_IRRADIANCE_EXIT, default=DEFAULT_IRRADIANCE_EXIT): (
+            selector.NumberSelector(
+                selector.NumberSelectorConfig(
+                    min=0,
+                    max=1200,
+                    step=10,
+                    mode=selector.NumberSelectorMode.BOX,
+                    unit_of_measurement=UnitOfIrradiance.WATTS_PER_SQUARE_METER,
+                )
+            )
+        ),
+        vol.Required(CONF_WEATHER_SMOOTHING, default=DEFAULT_WEATHER_SMOOTHING): (
+            selector.NumberSelector(
+                selector.NumberSelectorConfig(
+                    min=0,
+                    max=120,
+                    step=1,
+                    mode=selector.NumberSelectorMode.BOX,
+                    unit_of_measurement=UnitOfTime.MINUTES,
+                )
+            )
+        ),
+        vol.Required(CONF_SUN_OUT_DWELL, default=DEFAULT_SUN_OUT_DWELL): (
+            selector.NumberSelector(
+                selector.NumberSelectorConfig(
+                    min=0,
+                    max=120,
+                    step=1,
+                    mode=selector.NumberSelectorMode.BOX,
+                    unit_of_measurement=UnitOfTime.MINUTES,
+                )
+            )
+        ),
+        vol.Required(CONF_SUN_HIDDEN_DWELL, default=DEFAULT_SUN_HIDDEN_DWELL): (
+            selector.NumberSelector(
+                selector.NumberSelectorConfig(
+                    min=0,
+                    max=120,
+                    step=1,
+                    mode=selector.NumberSelectorMode.BOX,
+                    unit_of_measurement=UnitOfTime.MINUTES,
+                )
+            )
+        ),
     }
 )
 
@@ -162,6 +335,17 @@ AUTOMATION_OPTIONS = vol.Schema(
                 unit_of_measurement=PERCENTAGE,
             )
         ),
+        vol.Required(CONF_DELTA_TILT, default=DEFAULT_DELTA_TILT): (
+            selector.NumberSelector(
+                selector.NumberSelectorConfig(
+                    min=1,
+                    max=50,
+                    step=1,
+                    mode=selector.NumberSelectorMode.SLIDER,
+                    unit_of_measurement=PERCENTAGE,
+                )
+            )
+        ),
         vol.Required(CONF_DELTA_TIME, default=2): selector.NumberSelector(
             selector.NumberSelectorConfig(
                 min=1,
@@ -169,10 +353,96 @@ AUTOMATION_OPTIONS = vol.Schema(
                 unit_of_measurement=UnitOfTime.MINUTES,
             )
         ),
+        vol.Optional(CONF_COMMAND_GROUP): selector.TextSelector(),
+        vol.Required(
+            CONF_COMMAND_CONCURRENCY, default=DEFAULT_COMMAND_CONCURRENCY
+        ): selector.NumberSelector(
+            selector.NumberSelectorConfig(
+                min=1,
+                max=10,
+                step=1,
+                mode=selector.NumberSelectorMode.BOX,
+            )
+        ),
+        vol.Required(
+            CONF_COMMAND_SPACING, default=DEFAULT_COMMAND_SPACING
+        ): selector.NumberSelector(
+            selector.NumberSelectorConfig(
+                min=0,
+                max=30,
+                step=0.1,
+                mode=selector.NumberSelectorMode.BOX,
+                unit_of_measurement=UnitOfTime.SECONDS,
+            )
+        ),
+        vol.Required(
+            CONF_COMMAND_TIMEOUT, default=DEFAULT_COMMAND_TIMEOUT
+        ): selector.NumberSelector(
+            selector.NumberSelectorConfig(
+                min=1,
+                max=300,
+                step=1,
+                mode=selector.NumberSelectorMode.BOX,
+                unit_of_measurement=UnitOfTime.SECONDS,
+            )
+        ),
+        vol.Required(CONF_TICK_LOG, default=False): selector.BooleanSelector(),
+    }
+)
+
+# Shared by every blind; stored once for the domain, not in the entry.
+SHARED_OPTIONS = vol.Schema(
+    {
+        vol.Required(
+            CONF_EXECUTOR_THRESHOLD, default=DEFAULT_EXECUTOR_THRESHOLD
+        ): selector.NumberSelector(
+            selector.NumberSelectorConfig(
+                min=1,
+                max=100,
+                step=1,
+                mode=selector.NumberSelectorMode.BOX,
+            )
+        ),
+        vol.Required(
+            CONF_SUN_POSITION_ENTITY, default=False
+        ): selector.BooleanSelector(),
+    }
+)
+
+
+PREVIEW_OPTIONS = vol.Schema(
+    {
+        vol.Optional(PREVIEW_DATE): selector.DateSelector(),
+        vol.Required(PREVIEW_ACTION, default=PREVIEW_ACCEPT): selector.SelectSelector(
+            selector.SelectSelectorConfig(
+                options=[
+                    selector.SelectOptionDict(
+                        value=PREVIEW_ACCEPT, label="Keep these settings"
+                    ),
+                    selector.SelectOptionDict(
+                        value=PREVIEW_UPDATE, label="Preview the chosen date"
+                    ),
+                    selector.SelectOptionDict(
+                        value=PREVIEW_EDIT, label="Change window settings"
+                    ),
+                ],
+                mode=selector.SelectSelectorMode.LIST,
+            )
+        ),
     }
 )
 
 
+def validate_zones(user_input: dict[str, Any], errors: dict[str, str]) -> bool:
+    """Normalise the protected zones in `user_input`; False if they are invalid."""
+    try:
+        user_input[CONF_ZONES] = ZONE_SCHEMA(user_input.get(CONF_ZONES) or [])
+    except vol.Invalid:
+        errors[CONF_ZONES] = "invalid_zones"
+        return False
+    return True
+
+
 @callback
 def configured_instances(hass: HomeAssistant) -> set[str | None]:
     """Return a set of configured instances."""
@@ -225,13 +495,17 @@ class ConfigFlowHandler(ConfigFlow, domain=DOMAIN):
         self, user_input: dict[str, Any] | None = None
     ) -> ConfigFlowResult:
         """Show basic config for window with vertical blind."""
-        if user_input is not None:
+        errors: dict[str, str] = {}
+        if user_input is not None and validate_zones(user_input, errors):
             self.config.update(user_input)
             return await self.async_step_climate()
 
         return self.async_show_form(
             step_id="window",
-            data_schema=WINDOW_OPTIONS,
+            data_schema=self.add_suggested_values_to_schema(
+                WINDOW_OPTIONS, user_input or {}
+            ),
+            errors=errors,
         )
 
     async def async_step_climate(
@@ -266,16 +540,34 @@ class ConfigFlowHandler(ConfigFlow, domain=DOMAIN):
             },
             options={
                 CONF_AZIMUTH: self.config.get(CONF_AZIMUTH),
+                CONF_CLOUD_ENTER: self.config.get(CONF_CLOUD_ENTER),
+                CONF_CLOUD_EXIT: self.config.get(CONF_CLOUD_EXIT),
+                CONF_COMMAND_CONCURRENCY: self.config.get(CONF_COMMAND_CONCURRENCY),
+                CONF_COMMAND_GROUP: self.config.get(CONF_COMMAND_GROUP),
+                CONF_COMMAND_SPACING: self.config.get(CONF_COMMAND_SPACING),
+                CONF_COMMAND_TIMEOUT: self.config.get(CONF_COMMAND_TIMEOUT),
                 CONF_DEFAULT_HEIGHT: self.config.get(CONF_DEFAULT_HEIGHT),
                 CONF_DELTA_POSITION: self.config.get(CONF_DELTA_POSITION),
+                CONF_DELTA_TILT: self.config.get(CONF_DELTA_TILT),
                 CONF_DELTA_TIME: self.config.get(CONF_DELTA_TIME),
                 CONF_DISTANCE: self.config.get(CONF_DISTANCE),
                 CONF_ENTITY: self.config.get(CONF_ENTITY),
                 CONF_FOV_LEFT: self.config.get(CONF_FOV_LEFT),
                 CONF_FOV_RIGHT: self.config.get(CONF_FOV_RIGHT),
                 CONF_HEIGHT_WIN: self.config.get(CONF_HEIGHT_WIN),
+                CONF_IRRADIANCE_ENTER: self.config.get(CONF_IRRADIANCE_ENTER),
+                CONF_IRRADIANCE_ENTITY: self.config.get(CONF_IRRADIANCE_ENTITY),
+                CONF_IRRADIANCE_EXIT: self.config.get(CONF_IRRADIANCE_EXIT),
+                CONF_SLAT_SPACING: self.config.get(CONF_SLAT_SPACING),
+                CONF_SLAT_WIDTH: self.config.get(CONF_SLAT_WIDTH),
+                CONF_SUN_HIDDEN_DWELL: self.config.get(CONF_SUN_HIDDEN_DWELL),
+                CONF_SUN_OUT_DWELL: self.config.get(CONF_SUN_OUT_DWELL),
+                CONF_TICK_LOG: self.config.get(CONF_TICK_LOG),
+                CONF_TILT_MODE: self.config.get(CONF_TILT_MODE),
                 CONF_WEATHER_ENTITY: self.config.get(CONF_WEATHER_ENTITY),
+                CONF_WEATHER_SMOOTHING: self.config.get(CONF_WEATHER_SMOOTHING),
                 CONF_WEATHER_STATE: self.config.get(CONF_WEATHER_STATE),
+                CONF_ZONES: self.config.get(CONF_ZONES),
             },
         )
 
@@ -288,6 +580,7 @@ class OptionsFlowHandler(OptionsFlow):
         self.config_entry = config_entry
         self.current_config: dict = dict(config_entry.data)
         self.options = dict(config_entry.options)
+        self.preview_date: date | None = None
         _LOGGER.debug("options=%s", self.options)
 
     async def async_step_init(
@@ -295,7 +588,7 @@ class OptionsFlowHandler(OptionsFlow):
         user_input: dict[str, Any] | None = None,  # noqa: ARG002
     ) -> ConfigFlowResult:
         """Manage the options."""
-        options = ["blind", "climate", "automation"]
+        options = ["blind", "climate", "automation", "shared"]
         """
         if self.options[CONF_CLIMATE_MODE]:
             options.append("climate")
@@ -320,14 +613,45 @@ class OptionsFlowHandler(OptionsFlow):
     ) -> ConfigFlowResult:
         """Show basic config for a window with vertical blinds."""
         schema = WINDOW_OPTIONS
-        if user_input is not None:
+        errors: dict[str, str] = {}
+        if user_input is not None and validate_zones(user_input, errors):
             self.options.update(user_input)
-            return await self.async_step_climate()
+            return await self.async_step_preview()
         return self.async_show_form(
             step_id="window",
             data_schema=self.add_suggested_values_to_schema(
                 schema, user_input or self.options
             ),
+            errors=errors,
+        )
+
+    async def async_step_preview(
+        self, user_input: dict[str, Any] | None = None
+    ) -> ConfigFlowResult:
+        """Preview the day's cover curve for the window settings just entered."""
+        if user_input is not None:
+            action = user_input.get(PREVIEW_ACTION, PREVIEW_ACCEPT)
+            if action == PREVIEW_EDIT:
+                return await self.async_step_window()
+            if action == PREVIEW_ACCEPT:
+                return await self.async_step_climate()
+            if user_input.get(PREVIEW_DATE):
+                self.preview_date = date.fromisoformat(user_input[PREVIEW_DATE])
+
+        tz = ZoneInfo(self.hass.config.time_zone)
+        location, _ = get_astral_location(self.hass)
+        track = solar_track(
+            location.observer, self.preview_date or dt_util.now(tz).date(), tz
+        )
+        return self.async_show_form(
+            step_id="preview",
+            data_schema=self.add_suggested_values_to_schema(
+                PREVIEW_OPTIONS,
+                {PREVIEW_DATE: track.times[0].date().isoformat()},
+            ),
+            description_placeholders=preview_placeholders(
+                cover_curve(self.options, track, location.observer)
+            ),
         )
 
     async def async_step_climate(
@@ -337,6 +661,7 @@ class OptionsFlowHandler(OptionsFlow):
         if user_input is not None:
             entities = [
                 CONF_WEATHER_ENTITY,
+                CONF_IRRADIANCE_ENTITY,
             ]
             self.optional_entities(entities, user_input)
             self.options.update(user_input)
@@ -353,6 +678,7 @@ class OptionsFlowHandler(OptionsFlow):
     ) -> ConfigFlowResult:
         """Manage automation options."""
         if user_input is not None:
+            self.optional_entities([CONF_COMMAND_GROUP], user_input)
             self.options.update(user_input)
             return await self._update_options()
         return self.async_show_form(
@@ -362,6 +688,21 @@ class OptionsFlowHandler(OptionsFlow):
             ),
         )
 
+    async def async_step_shared(
+        self, user_input: dict[str, Any] | None = None
+    ) -> ConfigFlowResult:
+        """Manage the settings shared by every blind."""
+        settings = async_get_settings(self.hass)
+        if user_input is not None:
+            await settings.async_update(user_input)
+            return await self._update_options()
+        return self.async_show_form(
+            step_id="shared",
+            data_schema=self.add_suggested_values_to_schema(
+                SHARED_OPTIONS, settings.data
+            ),
+        )
+
     async def _update_options(self) -> ConfigFlowResult:
         """Update config entry options."""
         return self.async_create_entry(title="", data=self.options)
@@ -1,8 +1,24 @@
 """Constants for dpk_smart_blind."""
 
-from enum import StrEnum
 from logging import Logger, getLogger
 
+from .core.const import (  # noqa: F401 re-exported for the integration
+    ATTR_AZIMUTH,
+    ATTR_COVER_HEIGHT,
+    ATTR_COVER_SETTING,
+    ATTR_COVER_TILT,
+    ATTR_ELEVATION,
+    ATTR_GLAZING_IRRADIANCE,
+    ATTR_MANUAL_OVERRIDE,
+    ATTR_NOW,
+    ATTR_SHADOW_LENGTH,
+    ATTR_SUN_IN_WINDOW,
+    ATTR_SUN_OUT,
+    ATTR_SUN_STATE,
+    CalcField,
+    StateOfSunInWindow,
+)
+
 LOGGER: Logger = getLogger(__package__)
 _LOGGER: Logger = getLogger(__name__)
 
@@ -12,39 +28,73 @@ ATTRIBUTION = "Data provided by the sun"
 MANUFACTURER = "DPK"
 CONFIG_FLOW_VERSION = 1
 
+SIGNAL_SUN_POSITION = f"{DOMAIN}_sun_position"
+SUN_ENTITY = "sun.sun"
+SIGNAL_ANALYTICS = f"{DOMAIN}_analytics_{{}}"
+
 DEFAULT_RETRY = 60
+DEFAULT_COMMAND_CONCURRENCY = 1
+DEFAULT_COMMAND_SPACING = 1.0
+DEFAULT_COMMAND_TIMEOUT = 30
+DEFAULT_CLOUD_ENTER = 40
+DEFAULT_CLOUD_EXIT = 70
+DEFAULT_IRRADIANCE_ENTER = 250
+DEFAULT_IRRADIANCE_EXIT = 120
+DEFAULT_WEATHER_SMOOTHING = 10
+DEFAULT_SUN_OUT_DWELL = 15
+DEFAULT_SUN_HIDDEN_DWELL = 10
+DEFAULT_EXECUTOR_THRESHOLD = 4
+DEFAULT_ANALYTICS_DAYS = 14
+DEFAULT_SLAT_WIDTH = 25
+DEFAULT_SLAT_SPACING = 21
+DEFAULT_DELTA_TILT = 5
 
 # entities for data
 CONF_AZIMUTH = "set_azimuth"
+CONF_CLOUD_ENTER = "cloud_enter"
+CONF_CLOUD_EXIT = "cloud_exit"
+CONF_COMMAND_CONCURRENCY = "command_concurrency"
+CONF_COMMAND_GROUP = "command_group"
+CONF_COMMAND_SPACING = "command_spacing"
+CONF_COMMAND_TIMEOUT = "command_timeout"
 CONF_DEFAULT_HEIGHT = "default_percentage"
 CONF_DELTA_POSITION = "delta_position"
+CONF_DELTA_TILT = "delta_tilt"
 CONF_DELTA_TIME = "delta_time"
 CONF_DISTANCE = "distance_shaded_area"
 CONF_ENTITY = "cover"
+CONF_EXECUTOR_THRESHOLD = "executor_threshold"
 CONF_FOV_LEFT = "fov_left"
 CONF_FOV_RIGHT = "fov_right"
 CONF_HEIGHT_WIN = "window_height"
+CONF_IRRADIANCE_ENTER = "irradiance_enter"
+CONF_IRRADIANCE_ENTITY = "irradiance_entity"
+CONF_IRRADIANCE_EXIT = "irradiance_exit"
 CONF_MAX_ELEVATION = "max_elevation"
 CONF_MIN_ELEVATION = "min_elevation"
+CONF_SLAT_SPACING = "slat_spacing"
+CONF_SLAT_WIDTH = "slat_width"
+CONF_SUN_HIDDEN_DWELL = "sun_hidden_dwell"
+CONF_SUN_OUT_DWELL = "sun_out_dwell"
+CONF_SUN_POSITION_ENTITY = "sun_position_from_entity"
+CONF_TICK_LOG = "tick_log"
+CONF_TILT_MODE = "tilt_mode"
 CONF_WEATHER_ENTITY = "weather_entity"
+CONF_WEATHER_SMOOTHING = "weather_smoothing"
 CONF_WEATHER_STATE = "weather_state"
+CONF_ZONES = "protected_zones"
+CONF_ZONE_DISTANCE = "distance"
+CONF_ZONE_HEIGHT = "height"
+CONF_ZONE_NAME = "name"
 
 
-ATTR_AZIMUTH = "azimuth"
-ATTR_ELEVATION = "elevation"
-ATTR_SHADOW_LENGTH = "calc_shadow_length"
-ATTR_COVER_HEIGHT = "calc_cover_height"
-ATTR_NOW = "utc_now"
-ATTR_COVER_SETTING = "cover_setting"
-ATTR_SUN_STATE = "sun_state"
-ATTR_SUN_IN_WINDOW = "sun_in_window"
-ATTR_MANUAL_OVERRIDE = "manual_override"
-
-
-class StateOfSunInWindow(StrEnum):
-    """Solar location w.r.t. window."""
-
-    EARLY = "early"
-    IN_FRONT = "in_front"
-    JUST_LEFT = "just_left"
-    PASSED = "passed"
+ATTR_COMMAND_QUEUE = "command_queue"
+ATTR_CLOUD_COVERAGE = "smoothed_cloud_coverage"
+ATTR_IRRADIANCE = "smoothed_irradiance"
+ATTR_SUN_IN_WINDOW_TODAY = "sun_in_window_today"
+ATTR_MOVES_TODAY = "moves_today"
+ATTR_OVERRIDES_TODAY = "overrides_today"
+ATTR_POSITION_MINUTES = "position_minutes"
+ATTR_HISTORY = "history"
+ATTR_TRAVEL_TIME = "travel_seconds_per_percent"
+ATTR_CHART_URL = "chart_url"
@@ -2,88 +2,293 @@
 
 from __future__ import annotations
 
+import time
 from datetime import datetime as dt
-from datetime import timedelta as td
 from typing import TYPE_CHECKING, Any
 from zoneinfo import ZoneInfo
 
-from homeassistant.core import CALLBACK_TYPE, callback
+from homeassistant.components.cover import (
+    ATTR_CURRENT_POSITION,
+    ATTR_CURRENT_TILT_POSITION,
+)
+from homeassistant.const import STATE_CLOSING, STATE_OPENING
+from homeassistant.core import callback
 from homeassistant.exceptions import ConfigEntryAuthFailed
-from homeassistant.helpers.event import async_track_point_in_time
+from homeassistant.helpers.dispatcher import async_dispatcher_send
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
+from .analytics import async_get_analytics_store
 from .api import (
     DPKSmartBlindAPI,
     DPKSmartBlindAuthenticationError,
     DPKSmartBlindError,
 )
-from .const import _LOGGER, DOMAIN, LOGGER
-from .data import StateChangedData
+from .const import (
+    _LOGGER,
+    DOMAIN,
+    LOGGER,
+    SIGNAL_ANALYTICS,
+    SUN_ENTITY,
+)
+from .core.decision import CoverPolicy
+from .core.travel import TravelEstimator
+from .data import BlindSnapshot, StateChangedData
+from .lifecycle import EntryLifecycle
+from .scheduler import async_get_tick_scheduler
+from .tick_log import async_get_tick_log_writer
 
 if TYPE_CHECKING:
-    from homeassistant.core import Event, EventStateChangedData, HomeAssistant
+    from homeassistant.core import Event, EventStateChangedData, HomeAssistant, State
 
+    from .analytics import BlindAnalytics
+    from .command_queue import CoverCommandGroup
     from .data import DPKSmartBlindConfigEntry
+    from .sun_filter import SunOutFilter
+    from .tick_log import TickLog
 
 
 # https://developers.home-assistant.io/docs/integration_fetching_data#coordinated-single-api-poll-for-data-for-all-entities
-class DPKTradingDataUpdateCoordinator(DataUpdateCoordinator):
+class DPKTradingDataUpdateCoordinator(DataUpdateCoordinator[BlindSnapshot]):
     """Class to manage fetching data from the API."""
 
     config_entry: DPKSmartBlindConfigEntry
 
-    def __init__(
+    def __init__(  # noqa: PLR0913
         self,
         client: DPKSmartBlindAPI,
         hass: HomeAssistant,
+        command_group: CoverCommandGroup | None = None,
+        sun_filter: SunOutFilter | None = None,
+        analytics: BlindAnalytics | None = None,
+        tick_log: TickLog | None = None,
+        lifecycle: EntryLifecycle | None = None,
     ) -> None:
         """Initialize."""
         self._client = client
-        self._update_listener: CALLBACK_TYPE | None = None
+        self._lifecycle = lifecycle or EntryLifecycle(hass, client.name)
+        self._command_group = command_group
+        self._sun_filter = sun_filter
+        self._analytics = analytics
+        self._tick_log = tick_log
+        self._policy = CoverPolicy(
+            client.name, client.delta_position, client.delta_tilt
+        )
+        self._cover_position: int | None = None
+        self._cover_travel: str | None = None
+        self._cover_tilt: int | None = None
+        self._travel = TravelEstimator()
         self._cover_change_data: StateChangedData | None = None
-        self._end_time = None
 
         super().__init__(
             hass=hass,
             logger=LOGGER,
             name=DOMAIN,
-            update_interval=td(minutes=5),
+            always_update=False,
         )
-        """update_interval=timedelta(minutes=client.delta_time),"""
-
-        _end = dt.now(ZoneInfo(self.hass.config.time_zone))
-        _end += td(minutes=client.delta_time)
-        _LOGGER.debug("%s: async_timed_refresh set for %s", client.name, _end)
-        self._update_listener = async_track_point_in_time(
-            self.hass, self.async_timed_refresh, _end
+        """Ticks come from the shared scheduler, aligned across all blinds."""
+        self._lifecycle.async_add(
+            "scheduler", async_get_tick_scheduler(hass).async_register(self)
         )
 
-    async def async_timed_refresh(self, event) -> None:
-        """Update from hass controller as a timed event."""
-        _LOGGER.debug("%s: async_timed_refresh tripped", self._client.name)
-
-    @callback
-    def async_cancel_update_listener(self) -> None:
-        """Cancel the scheduled update."""
-        _LOGGER.debug("%s: async_cancel_update_listener", self._client.name)
-        if self._update_listener:
-            _LOGGER.debug("%s: calling _update_listener()", self._client.name)
-            """
-            Calling the return of async_track_point_in_time() does not invoke
-            the callback, but rather cancels the point in time. Should call this
-            when the entity is deleted/reloaded or otherwise reset
-            """
-            self._update_listener()
-            self._update_listener = None
-
-    async def _async_update_data(self) -> Any:
+    async def _async_update_data(self) -> BlindSnapshot:
         """Update data via library."""
+        if self._sun_filter is not None:
+            """Quiet weather sources still age; hold their last samples."""
+            self._sun_filter.advance(time.monotonic())
+            self._async_arm_dwell()
         try:
-            return await self._client.async_get_data()
+            data = await self._client.async_get_data(
+                sun_out=self.sun_out,
+                cloud_coverage=None
+                if self._sun_filter is None
+                else self._sun_filter.cloud_coverage,
+            )
         except DPKSmartBlindAuthenticationError as exception:
             raise ConfigEntryAuthFailed(exception) from exception
         except DPKSmartBlindError as exception:
             raise UpdateFailed(exception) from exception
+        self._async_actuate(data)
+        if self._analytics is not None:
+            self._analytics.record_tick(
+                dt.now(ZoneInfo(self.hass.config.time_zone)),
+                sun_in_window=bool(data.sun_out and data.sun_in_window),
+            )
+            self._async_analytics_changed()
+        if self._tick_log is not None:
+            async_get_tick_log_writer(self.hass).async_append(self._tick_log, data)
+        return data
+
+    @callback
+    def async_defer_while_travelling(self) -> bool:
+        """
+        Hold off while the cover is still on its way somewhere.
+
+        Until the learned travel time says the move should be over, there is
+        nothing to gain from recalculating or sending another command. A
+        refresh is armed for the predicted arrival, or sooner if it settles.
+        """
+        if self._cover_travel is None:
+            return False
+        arrival = self._travel.arrival(
+            self._policy.commanded_target(self._cover_position, self._cover_travel)
+        )
+        remaining = None if arrival is None else arrival - time.monotonic()
+        if remaining is None or remaining <= 0:
+            return False
+        if not self._lifecycle.pending("arrival"):
+            _LOGGER.debug(
+                "%s: cover %s, deferring %.1fs until it arrives",
+                self._client.name,
+                self._cover_travel,
+                remaining,
+            )
+            self._lifecycle.async_call_later("arrival", remaining, self._async_arrived)
+        return True
+
+    @callback
+    def _async_arrived(self, _now: Any = None) -> None:
+        """Refresh once a deferred move should have finished."""
+        self.hass.async_create_task(self.async_request_refresh())
+
+    @callback
+    def _async_arm_dwell(self) -> None:
+        """Wake when a held sun-out flip may happen, rather than at the next tick."""
+        due = (
+            None
+            if self._sun_filter is None
+            else self._sun_filter.flip_due(time.monotonic())
+        )
+        if due is None:
+            self._lifecycle.async_cancel("dwell")
+            return
+        self._lifecycle.async_call_later("dwell", due, self._async_dwell_elapsed)
+
+    @callback
+    def _async_dwell_elapsed(self, _now: Any = None) -> None:
+        """Refresh if the sun-out signal flips now its dwell has run out."""
+        if self._sun_filter is None:
+            return
+        was_out = self._sun_filter.sun_out
+        self._sun_filter.advance(time.monotonic())
+        if self._sun_filter.sun_out != was_out:
+            _LOGGER.debug("%s: sun out changed to %s", self._client.name, not was_out)
+            self.hass.async_create_task(self.async_request_refresh())
+            return
+        self._async_arm_dwell()
+
+    @callback
+    def _async_actuate(self, data: BlindSnapshot) -> None:
+        """Queue a cover move or slat tilt when the calculated one has changed."""
+        if self._command_group is None or not data.sun_out:
+            return
+        if self.async_defer_while_travelling():
+            return
+        if self._client.tilt_mode:
+            tilt = self._policy.tilt_target(data, self._cover_tilt)
+            if tilt is not None:
+                self._command_group.async_set_tilt_position(
+                    self._client.cover_entity, tilt
+                )
+            return
+        target = self._policy.position_target(
+            data, self._cover_position, self._cover_travel
+        )
+        if target is not None:
+            self._command_group.async_set_position(self._client.cover_entity, target)
+
+    @callback
+    def _async_cache_cover_state(self, state: State) -> None:
+        """Remember where the cover is and whether it is travelling."""
+        was_travelling = self._cover_travel
+        position = state.attributes.get(ATTR_CURRENT_POSITION)
+        if position is not None:
+            self._cover_position = int(position)
+        tilt = state.attributes.get(ATTR_CURRENT_TILT_POSITION)
+        if tilt is not None:
+            self._cover_tilt = int(tilt)
+        self._cover_travel = (
+            state.state if state.state in (STATE_OPENING, STATE_CLOSING) else None
+        )
+        if self._cover_travel is not None:
+            self._travel.start(
+                self._cover_travel, self._cover_position, time.monotonic()
+            )
+        elif was_travelling is not None:
+            estimate = self._travel.settle(self._cover_position, time.monotonic())
+            if estimate is not None:
+                _LOGGER.debug(
+                    "%s: %s travel now %.2fs per percent",
+                    self._client.name,
+                    was_travelling,
+                    estimate,
+                )
+            if self._lifecycle.async_cancel("arrival"):
+                self._async_arrived()
+
+    @callback
+    def async_seed_cover_state(self, state: State | None) -> None:
+        """Take the cover's state at setup; later changes arrive as events."""
+        if state is None:
+            return
+        self._async_cache_cover_state(state)
+        if self._analytics is not None and self._cover_position is not None:
+            self._analytics.record_position(
+                dt.now(ZoneInfo(self.hass.config.time_zone)), self._cover_position
+            )
+
+    @callback
+    def _async_analytics_changed(self) -> None:
+        async_dispatcher_send(
+            self.hass, SIGNAL_ANALYTICS.format(self.config_entry.entry_id)
+        )
+        async_get_analytics_store(self.hass).async_schedule_save()
+
+    @callback
+    def _async_record_position(self, position: float) -> None:
+        """Count a settled move; a move we did not command is an override."""
+        if self._analytics is None:
+            return
+        now = dt.now(ZoneInfo(self.hass.config.time_zone))
+        if not self._analytics.record_position(now, int(position)):
+            return
+        if self._policy.is_override(position):
+            self._analytics.record_override(now)
+        self._async_analytics_changed()
+
+    @property
+    def previous_data(self) -> BlindSnapshot | None:
+        """Snapshot from the tick before `data`, for cheap diffing."""
+        return self._client.previous_snapshot
+
+    @property
+    def sun_out(self) -> bool:
+        """Filtered weather signal; True when no weather gating is configured."""
+        return self._sun_filter is None or self._sun_filter.sun_out
+
+    @property
+    def sun_filter(self) -> SunOutFilter | None:
+        """Getter for the weather gating filter."""
+        return self._sun_filter
+
+    @property
+    def lifecycle(self) -> EntryLifecycle:
+        """Getter for the timers and subscriptions this blind holds."""
+        return self._lifecycle
+
+    @property
+    def travel(self) -> TravelEstimator:
+        """Getter for the learned travel times."""
+        return self._travel
+
+    @property
+    def analytics(self) -> BlindAnalytics | None:
+        """Getter for the daily analytics accumulators."""
+        return self._analytics
+
+    @property
+    def command_group(self) -> CoverCommandGroup | None:
+        """Getter for the command group this cover is actuated through."""
+        return self._command_group
 
     async def async_check_entity_state_change(
         self, event: Event[EventStateChangedData]
@@ -91,6 +296,26 @@ class DPKTradingDataUpdateCoordinator(DataUpdateCoordinator):
         """Fetch and process state change event."""
         _LOGGER.debug("%s: Entity state change: %s", self._client.name, event)
         """self.state_change = True"""
+        entity_id = event.data["entity_id"]
+        if entity_id == SUN_ENTITY:
+            """sun.sun has just solved the position; calculate with it now."""
+            if self._client.solar.async_observe(event.data["new_state"]):
+                await self.async_request_refresh()
+            return
+        if self._sun_filter is None:
+            return
+        was_out = self._sun_filter.sun_out
+        if entity_id == self._client.weather_entity:
+            self._sun_filter.update_weather(event.data["new_state"], time.monotonic())
+        elif entity_id == self._client.irradiance_entity:
+            self._sun_filter.update_irradiance(
+                event.data["new_state"], time.monotonic()
+            )
+        if self._sun_filter.sun_out != was_out:
+            _LOGGER.debug("%s: sun out changed to %s", self._client.name, not was_out)
+            await self.async_request_refresh()
+            return
+        self._async_arm_dwell()
 
     async def async_check_cover_state_change(
         self, event: Event[EventStateChangedData]
@@ -102,7 +327,10 @@ class DPKTradingDataUpdateCoordinator(DataUpdateCoordinator):
         """if data.old_state is None:
             _LOGGER.debug("Old state is None")
             return"""
-        if data.new_state.state in ["opening", "closing"]:  # type: ignore[attr-defined]
+        if data.new_state is None:
+            return
+        self._async_cache_cover_state(data.new_state)
+        if self._cover_travel is not None:
             _LOGGER.debug("Ignoring intermediate state change for %s", data.entity_id)
             return
         self._cover_change_data = data
@@ -111,16 +339,14 @@ class DPKTradingDataUpdateCoordinator(DataUpdateCoordinator):
             self._client.name,
             self._cover_change_data,
         )
+        if self._cover_position is not None:
+            self._async_record_position(self._cover_position)
         """self.state_change = True"""
         """
-        Need to check new state== open or closed; will be opening or closing
-        whilst the cover does its thing, but only interested when it gets set to
-        open or closed. When that happens, means either blind has changed by
-        this prcess, else manually. If manually, then want to set a
-        parameterized timeout and not make any further changes until that
-        timeout timesout.
-        TODO: how to differentiate between this component requesting a blind
-        change, and someone doing it manually?
+        Only settled states count; opening and closing are skipped above.
+        A settled position away from the one last commanded is a manual
+        move (see CoverPolicy.is_override). Holding off for a while after
+        one is still to do.
         """
 
     @property
@@ -0,0 +1,52 @@
+"""
+Calculation core for dpk_smart_blind, free of Home Assistant.
+
+Sun position, field of view, cover geometry, slat tilt, clear-sky gain and
+travel learning work on plain settings and timestamps, and import nothing
+beyond numpy and astral. The integration adapts config entries and states
+to these types.
+
+Importing `custom_components.dpk_smart_blind.core` still runs the
+integration's `__init__`, which imports Home Assistant. To start without
+it, e.g. in a benchmark or a worker process, put the integration directory
+on `sys.path` and import the package as `core`:
+
+    sys.path.insert(0, "custom_components/dpk_smart_blind")
+    from core import SolarModel, WindowCalculator, WindowConfig
+"""
+
+from .chart import SunTrack, SunTrackCache, sun_chart_svg
+from .config import WindowConfig
+from .const import CalcField, StateOfSunInWindow
+from .decision import CoverPolicy
+from .geometry import WindowGeometry
+from .irradiance import ClearSkyCurve
+from .memo import CalculationMemo, WindowResult
+from .snapshot import BlindSnapshot
+from .solar import SolarModel, solar_position
+from .ticks import TICK_DTYPE, read_tick_log
+from .tilt import SlatTable
+from .travel import TravelEstimator
+from .window import WindowCalculator
+
+__all__ = [
+    "TICK_DTYPE",
+    "BlindSnapshot",
+    "CalcField",
+    "CalculationMemo",
+    "ClearSkyCurve",
+    "CoverPolicy",
+    "SlatTable",
+    "SolarModel",
+    "StateOfSunInWindow",
+    "SunTrack",
+    "SunTrackCache",
+    "TravelEstimator",
+    "WindowCalculator",
+    "WindowConfig",
+    "WindowGeometry",
+    "WindowResult",
+    "read_tick_log",
+    "solar_position",
+    "sun_chart_svg",
+]
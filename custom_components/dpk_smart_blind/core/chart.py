@@ -0,0 +1,182 @@
+"""Daily sun-path chart for the dpk_smart_blind core."""
+
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass
+from datetime import date, datetime, time, timedelta
+from typing import TYPE_CHECKING
+from xml.sax.saxutils import escape
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from .config import WindowConfig
+    from .solar import SolarModel
+
+# Seconds between samples of the day's sun track.
+TRACK_STEP = 600
+
+CHART_SIZE = 240
+CHART_RADIUS = 100  # px from the zenith to the horizon
+CHART_RINGS = (30, 60)  # elevations marked, degrees
+COLOR_GRID = "#9e9e9e"
+COLOR_FOV = "#ffc107"
+COLOR_PATH = "#607d8b"
+COLOR_IN_FOV = "#ff5722"
+
+
+@dataclass(frozen=True, slots=True)
+class SunTrack:
+    """
+    The sun's azimuth and elevation over one local day, every `TRACK_STEP`.
+
+    Shared by every window's chart; the first sample is at local midnight, so
+    every `3600 / TRACK_STEP`th sample falls on the hour.
+    """
+
+    day: date
+    start: float
+    end: float
+    azimuth: tuple[float, ...]
+    elevation: tuple[float, ...]
+
+    def covers(self, timestamp: float) -> bool:
+        """Whether `timestamp` falls within this day."""
+        return self.start <= timestamp < self.end
+
+
+class SunTrackCache:
+    """
+    Today's sun track at the home location, built once per local day.
+
+    Only used from the event loop; the track is one vectorised solve.
+    """
+
+    def __init__(self, solar: SolarModel) -> None:
+        """Initialize."""
+        self._solar = solar
+        self._track: SunTrack | None = None
+
+    def day(self, when: datetime) -> SunTrack:
+        """Return the track for the local day containing `when`."""
+        track = self._track
+        if track is None or not track.covers(when.timestamp()):
+            track = self._build(when)
+            self._track = track
+        return track
+
+    def _build(self, when: datetime) -> SunTrack:
+        tz = self._solar.time_zone
+        day = when.astimezone(tz).date()
+        start = datetime.combine(day, time(), tzinfo=tz).timestamp()
+        end = datetime.combine(day + timedelta(days=1), time(), tzinfo=tz).timestamp()
+        timestamps = np.arange(start, end + TRACK_STEP, TRACK_STEP, dtype=float)
+        azimuth, elevation = self._solar.positions(timestamps)
+        return SunTrack(
+            day,
+            start,
+            end,
+            tuple(np.round(azimuth, 2).tolist()),
+            tuple(np.round(elevation, 2).tolist()),
+        )
+
+
+def _point(azimuth: float, elevation: float) -> tuple[float, float]:
+    """Polar position, north up and the horizon at `CHART_RADIUS`."""
+    radius = CHART_RADIUS * (90 - elevation) / 90
+    centre = CHART_SIZE / 2
+    return (
+        centre + radius * math.sin(math.radians(azimuth)),
+        centre - radius * math.cos(math.radians(azimuth)),
+    )
+
+
+def _polyline(points: list[tuple[float, float]], color: str, width: float) -> str:
+    coords = " ".join(f"{x:.1f},{y:.1f}" for x, y in points)
+    return (
+        f'<polyline points="{coords}" fill="none" stroke="{color}" '
+        f'stroke-width="{width}" stroke-linejoin="round"/>'
+    )
+
+
+def _fov_wedge(config: WindowConfig) -> str:
+    """Draw the window's field of view as a sector out to the horizon."""
+    centre = CHART_SIZE / 2
+    span = config.fov_left + config.fov_right
+    style = f'fill="{COLOR_FOV}" fill-opacity="0.25" stroke="{COLOR_FOV}"'
+    if span >= 360:  # noqa: PLR2004
+        return f'<circle cx="{centre}" cy="{centre}" r="{CHART_RADIUS}" {style}/>'
+    x0, y0 = _point(config.azi_min_abs, 0)
+    x1, y1 = _point(config.azi_max_abs, 0)
+    large = int(span > 180)  # noqa: PLR2004
+    return (
+        f'<path d="M{centre},{centre} L{x0:.1f},{y0:.1f} '
+        f'A{CHART_RADIUS},{CHART_RADIUS} 0 {large} 1 {x1:.1f},{y1:.1f} Z" {style}/>'
+    )
+
+
+def sun_chart_svg(track: SunTrack, config: WindowConfig, title: str) -> str:
+    """
+    Polar SVG of the day's sun path against the window's field of view.
+
+    The zenith is at the centre and the horizon at the rim, north up. The
+    path is drawn where the sun is up, with the stretch inside the field of
+    view picked out, as the calculation sees it, and a dot on each hour.
+    """
+    centre = CHART_SIZE / 2
+    parts = [
+        f'<svg xmlns="http://www.w3.org/2000/svg" width="{CHART_SIZE}" '
+        f'height="{CHART_SIZE}" viewBox="0 0 {CHART_SIZE} {CHART_SIZE}" '
+        'font-family="sans-serif" font-size="10">',
+        f"<title>{escape(title)} {track.day.isoformat()}</title>",
+        _fov_wedge(config),
+    ]
+    parts.extend(
+        f'<circle cx="{centre}" cy="{centre}" '
+        f'r="{CHART_RADIUS * (90 - elevation) / 90:.1f}" fill="none" '
+        f'stroke="{COLOR_GRID}" stroke-width="{1 if elevation == 0 else 0.5}"/>'
+        for elevation in (0, *CHART_RINGS)
+    )
+    for azimuth, label in ((0, "N"), (90, "E"), (180, "S"), (270, "W")):
+        x, y = _point(azimuth, -9)  # just outside the horizon
+        parts.append(
+            f'<text x="{x:.1f}" y="{y:.1f}" text-anchor="middle" '
+            f'dominant-baseline="middle" fill="{COLOR_GRID}">{label}</text>'
+        )
+
+    """Break the path where the sun sets, and where it enters or leaves."""
+    azi_min, azi_max = config.azi_min_abs, config.azi_max_abs
+    hour = 3600 // TRACK_STEP
+    path: list[list[tuple[float, float]]] = [[]]
+    in_fov: list[list[tuple[float, float]]] = [[]]
+    hours: list[str] = []
+    for index, (azimuth, elevation) in enumerate(
+        zip(track.azimuth, track.elevation, strict=True)
+    ):
+        if elevation <= 0:
+            if path[-1]:
+                path.append([])
+            if in_fov[-1]:
+                in_fov.append([])
+            continue
+        point = _point(azimuth, elevation)
+        path[-1].append(point)
+        if azi_min <= azimuth < azi_max:
+            in_fov[-1].append(point)
+        elif in_fov[-1]:
+            in_fov.append([])
+        if index % hour == 0:
+            hours.append(
+                f'<circle cx="{point[0]:.1f}" cy="{point[1]:.1f}" r="1.5" '
+                f'fill="{COLOR_PATH}"/>'
+            )
+    parts.extend(
+        _polyline(points, COLOR_PATH, 1.5) for points in path if len(points) > 1
+    )
+    parts.extend(
+        _polyline(points, COLOR_IN_FOV, 3) for points in in_fov if len(points) > 1
+    )
+    parts.extend(hours)
+    parts.append("</svg>")
+    return "\n".join(parts)
@@ -0,0 +1,40 @@
+"""Window settings for the dpk_smart_blind core."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True, slots=True)
+class WindowConfig:
+    """
+    Everything about one window the calculation depends on, as plain values.
+
+    Angles are in degrees, with the azimuth the compass bearing the window
+    faces. Lengths share one unit, except the slats, which share another.
+    Zone heights are measured from the bottom of the window, so a zone below
+    the sill has a negative height.
+    """
+
+    azimuth: float
+    fov_left: float
+    fov_right: float
+    distance: float
+    window_height: float
+    default_height: float  # % of the window left uncovered once the sun leaves
+    delta_time: float  # minutes between calculations
+    tilt_mode: bool
+    slat_width: float
+    slat_spacing: float
+    # Further (distance, height) zones to keep sun off, besides the shaded area.
+    zones: tuple[tuple[float, float], ...] = ()
+
+    @property
+    def azi_min_abs(self) -> float:
+        """Azimuth at which the sun enters the field of view."""
+        return (self.azimuth - self.fov_left + 360) % 360
+
+    @property
+    def azi_max_abs(self) -> float:
+        """Azimuth at which the sun leaves the field of view."""
+        return (self.azimuth + self.fov_right + 360) % 360
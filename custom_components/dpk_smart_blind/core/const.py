@@ -0,0 +1,46 @@
+"""Constants for the dpk_smart_blind calculation core."""
+
+from enum import StrEnum
+
+ATTR_AZIMUTH = "azimuth"
+ATTR_ELEVATION = "elevation"
+ATTR_SHADOW_LENGTH = "calc_shadow_length"
+ATTR_COVER_HEIGHT = "calc_cover_height"
+ATTR_NOW = "utc_now"
+ATTR_COVER_SETTING = "cover_setting"
+ATTR_COVER_TILT = "cover_tilt"
+ATTR_SUN_STATE = "sun_state"
+ATTR_SUN_IN_WINDOW = "sun_in_window"
+ATTR_MANUAL_OVERRIDE = "manual_override"
+ATTR_SUN_OUT = "sun_out"
+ATTR_GLAZING_IRRADIANCE = "glazing_irradiance"
+
+# Cover motion states, as Home Assistant names them.
+STATE_OPENING = "opening"
+STATE_CLOSING = "closing"
+
+
+class StateOfSunInWindow(StrEnum):
+    """Solar location w.r.t. window."""
+
+    EARLY = "early"
+    IN_FRONT = "in_front"
+    JUST_LEFT = "just_left"
+    PASSED = "passed"
+
+
+class CalcField(StrEnum):
+    """Fields of a calculation snapshot, valued by their attribute keys."""
+
+    NOW = ATTR_NOW
+    AZIMUTH = ATTR_AZIMUTH
+    ELEVATION = ATTR_ELEVATION
+    SHADOW_LENGTH = ATTR_SHADOW_LENGTH
+    COVER_HEIGHT = ATTR_COVER_HEIGHT
+    COVER_SETTING = ATTR_COVER_SETTING
+    COVER_TILT = ATTR_COVER_TILT
+    SUN_STATE = ATTR_SUN_STATE
+    SUN_IN_WINDOW = ATTR_SUN_IN_WINDOW
+    MANUAL_OVERRIDE = ATTR_MANUAL_OVERRIDE
+    SUN_OUT = ATTR_SUN_OUT
+    GLAZING_IRRADIANCE = ATTR_GLAZING_IRRADIANCE
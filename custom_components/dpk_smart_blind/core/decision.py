@@ -0,0 +1,110 @@
+"""Cover move decisions for the dpk_smart_blind core."""
+
+from __future__ import annotations
+
+import logging
+from typing import TYPE_CHECKING
+
+from .const import STATE_CLOSING, STATE_OPENING, StateOfSunInWindow
+
+if TYPE_CHECKING:
+    from .snapshot import BlindSnapshot
+
+_LOGGER = logging.getLogger(__name__)
+
+# Only these sun states move the cover; otherwise it is left where it is.
+ACTUATING_STATES = (StateOfSunInWindow.IN_FRONT, StateOfSunInWindow.JUST_LEFT)
+
+
+def _clamp(value: float) -> int:
+    return int(min(100, max(0, value)))
+
+
+class CoverPolicy:
+    """
+    When a snapshot is worth a cover command, and which settled moves were not.
+
+    Remembers the last position and tilt asked for, so an unchanged setting
+    is not sent twice, and a settled position too far from what was asked for
+    counts as a manual override. The caller owns the cover's current state
+    and passes it in.
+    """
+
+    __slots__ = ("delta_position", "delta_tilt", "last_command", "last_tilt", "name")
+
+    def __init__(self, name: str, delta_position: float, delta_tilt: float) -> None:
+        """Initialize."""
+        self.name = name
+        self.delta_position = delta_position
+        self.delta_tilt = delta_tilt
+        self.last_command: float | None = None
+        self.last_tilt: float | None = None
+
+    def position_target(
+        self, data: BlindSnapshot, position: int | None, travel: str | None
+    ) -> int | None:
+        """Position to send for `data`, or None to leave the cover alone."""
+        if not data.sun_out or data.sun_state not in ACTUATING_STATES:
+            return None
+        setting = data.cover_setting
+        if setting is None or setting == self.last_command:
+            return None
+        target = _clamp(setting)
+        if self.redundant(target, position, travel):
+            _LOGGER.debug(
+                "%s: suppressing move to %s; cover at %s, %s",
+                self.name,
+                target,
+                position,
+                travel or "stopped",
+            )
+            return None
+        self.last_command = setting
+        return target
+
+    def tilt_target(self, data: BlindSnapshot, tilt: int | None) -> int | None:
+        """Tilt to send for `data`, once it has moved by more than the delta."""
+        if not data.sun_out or data.sun_state not in ACTUATING_STATES:
+            return None
+        setting = data.cover_tilt
+        if setting is None or setting == self.last_tilt:
+            return None
+        target = _clamp(setting)
+        if tilt is not None and abs(target - tilt) <= self.delta_tilt:
+            _LOGGER.debug(
+                "%s: suppressing tilt to %s; slats at %s", self.name, target, tilt
+            )
+            return None
+        self.last_tilt = setting
+        return target
+
+    def redundant(self, target: int, position: int | None, travel: str | None) -> bool:
+        """
+        Whether the cover is already near `target` or on its way there.
+
+        A travelling cover only counts as on its way if it is heading for the
+        position we last asked for and that is within the delta of `target`;
+        a move someone else started is not ours to wait for.
+        """
+        if position is None:
+            return False
+        if travel in (STATE_OPENING, STATE_CLOSING):
+            heading = self.commanded_target(position, travel)
+            return heading is not None and abs(target - heading) <= self.delta_position
+        return abs(target - position) <= self.delta_position
+
+    def commanded_target(self, position: int | None, travel: str | None) -> int | None:
+        """Position last asked for, if the cover is heading that way."""
+        if self.last_command is None or position is None:
+            return None
+        target = _clamp(self.last_command)
+        if (travel == STATE_OPENING) != (target > position):
+            return None
+        return target
+
+    def is_override(self, position: float) -> bool:
+        """Whether a settled `position` is a move we did not ask for."""
+        return (
+            self.last_command is None
+            or abs(position - _clamp(self.last_command)) > self.delta_position
+        )
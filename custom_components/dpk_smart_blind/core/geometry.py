@@ -0,0 +1,101 @@
+"""Window shading geometry for the dpk_smart_blind core."""
+
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from .config import WindowConfig
+
+# Below this the sun is practically parallel to the glass and shades nothing.
+MIN_INCIDENCE_COS = 1e-3
+
+
+@dataclass(frozen=True, slots=True, eq=False)
+class WindowGeometry:
+    """
+    Per-window constants, worked out once per options change.
+
+    The cover height follows the profile angle, the sun's elevation projected
+    onto the vertical plane through the window normal:
+
+        tan(profile) = tan(elevation) / cos(azimuth - window azimuth)
+
+    so an oblique sun needs less cover than one straight ahead at the same
+    elevation. Expanding the cosine leaves two multiplies per tick against
+    the window's precomputed sine and cosine.
+
+    Sun reaching a protected zone `distance` out and `height` above the
+    bottom of the window came in at height + distance * tan(profile), so the
+    cover may open no further than that. Zones are held as arrays, so every
+    zone is checked in one pass and the lowest opening, i.e. the most cover,
+    wins. The shaded area is the first zone, at the bottom of the window.
+    """
+
+    distances: np.ndarray
+    heights: np.ndarray
+    window_height: float
+    cos_azimuth: float
+    sin_azimuth: float
+
+    @classmethod
+    def from_config(cls, config: WindowConfig) -> WindowGeometry:
+        """Build from the window's settings."""
+        azimuth = math.radians(config.azimuth)
+        zones = ((config.distance, 0.0), *config.zones)
+        return cls(
+            distances=np.array([distance for distance, _ in zones], dtype=float),
+            heights=np.array([height for _, height in zones], dtype=float),
+            window_height=float(config.window_height),
+            cos_azimuth=math.cos(azimuth),
+            sin_azimuth=math.sin(azimuth),
+        )
+
+    @property
+    def normal(self) -> tuple[float, float, float]:
+        """Outward normal of the glazing: east, north, up."""
+        return (self.sin_azimuth, self.cos_azimuth, 0.0)
+
+    def incidence_cos(self, azimuth: float) -> float:
+        """Cosine of the sun's azimuth off the window normal."""
+        azimuth = math.radians(azimuth)
+        return math.cos(azimuth) * self.cos_azimuth + math.sin(azimuth) * (
+            self.sin_azimuth
+        )
+
+    def profile_angle(self, azimuth: float, elevation: float) -> float:
+        """Sun's elevation projected onto the plane through the window normal."""
+        incidence = self.incidence_cos(azimuth)
+        if incidence < MIN_INCIDENCE_COS:
+            return 90.0
+        return math.degrees(math.atan(math.tan(math.radians(elevation)) / incidence))
+
+    def cover_height(self, azimuth: float, elevation: float) -> float:
+        """Height the cover must leave open to keep sun off the shaded area."""
+        incidence = self.incidence_cos(azimuth)
+        if incidence < MIN_INCIDENCE_COS:
+            return self.window_height
+        reach = math.tan(math.radians(elevation)) / incidence
+        height = float((self.heights + self.distances * reach).min())
+        return min(height, self.window_height)
+
+    def cover_heights(self, azimuth: np.ndarray, elevation: np.ndarray) -> np.ndarray:
+        """Vectorised `cover_height` over arrays of sun positions."""
+        azimuth = np.radians(azimuth)
+        incidence = np.cos(azimuth) * self.cos_azimuth + np.sin(azimuth) * (
+            self.sin_azimuth
+        )
+        with np.errstate(divide="ignore", invalid="ignore"):
+            reach = np.tan(np.radians(elevation)) / incidence
+            height = (self.heights + np.multiply.outer(reach, self.distances)).min(
+                axis=-1
+            )
+        return np.where(
+            incidence < MIN_INCIDENCE_COS,
+            self.window_height,
+            np.minimum(height, self.window_height),
+        )
@@ -0,0 +1,139 @@
+"""Clear-sky direct-beam irradiance for the dpk_smart_blind core."""
+
+from __future__ import annotations
+
+import math
+import threading
+from dataclasses import dataclass
+from datetime import datetime, time, timedelta
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from .solar import SolarModel
+
+type Vector = tuple[float, float, float]
+
+# Seconds between samples of the day's curve.
+CURVE_STEP = 60
+
+SOLAR_CONSTANT = 1367.0  # W/m² at the top of the atmosphere, mean distance
+# Meinel's clear-sky transmittance: I0 * 0.7 ** (AM ** 0.678).
+MEINEL_TRANSMITTANCE = 0.7
+MEINEL_EXPONENT = 0.678
+
+
+def air_mass(elevation: np.ndarray) -> np.ndarray:
+    """Relative optical air mass, Kasten and Young (1989)."""
+    zenith = 90.0 - np.clip(elevation, 0.0, 90.0)
+    return 1.0 / (np.cos(np.radians(zenith)) + 0.50572 * (96.07995 - zenith) ** -1.6364)
+
+
+def clear_sky_beam(elevation: np.ndarray, day_of_year: int) -> np.ndarray:
+    """
+    Direct normal irradiance under a clear sky, in W/m².
+
+    Meinel's model, with the solar constant corrected for the earth's
+    distance from the sun on `day_of_year`. Zero with the sun down.
+    """
+    extraterrestrial = SOLAR_CONSTANT * (
+        1.0 + 0.033 * math.cos(2.0 * math.pi * day_of_year / 365.0)
+    )
+    beam = extraterrestrial * MEINEL_TRANSMITTANCE ** (
+        air_mass(elevation) ** MEINEL_EXPONENT
+    )
+    return np.where(elevation > 0.0, beam, 0.0)
+
+
+def cloud_attenuation(cloud_coverage: float) -> float:
+    """Fraction of clear-sky irradiance left at `cloud_coverage` %, per Kasten."""
+    fraction = min(max(cloud_coverage, 0.0), 100.0) / 100.0
+    return 1.0 - 0.75 * fraction**3.4
+
+
+@dataclass(frozen=True, slots=True)
+class ClearSkyDay:
+    """
+    One local day's clear-sky beam, as east, north and up components.
+
+    Each sample is the direct normal irradiance times the unit vector towards
+    the sun, so the irradiance on any surface is its dot product with the
+    surface normal, and the curve is shared by every window. Samples are
+    held as plain floats, as a tick only ever reads two of them.
+    """
+
+    start: float
+    end: float
+    beam: tuple[Vector, ...]
+
+    def covers(self, timestamp: float) -> bool:
+        """Whether `timestamp` falls within this day."""
+        return self.start <= timestamp < self.end
+
+    def on_surface(self, timestamp: float, normal: Vector) -> float:
+        """Beam irradiance at `timestamp` on a surface facing `normal`, W/m²."""
+        index = min(max(timestamp - self.start, 0.0) / CURVE_STEP, len(self.beam) - 1)
+        lower = min(int(index), len(self.beam) - 2)
+        fraction = index - lower
+        east0, north0, up0 = self.beam[lower]
+        east1, north1, up1 = self.beam[lower + 1]
+        east, north, up = normal
+        return max(
+            (east0 + fraction * (east1 - east0)) * east
+            + (north0 + fraction * (north1 - north0)) * north
+            + (up0 + fraction * (up1 - up0)) * up,
+            0.0,
+        )
+
+
+class ClearSkyCurve:
+    """
+    Today's clear-sky beam at the home location, shared by every blind.
+
+    The curve is worked out for the whole local day on first use and again
+    once the day rolls over. Used from executor threads, so the rebuild is
+    guarded by a lock.
+    """
+
+    def __init__(self, solar: SolarModel) -> None:
+        """Initialize."""
+        self._solar = solar
+        self._day: ClearSkyDay | None = None
+        self._lock = threading.Lock()
+
+    def day(self, when: datetime) -> ClearSkyDay:
+        """Return the curve for the local day containing `when`."""
+        day = self._day
+        if day is not None and day.covers(when.timestamp()):
+            return day
+        with self._lock:
+            day = self._day
+            if day is None or not day.covers(when.timestamp()):
+                day = self._build(when)
+                self._day = day
+        return day
+
+    def irradiance(self, when: datetime, normal: Vector) -> float:
+        """Clear-sky beam on a surface facing `normal` at `when`, W/m²."""
+        return self.day(when).on_surface(when.timestamp(), normal)
+
+    def _build(self, when: datetime) -> ClearSkyDay:
+        tz = self._solar.time_zone
+        date = when.astimezone(tz).date()
+        start = datetime.combine(date, time(), tzinfo=tz).timestamp()
+        end = datetime.combine(date + timedelta(days=1), time(), tzinfo=tz).timestamp()
+        timestamps = np.arange(start, end + CURVE_STEP, CURVE_STEP, dtype=float)
+        azimuth, elevation = self._solar.positions(timestamps)
+        dni = clear_sky_beam(elevation, date.timetuple().tm_yday)
+        azimuth = np.radians(azimuth)
+        elevation = np.radians(elevation)
+        horizontal = dni * np.cos(elevation)
+        beam = np.column_stack(
+            (
+                horizontal * np.sin(azimuth),
+                horizontal * np.cos(azimuth),
+                dni * np.sin(elevation),
+            )
+        )
+        return ClearSkyDay(start, end, tuple(map(tuple, beam.tolist())))
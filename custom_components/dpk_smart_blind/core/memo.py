@@ -0,0 +1,85 @@
+"""Calculation results shared between identical windows."""
+
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Hashable
+    from typing import Any
+
+    from .config import WindowConfig
+    from .const import StateOfSunInWindow
+
+# Windows ticking within the same minute share a result.
+MEMO_BUCKET = 60
+MEMO_SIZE = 512
+
+
+def geometry_key(config: WindowConfig) -> tuple[Any, ...]:
+    """Normalise the settings the shared result depends on."""
+    return (
+        round(float(config.azimuth) % 360, 3),
+        round(float(config.fov_left), 3),
+        round(float(config.fov_right), 3),
+        round(float(config.distance), 3),
+        round(float(config.window_height), 3),
+        *(
+            (round(float(distance), 3), round(float(height), 3))
+            for distance, height in config.zones
+        ),
+    )
+
+
+@dataclass(frozen=True, slots=True)
+class WindowResult:
+    """What a window's geometry gives for one time bucket."""
+
+    azimuth: float
+    elevation: float
+    sun_state: StateOfSunInWindow
+    shadow_length: float
+    cover_height: float
+    profile_angle: float
+
+
+class CalculationMemo:
+    """
+    Bounded LRU of window results keyed on geometry and time bucket.
+
+    Only geometry is shared: anything that belongs to one cover, such as its
+    previous height or override, is applied by the caller afterwards. Used
+    from executor threads, so lookups are guarded by a lock.
+    """
+
+    def __init__(self, size: int = MEMO_SIZE) -> None:
+        """Initialize."""
+        self._size = size
+        self._results: OrderedDict[Hashable, WindowResult] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable, compute: Callable[[], WindowResult]) -> WindowResult:
+        """Return the result for `key`, computing it on a miss."""
+        with self._lock:
+            result = self._results.get(key)
+            if result is not None:
+                self._results.move_to_end(key)
+                self.hits += 1
+                return result
+        result = compute()
+        with self._lock:
+            self.misses += 1
+            self._results[key] = result
+            if len(self._results) > self._size:
+                self._results.popitem(last=False)
+        return result
+
+    def clear(self) -> None:
+        """Forget every result, e.g. after an options change."""
+        with self._lock:
+            self._results.clear()
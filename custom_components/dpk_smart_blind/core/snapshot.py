@@ -0,0 +1,57 @@
+"""Calculation snapshots for the dpk_smart_blind core."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Any
+
+from .const import CalcField, StateOfSunInWindow
+
+_FIELD_NAMES = {field: field.name.lower() for field in CalcField}
+
+
+@dataclass(frozen=True, slots=True)
+class BlindSnapshot:
+    """
+    Result of one calculation tick.
+
+    A new snapshot is built for every tick and never mutated, so entities can
+    hold a reference to it without seeing a half-finished calculation.
+    Snapshots compare on the decision outputs only. The clock, sun position,
+    shadow length and solar gain move on every tick, so a tick that changes
+    nothing else compares equal and does not wake the coordinator's
+    listeners; those fields are written out with the next decision change.
+    """
+
+    now: str | None = field(default=None, compare=False)
+    azimuth: float | None = field(default=None, compare=False)
+    elevation: float | None = field(default=None, compare=False)
+    shadow_length: float | None = field(default=None, compare=False)
+    cover_height: float | None = None
+    cover_setting: float | None = None
+    cover_tilt: float | None = None
+    sun_state: StateOfSunInWindow | None = None
+    sun_in_window: bool | None = None
+    manual_override: bool | None = None
+    sun_out: bool | None = None
+    glazing_irradiance: float | None = field(default=None, compare=False)
+
+    def __getitem__(self, field: CalcField | str) -> Any:
+        """Look a value up by its field / attribute key."""
+        return getattr(self, _FIELD_NAMES[CalcField(field)])
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the snapshot keyed on attribute names."""
+        return {field.value: self[field] for field in CalcField}
+
+    def diff(self, previous: BlindSnapshot | None) -> dict[str, Any]:
+        """Return the fields that differ from `previous`, by attribute name."""
+        if previous is None:
+            return self.as_dict()
+        if previous is self:
+            return {}
+        return {
+            field.value: self[field]
+            for field in CalcField
+            if self[field] != previous[field]
+        }
@@ -0,0 +1,174 @@
+"""Sun position for the dpk_smart_blind core."""
+
+from __future__ import annotations
+
+from datetime import UTC
+from functools import lru_cache
+from typing import TYPE_CHECKING
+
+import astral.sun
+import numpy as np
+
+if TYPE_CHECKING:
+    from datetime import datetime
+    from zoneinfo import ZoneInfo
+
+    from astral import Observer
+
+# A tick's 'now' plus each blind's 'now - delta_time' fit comfortably.
+POSITION_CACHE_SIZE = 16
+
+UNIX_EPOCH_JULIAN_DAY = 2440587.5
+J2000_JULIAN_DAY = 2451545.0
+MAX_LATITUDE = 89.8  # astral's clamp; azimuth is meaningless at the poles
+
+
+def _refraction(elevation: np.ndarray) -> np.ndarray:
+    """Atmospheric refraction in degrees, NOAA's piecewise fit."""
+    with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+        te = np.tan(np.radians(elevation))
+        arc_seconds = np.select(
+            [elevation >= 85.0, elevation > 5.0, elevation > -0.575],  # noqa: PLR2004
+            [
+                0.0,
+                58.1 / te - 0.07 / te**3 + 0.000086 / te**5,
+                1735.0
+                + elevation
+                * (
+                    -518.2
+                    + elevation * (103.4 + elevation * (-12.79 + elevation * 0.711))
+                ),
+            ],
+            -20.774 / te,
+        )
+    return arc_seconds / 3600.0
+
+
+def solar_position(
+    when: np.ndarray,
+    latitude: np.ndarray | float,
+    longitude: np.ndarray | float,
+    *,
+    refraction: bool = True,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Vectorised (azimuth, elevation) in degrees for UNIX timestamps `when`.
+
+    The NOAA solar calculator equations, as used by astral, evaluated over
+    whole arrays at once; `when`, `latitude` and `longitude` broadcast
+    against each other, so one call can cover a day of samples for many
+    observers. Unlike astral the Julian day is taken from the UTC date, so
+    local times either side of UTC midnight are not a day out.
+    """
+    when = np.asarray(when, dtype=float)
+    latitude = np.radians(np.clip(latitude, -MAX_LATITUDE, MAX_LATITUDE))
+    longitude = np.asarray(longitude, dtype=float)
+
+    jc = (when / 86400.0 + UNIX_EPOCH_JULIAN_DAY - J2000_JULIAN_DAY) / 36525.0
+    mean_long = np.radians((280.46646 + jc * (36000.76983 + 0.0003032 * jc)) % 360.0)
+    anomaly = np.radians(357.52911 + jc * (35999.05029 - 0.0001537 * jc))
+    eccentricity = 0.016708634 - jc * (0.000042037 + 0.0000001267 * jc)
+    centre = (
+        np.sin(anomaly) * (1.914602 - jc * (0.004817 + 0.000014 * jc))
+        + np.sin(2 * anomaly) * (0.019993 - 0.000101 * jc)
+        + np.sin(3 * anomaly) * 0.000289
+    )
+    omega = np.radians(125.04 - 1934.136 * jc)
+    apparent_long = np.radians(
+        np.degrees(mean_long) + centre - 0.00569 - 0.00478 * np.sin(omega)
+    )
+    obliquity = np.radians(
+        23.0
+        + (26.0 + (21.448 - jc * (46.815 + jc * (0.00059 - jc * 0.001813))) / 60.0)
+        / 60.0
+        + 0.00256 * np.cos(omega)
+    )
+    declination = np.arcsin(np.sin(obliquity) * np.sin(apparent_long))
+
+    y = np.tan(obliquity / 2.0) ** 2
+    equation_of_time = 4.0 * np.degrees(
+        y * np.sin(2 * mean_long)
+        - 2.0 * eccentricity * np.sin(anomaly)
+        + 4.0 * eccentricity * y * np.sin(anomaly) * np.cos(2 * mean_long)
+        - 0.5 * y * y * np.sin(4 * mean_long)
+        - 1.25 * eccentricity * eccentricity * np.sin(2 * anomaly)
+    )
+
+    true_solar_time = (
+        when % 86400.0 / 60.0 + equation_of_time + 4.0 * longitude
+    ) % 1440
+    hour_angle = true_solar_time / 4.0 - 180.0
+
+    cos_zenith = np.clip(
+        np.sin(latitude) * np.sin(declination)
+        + np.cos(latitude) * np.cos(declination) * np.cos(np.radians(hour_angle)),
+        -1.0,
+        1.0,
+    )
+    zenith = np.arccos(cos_zenith)
+
+    denominator = np.cos(latitude) * np.sin(zenith)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        cos_azimuth = np.clip(
+            (np.sin(latitude) * cos_zenith - np.sin(declination)) / denominator,
+            -1.0,
+            1.0,
+        )
+    azimuth = 180.0 - np.degrees(np.arccos(cos_azimuth))
+    azimuth = np.where(hour_angle > 0.0, -azimuth, azimuth)
+    azimuth = np.where(
+        np.abs(denominator) > 0.001,  # noqa: PLR2004
+        azimuth,
+        np.where(latitude > 0.0, 180.0, 0.0),
+    )
+    azimuth = np.where(azimuth < 0.0, azimuth + 360.0, azimuth)
+
+    elevation = 90.0 - np.degrees(zenith)
+    if refraction:
+        elevation = elevation + _refraction(elevation)
+    return azimuth, elevation
+
+
+class SolarModel:
+    """
+    Sun position at one location.
+
+    A position worked out for one timestamp is cached, so every window asking
+    for the same timestamp shares one solve.
+    """
+
+    def __init__(self, observer: Observer, time_zone: ZoneInfo) -> None:
+        """Initialize."""
+        self._observer = observer
+        self._time_zone = time_zone
+        self._position = lru_cache(maxsize=POSITION_CACHE_SIZE)(self._solve)
+
+    @property
+    def observer(self) -> Observer:
+        """Getter for the astral observer."""
+        return self._observer
+
+    @property
+    def time_zone(self) -> ZoneInfo:
+        """Getter for the local time zone."""
+        return self._time_zone
+
+    def observation(self, when: datetime) -> tuple[float, float] | None:  # noqa: ARG002
+        """Return a position measured elsewhere for `when`; none by default."""
+        return None
+
+    def position(self, when: datetime) -> tuple[float, float]:
+        """Return (azimuth, elevation) in degrees at `when`."""
+        return self.observation(when) or self._position(when)
+
+    def positions(self, when: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """Return (azimuth, elevation) arrays for UNIX timestamps `when`."""
+        return solar_position(when, self._observer.latitude, self._observer.longitude)
+
+    def _solve(self, when: datetime) -> tuple[float, float]:
+        """Give astral UTC, as it takes the Julian day from the local date."""
+        when = when.astimezone(UTC)
+        return (
+            astral.sun.azimuth(self._observer, when),
+            astral.sun.elevation(self._observer, when),
+        )
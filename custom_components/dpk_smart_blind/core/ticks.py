@@ -0,0 +1,75 @@
+"""Tick log record format for the dpk_smart_blind core."""
+
+from __future__ import annotations
+
+import math
+import struct
+from datetime import datetime
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from .const import StateOfSunInWindow
+
+if TYPE_CHECKING:
+    from .snapshot import BlindSnapshot
+
+HEADER = b"DPKTICK1"
+RECORD = struct.Struct("<dffffBB")
+TICK_DTYPE = np.dtype(
+    [
+        ("time", "<f8"),  # epoch seconds
+        ("azimuth", "<f4"),
+        ("elevation", "<f4"),
+        ("cover_height", "<f4"),
+        ("cover_setting", "<f4"),
+        ("sun_state", "u1"),  # index into SUN_STATES, 255 when unknown
+        ("flags", "u1"),
+    ]
+)
+SUN_STATES: tuple[StateOfSunInWindow, ...] = tuple(StateOfSunInWindow)
+UNKNOWN_STATE = 255
+FLAG_SUN_OUT = 1
+FLAG_SUN_IN_WINDOW = 2
+FLAG_MANUAL_OVERRIDE = 4
+
+
+def _float(value: float | None) -> float:
+    return math.nan if value is None else float(value)
+
+
+def pack(snapshot: BlindSnapshot) -> bytes:
+    """Encode one calculation as a fixed-width record."""
+    flags = (
+        (FLAG_SUN_OUT if snapshot.sun_out else 0)
+        | (FLAG_SUN_IN_WINDOW if snapshot.sun_in_window else 0)
+        | (FLAG_MANUAL_OVERRIDE if snapshot.manual_override else 0)
+    )
+    return RECORD.pack(
+        datetime.fromisoformat(snapshot.now).timestamp() if snapshot.now else math.nan,
+        _float(snapshot.azimuth),
+        _float(snapshot.elevation),
+        _float(snapshot.cover_height),
+        _float(snapshot.cover_setting),
+        SUN_STATES.index(snapshot.sun_state)
+        if snapshot.sun_state in SUN_STATES
+        else UNKNOWN_STATE,
+        flags,
+    )
+
+
+def read_tick_log(path: str | Path) -> np.memmap:
+    """
+    Memory-map a tick log as a structured array of TICK_DTYPE records.
+
+    Nothing is read until a field is touched, so months of ticks load
+    instantly. A record cut short by a crash at the tail is left out.
+    """
+    path = Path(path)
+    with path.open("rb") as file:
+        if file.read(len(HEADER)) != HEADER:
+            msg = f"{path} is not a tick log"
+            raise ValueError(msg)
+    count = (path.stat().st_size - len(HEADER)) // TICK_DTYPE.itemsize
+    return np.memmap(path, TICK_DTYPE, "r", offset=len(HEADER), shape=(count,))
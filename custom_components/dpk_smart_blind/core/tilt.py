@@ -0,0 +1,63 @@
+"""Venetian slat tilt for the dpk_smart_blind core."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from .config import WindowConfig
+
+# Degrees of profile angle between precomputed cutoff angles.
+PROFILE_STEP = 0.5
+MAX_PROFILE = 90.0
+
+# Home Assistant tilt positions: 100 is open (slats level), 0 closed.
+TILT_OPEN = 100.0
+
+
+def cutoff_angle(profile: np.ndarray, width: float, spacing: float) -> np.ndarray:
+    """
+    Least slat angle below horizontal, in degrees, that blocks direct sun.
+
+    Seen along the profile plane, neighbouring slats `spacing` apart leave a
+    gap of spacing * cos(profile) across the beam, while a slat `width` wide
+    tilted by b covers width * sin(b + profile) of it. The beam is cut off
+    once the slat covers the gap. Where no tilt can cover it, slats square
+    on to the beam are the best there is.
+    """
+    profile = np.radians(profile)
+    ratio = np.minimum(spacing * np.cos(profile) / width, 1.0)
+    return np.clip(np.degrees(np.arcsin(ratio) - profile), 0.0, 90.0)
+
+
+@dataclass(frozen=True, slots=True)
+class SlatTable:
+    """
+    Cutoff tilt positions per profile angle, built once per options change.
+
+    Tilts are held on a uniform grid of profile angles, so a tick's lookup is
+    an index and one linear interpolation.
+    """
+
+    tilts: tuple[float, ...]
+
+    @classmethod
+    def from_config(cls, config: WindowConfig) -> SlatTable:
+        """Build from the window's settings."""
+        profile = np.arange(0.0, MAX_PROFILE + PROFILE_STEP, PROFILE_STEP)
+        angle = cutoff_angle(
+            profile, float(config.slat_width), float(config.slat_spacing)
+        )
+        return cls(tuple((TILT_OPEN * (1.0 - angle / 90.0)).tolist()))
+
+    def tilt_position(self, profile: float) -> float:
+        """Tilt position that keeps direct sun at `profile` degrees out."""
+        index = min(max(profile, 0.0), MAX_PROFILE) / PROFILE_STEP
+        lower = min(int(index), len(self.tilts) - 2)
+        fraction = index - lower
+        return self.tilts[lower] + fraction * (
+            self.tilts[lower + 1] - self.tilts[lower]
+        )
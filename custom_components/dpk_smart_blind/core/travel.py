@@ -0,0 +1,67 @@
+"""Learned cover travel times for the dpk_smart_blind core."""
+
+from __future__ import annotations
+
+from .const import STATE_CLOSING, STATE_OPENING
+
+# Weight of the newest move in the running estimate.
+TRAVEL_SMOOTHING = 0.3
+# Moves shorter than this, in percent, are mostly motor start/stop latency.
+MIN_TRAVEL = 5
+
+
+class TravelEstimator:
+    """
+    Running seconds-per-percent estimate for each direction of one cover.
+
+    Fed the cover's motion and rest transitions, it times each move from the
+    moment the cover starts travelling to the moment it settles, and predicts
+    when a move under way will finish.
+    """
+
+    __slots__ = ("_start", "seconds_per_percent")
+
+    def __init__(self) -> None:
+        """Initialize."""
+        self.seconds_per_percent: dict[str, float | None] = {
+            STATE_OPENING: None,
+            STATE_CLOSING: None,
+        }
+        self._start: tuple[str, int, float] | None = None
+
+    def start(self, direction: str, position: int | None, now: float) -> None:
+        """Note that the cover began travelling from `position`."""
+        if position is None:
+            self._start = None
+            return
+        if self._start is not None and self._start[0] == direction:
+            return
+        self._start = (direction, position, now)
+
+    def settle(self, position: int | None, now: float) -> float | None:
+        """Learn from a finished move; return the updated estimate, if any."""
+        start, self._start = self._start, None
+        if start is None or position is None:
+            return None
+        direction, began_at, began = start
+        travelled = abs(position - began_at)
+        if travelled < MIN_TRAVEL:
+            return None
+        sample = (now - began) / travelled
+        estimate = self.seconds_per_percent[direction]
+        if estimate is not None:
+            sample = estimate + TRAVEL_SMOOTHING * (sample - estimate)
+        self.seconds_per_percent[direction] = sample
+        return sample
+
+    def arrival(self, target: int | None) -> float | None:
+        """Predicted monotonic time the move under way reaches `target`."""
+        if self._start is None:
+            return None
+        direction, began_at, began = self._start
+        estimate = self.seconds_per_percent[direction]
+        if estimate is None:
+            return None
+        if target is None:
+            target = 100 if direction == STATE_OPENING else 0
+        return began + estimate * abs(target - began_at)
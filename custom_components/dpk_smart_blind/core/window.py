@@ -0,0 +1,248 @@
+"""Per-window calculation for the dpk_smart_blind core."""
+
+from __future__ import annotations
+
+import logging
+from dataclasses import replace
+from datetime import timedelta
+from typing import TYPE_CHECKING
+
+from numpy import radians as rad
+from numpy import tan
+
+from .const import StateOfSunInWindow
+from .geometry import WindowGeometry
+from .irradiance import cloud_attenuation
+from .memo import MEMO_BUCKET, WindowResult, geometry_key
+from .snapshot import BlindSnapshot
+from .tilt import TILT_OPEN, SlatTable
+
+if TYPE_CHECKING:
+    from datetime import datetime
+
+    from .config import WindowConfig
+    from .irradiance import ClearSkyCurve
+    from .memo import CalculationMemo
+    from .solar import SolarModel
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class WindowCalculator:
+    """
+    Cover height, slat tilt and solar gain for one window.
+
+    Works on plain settings and timestamps only, so it can be built and run
+    outside Home Assistant, e.g. in a benchmark or a worker process. Each
+    calculation takes the previous snapshot and returns a new one.
+    """
+
+    def __init__(
+        self,
+        config: WindowConfig,
+        solar: SolarModel,
+        *,
+        memo: CalculationMemo | None = None,
+        clear_sky: ClearSkyCurve | None = None,
+    ) -> None:
+        """Initialize."""
+        self._config = config
+        self._solar = solar
+        self._memo = memo
+        self._clear_sky = clear_sky
+        self._geometry = WindowGeometry.from_config(config)
+        self._geometry_key = geometry_key(config)
+        self._normal = self._geometry.normal
+        self._slats = SlatTable.from_config(config) if config.tilt_mode else None
+        self._last_azimuth: float | None = None
+
+    @property
+    def config(self) -> WindowConfig:
+        """Getter for the window's settings."""
+        return self._config
+
+    @property
+    def solar(self) -> SolarModel:
+        """Getter for the sun position."""
+        return self._solar
+
+    @property
+    def tilt_mode(self) -> bool:
+        """Whether the cover's slats are tilted rather than the cover moved."""
+        return self._slats is not None
+
+    def calculate(
+        self,
+        now: datetime,
+        previous: BlindSnapshot,
+        cloud_coverage: float | None = None,
+    ) -> BlindSnapshot:
+        """
+        Solar position and geometry at `now`; safe to run in the executor.
+
+        Only touches this window's own state, so windows can be calculated
+        together in one executor job. A batch shares one `now`, so the sun
+        position is solved once for the whole batch, and windows with the same
+        geometry share one result from the memo.
+        """
+        """
+            tan(angleElevation) = windowHeight / shadedArea
+            Zones at a different height to the window, such as a desk, are
+            protected zones with their own height; see WindowGeometry.
+
+            fovleft = azimuth - fov_left
+            if attr_azimuth < fovleft:
+                early
+            elseif attr_azimuth >= fovleft and <= fovright
+                in front
+            else
+                later
+                if just moved past fovright
+                    set position to default
+            azimuth 109.7 / unknown
+            110.7 / 110.3
+        """
+
+        _last_azimuth = self.last_azimuth(now)
+        if self._memo is None:
+            result = self.solve(now, _last_azimuth)
+        else:
+            """Last azimuth only matters for whether the sun just left."""
+            result = self._memo.get(
+                (
+                    self._geometry_key,
+                    int(now.timestamp() // MEMO_BUCKET),
+                    _last_azimuth < self._config.azi_max_abs,
+                    self._solar.observation(now),
+                ),
+                lambda: self.solve(now, _last_azimuth),
+            )
+        _azimuth = result.azimuth
+        _elevation = result.elevation
+        _LOGGER.debug(
+            "Azi window-%s/min-%s/max-%s/current-%s",
+            self._config.azimuth,
+            self._config.azi_min_abs,
+            self._config.azi_max_abs,
+            round(_azimuth, 1),
+        )
+
+        _sun_state = result.sun_state
+        self._last_azimuth = _azimuth
+
+        """
+        TODO: when early, then need some default calcs, such as whatever
+        the blind position is should be the cover height and associated
+        settings...
+        That comes from coordinator.async_check_cover_state_change()
+        """
+        _cover_height = previous.cover_height
+        _cover_setting = previous.cover_setting
+        _cover_tilt = previous.cover_tilt
+        if self._slats is not None:
+            if _sun_state == StateOfSunInWindow.JUST_LEFT:
+                _cover_tilt = TILT_OPEN
+            elif _sun_state == StateOfSunInWindow.IN_FRONT:
+                _cover_tilt = round(self._slats.tilt_position(result.profile_angle))
+        if _sun_state == StateOfSunInWindow.JUST_LEFT:
+            """Need to reset the blind to its default"""
+            _cover_height = (
+                self._config.default_height * self._config.window_height / 100
+            )
+            _cover_setting = self.cover_setting(_cover_height)
+        elif _sun_state == StateOfSunInWindow.IN_FRONT:
+            """Need to calc these values, but only move if > than last cover
+            setting - CONF_DELTA_POSITION"""
+            _cover_height = result.cover_height
+            _cover_setting = self.cover_setting(_cover_height)
+
+        return BlindSnapshot(
+            now=now.isoformat(),
+            azimuth=round(_azimuth, 1),
+            elevation=round(_elevation, 1),
+            shadow_length=result.shadow_length,
+            cover_height=_cover_height,
+            cover_setting=_cover_setting,
+            cover_tilt=_cover_tilt,
+            sun_state=_sun_state,
+            sun_in_window=_sun_state == StateOfSunInWindow.IN_FRONT,
+            manual_override=previous.manual_override,
+            sun_out=True,
+            glazing_irradiance=self.glazing_irradiance(now, cloud_coverage),
+        )
+
+    def hold(
+        self,
+        now: datetime,
+        previous: BlindSnapshot,
+        cloud_coverage: float | None = None,
+    ) -> BlindSnapshot:
+        """Carry the previous snapshot forward to `now`, with the sun gone in."""
+        return replace(
+            previous,
+            now=now.isoformat(),
+            sun_out=False,
+            glazing_irradiance=self.glazing_irradiance(now, cloud_coverage),
+        )
+
+    def solve(self, now: datetime, last_azimuth: float) -> WindowResult:
+        """Everything at `now` that follows from the window's geometry alone."""
+        azimuth, elevation = self._solar.position(now)
+        return WindowResult(
+            azimuth=azimuth,
+            elevation=elevation,
+            sun_state=self.sun_in_window_state(azimuth, last_azimuth),
+            shadow_length=round(
+                self.shadow_length(float(self._config.window_height), elevation), 1
+            ),
+            cover_height=round(self._geometry.cover_height(azimuth, elevation), 1),
+            profile_angle=self._geometry.profile_angle(azimuth, elevation),
+        )
+
+    def glazing_irradiance(
+        self, now: datetime, cloud_coverage: float | None = None
+    ) -> float | None:
+        """
+        Direct sun on the glass at `now`, W/m², if a clear-sky curve is shared.
+
+        The day's curve holds the beam as a vector, so this is one dot product
+        with the window normal, scaled down by the smoothed cloud coverage when
+        there is one.
+        """
+        if self._clear_sky is None:
+            return None
+        irradiance = self._clear_sky.irradiance(now, self._normal)
+        if cloud_coverage is not None:
+            irradiance *= cloud_attenuation(cloud_coverage)
+        return round(irradiance)
+
+    def last_azimuth(self, now: datetime) -> float:
+        """Azimuth at the previous calculation, or one interval before `now`."""
+        if self._last_azimuth is None:
+            local_last = now - timedelta(minutes=self._config.delta_time)
+            _LOGGER.debug("local_last=%s", local_last)
+            self._last_azimuth = round(self._solar.position(local_last)[0], 1)
+        return float(self._last_azimuth)
+
+    def cover_setting(self, cover_height: float) -> float:
+        """Calculate cover setting % from window and cover height."""
+        return round(cover_height / self._config.window_height * 100, 0)
+
+    def shadow_length(self, window_height: float, elevation: float) -> float:
+        """Calculate shadow length from window height and sun elevation."""
+        return window_height / tan(rad(elevation))
+
+    def sun_in_window_state(
+        self, azimuth: float, last_azimuth: float
+    ) -> StateOfSunInWindow:
+        """Calculate where sun is in relation to window field of view."""
+        azi_min = self._config.azi_min_abs
+        azi_max = self._config.azi_max_abs
+        ret: StateOfSunInWindow = StateOfSunInWindow.PASSED
+        if azimuth < azi_min:
+            ret = StateOfSunInWindow.EARLY
+        elif azimuth >= azi_min and azimuth < azi_max:
+            ret = StateOfSunInWindow.IN_FRONT
+        elif last_azimuth < azi_max and azimuth >= azi_max:
+            ret = StateOfSunInWindow.JUST_LEFT
+        return ret
@@ -5,13 +5,15 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
+from .core.snapshot import BlindSnapshot  # noqa: F401 re-exported
+
 if TYPE_CHECKING:
     from homeassistant.config_entries import ConfigEntry
     from homeassistant.core import State
 
     from .api import DPKSmartBlindAPI
     from .coordinator import DPKTradingDataUpdateCoordinator
-
+    from .lifecycle import EntryLifecycle
 
 type DPKSmartBlindConfigEntry = ConfigEntry[DPKSmartBlindData]
 
@@ -23,6 +25,7 @@ class DPKSmartBlindData:
     name: str
     client: DPKSmartBlindAPI
     coordinator: DPKTradingDataUpdateCoordinator
+    lifecycle: EntryLifecycle
 
 
 @dataclass
@@ -0,0 +1,28 @@
+"""Diagnostics support for dpk_smart_blind."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+
+    from .data import DPKSmartBlindConfigEntry
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant,  # noqa: ARG001 Unused function argument: `hass`
+    entry: DPKSmartBlindConfigEntry,
+) -> dict[str, Any]:
+    """Return the blind's settings, last calculation and held handles."""
+    data = entry.runtime_data
+    coordinator = data.coordinator
+    return {
+        "options": dict(entry.options),
+        "snapshot": None if coordinator.data is None else coordinator.data.as_dict(),
+        "lifecycle": data.lifecycle.stats,
+        "command_queue": None
+        if coordinator.command_group is None
+        else coordinator.command_group.stats,
+        "travel_seconds_per_percent": dict(coordinator.travel.seconds_per_percent),
+    }
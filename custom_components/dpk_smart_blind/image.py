@@ -0,0 +1,115 @@
+"""Image platform for dpk_smart_blind."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.components.image import ImageEntity
+from homeassistant.helpers.device_registry import DeviceEntryType, DeviceInfo
+from homeassistant.helpers.event import async_track_time_change
+from homeassistant.util import dt as dt_util
+
+from .chart import async_get_sun_track, chart_directory, chart_url, write_chart
+from .const import ATTR_CHART_URL, ATTRIBUTION, DEFAULT_NAME, DOMAIN, MANUFACTURER
+from .core.chart import sun_chart_svg
+
+if TYPE_CHECKING:
+    from datetime import datetime
+
+    from homeassistant.core import HomeAssistant
+    from homeassistant.helpers.entity_platform import AddEntitiesCallback
+
+    from .core.config import WindowConfig
+    from .data import DPKSmartBlindConfigEntry
+
+CHART_NAME = "Smart Blind Sun Path"
+
+
+async def async_setup_entry(
+    hass: HomeAssistant,
+    config_entry: DPKSmartBlindConfigEntry,
+    async_add_entities: AddEntitiesCallback,
+) -> None:
+    """Set up the image platform."""
+    domain_data = config_entry.runtime_data
+    async_add_entities(
+        [
+            DPKSmartBlindSunChart(
+                hass,
+                domain_data.name,
+                config_entry.entry_id,
+                domain_data.client.calculator.config,
+            )
+        ]
+    )
+
+
+class DPKSmartBlindSunChart(ImageEntity):
+    """
+    Today's sun path against the window's field of view, as an SVG.
+
+    Rendered once when the blind is set up, which includes every options
+    change, and again at local midnight, from the day's shared sun track. The
+    SVG is also written to `www/`, so wall tablets can fetch a static file.
+    """
+
+    _attr_should_poll = False
+    _attr_attribution = ATTRIBUTION
+    _attr_content_type = "image/svg+xml"
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        name: str,
+        entry_id: str,
+        config: WindowConfig,
+    ) -> None:
+        """Initialize the image class."""
+        super().__init__(hass)
+        self._entry_id = entry_id
+        self._config = config
+        self._title = name
+        self._svg: bytes | None = None
+        self._file: str | None = None
+
+        self._attr_name = f"{name} {CHART_NAME}"
+        self._attr_unique_id = f"{entry_id}-{name}-{CHART_NAME}"
+        self._attr_device_info = DeviceInfo(
+            entry_type=DeviceEntryType.SERVICE,
+            identifiers={(DOMAIN, DEFAULT_NAME)},
+            manufacturer=MANUFACTURER,
+            name=DEFAULT_NAME,
+        )
+
+    async def async_added_to_hass(self) -> None:
+        """Render today's chart and redraw it as each day starts."""
+        await self._async_render(dt_util.now())
+        self.async_on_remove(
+            async_track_time_change(
+                self.hass, self._async_new_day, hour=0, minute=0, second=0
+            )
+        )
+
+    async def _async_new_day(self, now: datetime) -> None:
+        await self._async_render(now)
+        self.async_write_ha_state()
+
+    async def _async_render(self, now: datetime) -> None:
+        track = async_get_sun_track(self.hass).day(now)
+        svg = sun_chart_svg(track, self._config, self._title)
+        self._file = await self.hass.async_add_executor_job(
+            write_chart, chart_directory(self.hass), self._entry_id, track.day, svg
+        )
+        self._svg = svg.encode()
+        self._attr_image_last_updated = now
+
+    async def async_image(self) -> bytes | None:
+        """Return the rendered SVG."""
+        return self._svg
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return where the static copy of the chart is served."""
+        if self._file is None:
+            return {}
+        return {ATTR_CHART_URL: chart_url(self._file)}
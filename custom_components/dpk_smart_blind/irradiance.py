@@ -0,0 +1,21 @@
+"""Shared clear-sky curve for dpk_smart_blind."""
+
+from __future__ import annotations
+
+from homeassistant.core import HomeAssistant, callback
+
+from .const import DOMAIN
+from .core.irradiance import ClearSkyCurve
+from .solar import async_get_solar
+
+DATA_CLEAR_SKY = f"{DOMAIN}_clear_sky"
+
+
+@callback
+def async_get_clear_sky(hass: HomeAssistant) -> ClearSkyCurve:
+    """Return the shared clear-sky curve, created on first use."""
+    curve: ClearSkyCurve | None = hass.data.get(DATA_CLEAR_SKY)
+    if curve is None:
+        curve = ClearSkyCurve(async_get_solar(hass))
+        hass.data[DATA_CLEAR_SKY] = curve
+    return curve
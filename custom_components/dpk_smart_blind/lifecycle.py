@@ -0,0 +1,119 @@
+"""Per-entry ownership of timers and subscriptions for dpk_smart_blind."""
+
+from __future__ import annotations
+
+import inspect
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later
+
+from .const import _LOGGER
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from datetime import datetime
+
+
+class EntryLifecycle:
+    """
+    Every timer and subscription one blind holds, keyed on its purpose.
+
+    Arming a purpose that is already pending cancels the old handle first, so
+    there is never more than one wakeup or subscription per purpose. Closing
+    cancels everything, and anything armed after that is refused, so a late
+    callback during unload cannot leak a handle past the entry.
+    """
+
+    def __init__(self, hass: HomeAssistant, name: str) -> None:
+        """Initialize."""
+        self._hass = hass
+        self._name = name
+        self._subscriptions: dict[str, Callable[[], Any]] = {}
+        self._timers: dict[str, CALLBACK_TYPE] = {}
+        self._closed = False
+        self._armed = 0
+        self._fired = 0
+        self._cancelled = 0
+
+    @callback
+    def async_add(self, purpose: str, unsubscribe: Callable[[], Any]) -> None:
+        """Own a subscription; its unsubscribe may return a coroutine."""
+        if self._refuse(purpose):
+            self._release(unsubscribe)
+            return
+        if (previous := self._subscriptions.pop(purpose, None)) is not None:
+            self._cancelled += 1
+            self._release(previous)
+        self._subscriptions[purpose] = unsubscribe
+        self._armed += 1
+
+    @callback
+    def async_call_later(
+        self, purpose: str, delay: float, action: Callable[[datetime], Any]
+    ) -> None:
+        """Arm the wakeup for `purpose`, replacing one still pending."""
+        if self._refuse(purpose):
+            return
+        self.async_cancel(purpose)
+
+        @callback
+        def fire(now: datetime) -> None:
+            self._timers.pop(purpose, None)
+            self._fired += 1
+            action(now)
+
+        self._timers[purpose] = async_call_later(self._hass, delay, fire)
+        self._armed += 1
+
+    @callback
+    def async_cancel(self, purpose: str) -> bool:
+        """Cancel a pending wakeup or subscription; True if there was one."""
+        if (timer := self._timers.pop(purpose, None)) is not None:
+            timer()
+        elif (unsubscribe := self._subscriptions.pop(purpose, None)) is not None:
+            self._release(unsubscribe)
+        else:
+            return False
+        self._cancelled += 1
+        return True
+
+    def pending(self, purpose: str) -> bool:
+        """Whether a wakeup or subscription is held for `purpose`."""
+        return purpose in self._timers or purpose in self._subscriptions
+
+    async def async_close(self) -> None:
+        """Cancel everything, newest first, and refuse anything armed later."""
+        self._closed = True
+        for purpose in reversed([*self._subscriptions, *self._timers]):
+            if (timer := self._timers.pop(purpose, None)) is not None:
+                timer()
+            elif (unsubscribe := self._subscriptions.pop(purpose, None)) is not None:
+                result = unsubscribe()
+                if inspect.iscoroutine(result):
+                    await result
+            self._cancelled += 1
+        _LOGGER.debug("%s: lifecycle closed; %s", self._name, self.stats)
+
+    @property
+    def stats(self) -> dict[str, Any]:
+        """Outstanding handles and lifetime counts, for diagnostics."""
+        return {
+            "closed": self._closed,
+            "subscriptions": len(self._subscriptions),
+            "timers": len(self._timers),
+            "pending": sorted([*self._subscriptions, *self._timers]),
+            "armed": self._armed,
+            "fired": self._fired,
+            "cancelled": self._cancelled,
+        }
+
+    def _refuse(self, purpose: str) -> bool:
+        if self._closed:
+            _LOGGER.debug("%s: refusing %s after unload", self._name, purpose)
+        return self._closed
+
+    def _release(self, unsubscribe: Callable[[], Any]) -> None:
+        result = unsubscribe()
+        if inspect.iscoroutine(result):
+            self._hass.async_create_task(result)
@@ -0,0 +1,20 @@
+"""Shared calculation memo for dpk_smart_blind."""
+
+from __future__ import annotations
+
+from homeassistant.core import HomeAssistant, callback
+
+from .const import DOMAIN
+from .core.memo import CalculationMemo
+
+DATA_MEMO = f"{DOMAIN}_memo"
+
+
+@callback
+def async_get_memo(hass: HomeAssistant) -> CalculationMemo:
+    """Return the shared calculation memo."""
+    memo: CalculationMemo | None = hass.data.get(DATA_MEMO)
+    if memo is None:
+        memo = CalculationMemo()
+        hass.data[DATA_MEMO] = memo
+    return memo
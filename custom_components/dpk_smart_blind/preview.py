@@ -0,0 +1,151 @@
+"""Cover curve preview for dpk_smart_blind."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import date, datetime, time, timedelta
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+
+from .api import window_config
+from .const import CONF_DELTA_POSITION, CONF_DELTA_TILT, DEFAULT_DELTA_TILT
+from .core.const import StateOfSunInWindow
+from .core.decision import CoverPolicy
+from .core.snapshot import BlindSnapshot
+from .core.solar import SolarModel, solar_position
+from .core.window import WindowCalculator
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+    from zoneinfo import ZoneInfo
+
+    from astral import Observer
+
+PREVIEW_STEP = timedelta(minutes=10)
+PREVIEW_TABLE_STEP = 3  # every third sample, i.e. half-hourly
+
+
+@dataclass(frozen=True, slots=True)
+class SolarTrack:
+    """Sun position sampled over one local day."""
+
+    times: list[datetime]
+    azimuth: np.ndarray
+    elevation: np.ndarray
+
+
+@dataclass(frozen=True, slots=True)
+class CoverCurve:
+    """Cover positions, or tilts, the integration would command over a day."""
+
+    times: list[datetime]
+    positions: np.ndarray  # NaN where the cover is left alone
+    entry: datetime | None
+    exit: datetime | None
+    tilt: bool = False  # positions are slat tilts
+
+
+def solar_track(
+    observer: Observer,
+    day: date,
+    tz: ZoneInfo,
+    step: timedelta = PREVIEW_STEP,
+) -> SolarTrack:
+    """
+    Sample azimuth and elevation across a local day in one vectorised pass.
+
+    Samples are taken on absolute time from midnight to the next midnight, so
+    a day with a clock change has 23 or 25 hours of them, and each is labelled
+    with its own local time.
+    """
+    start = datetime.combine(day, time.min, tz).timestamp()
+    end = datetime.combine(day + timedelta(days=1), time.min, tz).timestamp()
+    timestamps = np.arange(start, end, step.total_seconds())
+    azimuth, elevation = solar_position(
+        timestamps, observer.latitude, observer.longitude
+    )
+    times = [datetime.fromtimestamp(timestamp, tz) for timestamp in timestamps]
+    return SolarTrack(times, azimuth, elevation)
+
+
+class _TrackSolar(SolarModel):
+    """Sun position served from the day's track, solved for anything else."""
+
+    def __init__(self, observer: Observer, track: SolarTrack) -> None:
+        """Initialize."""
+        super().__init__(observer, track.times[0].tzinfo)
+        self._samples = {
+            t.timestamp(): position
+            for t, position in zip(
+                track.times,
+                zip(track.azimuth.tolist(), track.elevation.tolist(), strict=True),
+                strict=True,
+            )
+        }
+
+    def observation(self, when: datetime) -> tuple[float, float] | None:
+        """Return the track's sample at `when`, if there is one."""
+        return self._samples.get(when.timestamp())
+
+
+def cover_curve(
+    options: Mapping[str, Any], track: SolarTrack, observer: Observer
+) -> CoverCurve:
+    """
+    Run the day's samples through the window's calculator and cover policy.
+
+    Each sample is a tick with the sun out, and the cover is taken to be
+    wherever it was last sent, so the curve holds what the cover would do:
+    left alone until the sun arrives, stepped to follow it, and back to its
+    default once the sun has left. Tilt-mode windows preview the slat tilt.
+    """
+    calculator = WindowCalculator(window_config(options), _TrackSolar(observer, track))
+    policy = CoverPolicy(
+        "preview",
+        options[CONF_DELTA_POSITION],
+        options.get(CONF_DELTA_TILT, DEFAULT_DELTA_TILT),
+    )
+    positions = np.full(len(track.times), np.nan)
+    data = BlindSnapshot()
+    cover: int | None = None
+    entry = exit_ = None
+    for index, now in enumerate(track.times):
+        data = calculator.calculate(now, data)
+        if data.sun_state == StateOfSunInWindow.IN_FRONT and entry is None:
+            entry = now
+        elif data.sun_state == StateOfSunInWindow.JUST_LEFT and exit_ is None:
+            exit_ = now
+        if calculator.tilt_mode:
+            target = policy.tilt_target(data, cover)
+        else:
+            target = policy.position_target(data, cover, None)
+        if target is not None:
+            cover = target
+        if cover is not None:
+            positions[index] = cover
+    return CoverCurve(track.times, positions, entry, exit_, calculator.tilt_mode)
+
+
+def preview_placeholders(curve: CoverCurve) -> dict[str, str]:
+    """Render a curve as options flow description placeholders."""
+    heading = "Tilt" if curve.tilt else "Position"
+    rows = [
+        f"| {t:%H:%M} | {p:.0f}% |"
+        for t, p in zip(
+            curve.times[::PREVIEW_TABLE_STEP],
+            curve.positions[::PREVIEW_TABLE_STEP],
+            strict=True,
+        )
+        if curve.entry is not None
+        and curve.entry <= t
+        and (curve.exit is None or t <= curve.exit)
+    ]
+    return {
+        "date": f"{curve.times[0]:%Y-%m-%d}",
+        "entry": "-" if curve.entry is None else f"{curve.entry:%H:%M}",
+        "exit": "-" if curve.exit is None else f"{curve.exit:%H:%M}",
+        "curve": "\n".join([f"| Time | {heading} |", "| --- | --- |", *rows])
+        if rows
+        else "The sun does not enter the field of view on this day.",
+    }
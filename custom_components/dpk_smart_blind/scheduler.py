@@ -0,0 +1,105 @@
+"""Domain-wide tick scheduler for dpk_smart_blind."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.dispatcher import async_dispatcher_send
+from homeassistant.helpers.event import async_track_time_change
+
+from .const import _LOGGER, DOMAIN, SIGNAL_SUN_POSITION
+from .solar import async_get_solar
+
+if TYPE_CHECKING:
+    from datetime import datetime
+
+    from .coordinator import DPKTradingDataUpdateCoordinator
+
+DATA_SCHEDULER = f"{DOMAIN}_scheduler"
+
+# Ticks fall on wall-clock boundaries: :00, :05, :10, ...
+TICK_MINUTES = 5
+
+
+class TickScheduler:
+    """
+    One timer that refreshes every blind on the same wall-clock tick.
+
+    All refreshes start in the same loop iteration, so the batcher runs the
+    whole tick as one batch. Coordinators only notify their entities when a
+    decision output differs from the previous tick; the sun moving on its own
+    does not count (see BlindSnapshot). A blind whose cover is still
+    travelling sits the tick out and refreshes when it arrives.
+
+    The sun position is published from here rather than from the blinds, as
+    it does not depend on any blind's weather gating.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize."""
+        self._hass = hass
+        self._coordinators: set[DPKTradingDataUpdateCoordinator] = set()
+        self._timer_unsub: CALLBACK_TYPE | None = None
+
+    @callback
+    def async_register(
+        self, coordinator: DPKTradingDataUpdateCoordinator
+    ) -> CALLBACK_TYPE:
+        """Refresh `coordinator` on every tick; return a callable to stop."""
+        self._coordinators.add(coordinator)
+        if self._timer_unsub is None:
+            self._timer_unsub = async_track_time_change(
+                self._hass, self._async_tick, minute=f"/{TICK_MINUTES}", second=0
+            )
+
+        @callback
+        def remove() -> None:
+            self._coordinators.discard(coordinator)
+            if not self._coordinators and self._timer_unsub is not None:
+                self._timer_unsub()
+                self._timer_unsub = None
+
+        return remove
+
+    @callback
+    def _async_tick(self, now: datetime) -> None:
+        """Time-change listeners run in the background; refresh as a tracked task."""
+        async_dispatcher_send(
+            self._hass, SIGNAL_SUN_POSITION, async_get_solar(self._hass).position(now)
+        )
+        coordinators = [
+            coordinator
+            for coordinator in self._coordinators
+            if not coordinator.async_defer_while_travelling()
+        ]
+        _LOGGER.debug("tick: refreshing %d blinds", len(coordinators))
+        self._hass.async_create_task(
+            self._async_refresh(coordinators), f"{DOMAIN} tick"
+        )
+
+    @staticmethod
+    async def _async_refresh(
+        coordinators: list[DPKTradingDataUpdateCoordinator],
+    ) -> None:
+        """Refresh every blind, logging any that fail without stopping the rest."""
+        results = await asyncio.gather(
+            *(coordinator.async_refresh() for coordinator in coordinators),
+            return_exceptions=True,
+        )
+        for coordinator, result in zip(coordinators, results, strict=True):
+            if isinstance(result, BaseException):
+                _LOGGER.error(
+                    "%s: tick refresh failed", coordinator.name, exc_info=result
+                )
+
+
+@callback
+def async_get_tick_scheduler(hass: HomeAssistant) -> TickScheduler:
+    """Return the shared tick scheduler."""
+    scheduler: TickScheduler | None = hass.data.get(DATA_SCHEDULER)
+    if scheduler is None:
+        scheduler = TickScheduler(hass)
+        hass.data[DATA_SCHEDULER] = scheduler
+    return scheduler
@@ -12,32 +12,55 @@ from homeassistant.components.sensor.const import SensorDeviceClass, SensorState
 from homeassistant.const import (
     DEGREE,
     PERCENTAGE,
+    EntityCategory,
+    UnitOfIrradiance,
     UnitOfLength,
+    UnitOfTime,
 )
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.device_registry import DeviceEntryType, DeviceInfo
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
+from homeassistant.util import dt as dt_util
 
 from .const import (
-    _LOGGER,
     ATTR_AZIMUTH,
+    ATTR_CLOUD_COVERAGE,
+    ATTR_COMMAND_QUEUE,
     ATTR_COVER_HEIGHT,
     ATTR_COVER_SETTING,
+    ATTR_COVER_TILT,
     ATTR_ELEVATION,
+    ATTR_GLAZING_IRRADIANCE,
+    ATTR_HISTORY,
+    ATTR_IRRADIANCE,
+    ATTR_MOVES_TODAY,
     ATTR_NOW,
+    ATTR_OVERRIDES_TODAY,
+    ATTR_POSITION_MINUTES,
     ATTR_SHADOW_LENGTH,
+    ATTR_SUN_IN_WINDOW_TODAY,
+    ATTR_SUN_OUT,
     ATTR_SUN_STATE,
+    ATTR_TRAVEL_TIME,
     ATTRIBUTION,
     DEFAULT_NAME,
     DOMAIN,
     MANUFACTURER,
+    SIGNAL_ANALYTICS,
+    SIGNAL_SUN_POSITION,
 )
 from .coordinator import DPKTradingDataUpdateCoordinator
+from .solar import async_get_solar
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
     from homeassistant.core import HomeAssistant
     from homeassistant.helpers.entity_platform import AddEntitiesCallback
+    from homeassistant.helpers.typing import ConfigType, DiscoveryInfoType
 
+    from .analytics import BlindAnalytics, DailyTotals
     from .data import DPKSmartBlindConfigEntry
 
 SENSOR_TYPES: tuple[SensorEntityDescription, ...] = (
@@ -48,6 +71,8 @@ SENSOR_TYPES: tuple[SensorEntityDescription, ...] = (
         device_class=SensorDeviceClass.DISTANCE,
         state_class=SensorStateClass.MEASUREMENT,
         native_unit_of_measurement=UnitOfLength.METERS,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
     ),
     SensorEntityDescription(
         key=ATTR_ELEVATION,
@@ -55,6 +80,8 @@ SENSOR_TYPES: tuple[SensorEntityDescription, ...] = (
         icon="mdi:sun-angle",
         native_unit_of_measurement=DEGREE,
         state_class=SensorStateClass.MEASUREMENT,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
     ),
     SensorEntityDescription(
         key=ATTR_AZIMUTH,
@@ -62,6 +89,8 @@ SENSOR_TYPES: tuple[SensorEntityDescription, ...] = (
         icon="mdi:sun-angle",
         native_unit_of_measurement=DEGREE,
         state_class=SensorStateClass.MEASUREMENT,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
     ),
     SensorEntityDescription(
         key=ATTR_COVER_SETTING,
@@ -70,8 +99,90 @@ SENSOR_TYPES: tuple[SensorEntityDescription, ...] = (
         native_unit_of_measurement=PERCENTAGE,
         state_class=SensorStateClass.MEASUREMENT,
     ),
+    SensorEntityDescription(
+        key=ATTR_GLAZING_IRRADIANCE,
+        name="Smart Blind Solar Gain",
+        icon="mdi:sun-thermometer",
+        device_class=SensorDeviceClass.IRRADIANCE,
+        native_unit_of_measurement=UnitOfIrradiance.WATTS_PER_SQUARE_METER,
+        state_class=SensorStateClass.MEASUREMENT,
+    ),
+)
+
+# Only blinds in tilt mode have slats to report.
+TILT_SENSOR_TYPES: tuple[SensorEntityDescription, ...] = (
+    SensorEntityDescription(
+        key=ATTR_COVER_TILT,
+        name="Smart Blind Tilt",
+        icon="mdi:blinds-horizontal",
+        native_unit_of_measurement=PERCENTAGE,
+        state_class=SensorStateClass.MEASUREMENT,
+    ),
+)
+
+# Daily totals reset at local midnight, which the recorder treats as a reset.
+ANALYTICS_SENSOR_TYPES: tuple[SensorEntityDescription, ...] = (
+    SensorEntityDescription(
+        key=ATTR_SUN_IN_WINDOW_TODAY,
+        name="Smart Blind Sun In Window Today",
+        icon="mdi:sun-clock",
+        device_class=SensorDeviceClass.DURATION,
+        native_unit_of_measurement=UnitOfTime.MINUTES,
+        state_class=SensorStateClass.TOTAL_INCREASING,
+    ),
+    SensorEntityDescription(
+        key=ATTR_MOVES_TODAY,
+        name="Smart Blind Moves Today",
+        icon="mdi:blinds-open",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+    ),
+    SensorEntityDescription(
+        key=ATTR_OVERRIDES_TODAY,
+        name="Smart Blind Overrides Today",
+        icon="mdi:hand-back-right",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+    ),
 )
 
+ANALYTICS_VALUES: dict[str, Callable[[DailyTotals], int]] = {
+    ATTR_SUN_IN_WINDOW_TODAY: lambda totals: totals.sun_in_window_minutes,
+    ATTR_MOVES_TODAY: lambda totals: totals.moves,
+    ATTR_OVERRIDES_TODAY: lambda totals: totals.overrides,
+}
+
+# Sun position is the same for every blind, so it is published once.
+SUN_SENSOR_TYPES: tuple[SensorEntityDescription, ...] = (
+    SensorEntityDescription(
+        key=ATTR_ELEVATION,
+        name="Smart Blind Sun Elevation",
+        icon="mdi:sun-angle",
+        native_unit_of_measurement=DEGREE,
+        state_class=SensorStateClass.MEASUREMENT,
+    ),
+    SensorEntityDescription(
+        key=ATTR_AZIMUTH,
+        name="Smart Blind Sun Azimuth",
+        icon="mdi:sun-angle",
+        native_unit_of_measurement=DEGREE,
+        state_class=SensorStateClass.MEASUREMENT,
+    ),
+)
+
+# Position in the (azimuth, elevation) pair the scheduler publishes.
+SUN_POSITION_INDEX = {ATTR_AZIMUTH: 0, ATTR_ELEVATION: 1}
+
+
+async def async_setup_platform(
+    hass: HomeAssistant,  # noqa: ARG001 Unused function argument: `hass`
+    config: ConfigType,  # noqa: ARG001 Unused function argument: `config`
+    async_add_entities: AddEntitiesCallback,
+    discovery_info: DiscoveryInfoType | None = None,
+) -> None:
+    """Set up the domain-level sun position sensors."""
+    if discovery_info is None:
+        return
+    async_add_entities(DPKSmartBlindSunSensor(sensor) for sensor in SUN_SENSOR_TYPES)
+
 
 async def async_setup_entry(
     hass: HomeAssistant,  # noqa: ARG001 Unused function argument: `hass`
@@ -92,7 +203,17 @@ async def async_setup_entry(
         )
         for sensor in SENSOR_TYPES
     ]
+    if coordinator.eto_client.tilt_mode:
+        entities.extend(
+            DPKSmartBlindSensor(name, config_entry.entry_id, sensor, coordinator)
+            for sensor in TILT_SENSOR_TYPES
+        )
     async_add_entities(entities)
+    if (analytics := coordinator.analytics) is not None:
+        async_add_entities(
+            DPKSmartBlindAnalyticsSensor(name, config_entry.entry_id, sensor, analytics)
+            for sensor in ANALYTICS_SENSOR_TYPES
+        )
 
 
 class DPKSmartBlindSensor(
@@ -144,18 +265,136 @@ class DPKSmartBlindSensor(
     @property
     def native_value(self) -> str | None:
         """Return the native value of the sensor."""
-        return self._coordinator.data.get(self._key)
+        return self._coordinator.data[self._key]
 
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
         """Return the device specific state attributes."""
         attributes: dict[str, Any] = {}
         if self._key == ATTR_SHADOW_LENGTH:
-            attributes[ATTR_NOW] = self._coordinator.data[ATTR_NOW]
-            attributes[ATTR_AZIMUTH] = self._coordinator.data[ATTR_AZIMUTH]
-            attributes[ATTR_ELEVATION] = self._coordinator.data[ATTR_ELEVATION]
-            attributes[ATTR_COVER_HEIGHT] = self._coordinator.data[ATTR_COVER_HEIGHT]
-            attributes[ATTR_COVER_SETTING] = self._coordinator.data[ATTR_COVER_SETTING]
-            attributes[ATTR_SUN_STATE] = self._coordinator.data[ATTR_SUN_STATE]
+            snapshot = self._coordinator.data
+            attributes[ATTR_NOW] = snapshot.now
+            attributes[ATTR_AZIMUTH] = snapshot.azimuth
+            attributes[ATTR_ELEVATION] = snapshot.elevation
+            attributes[ATTR_COVER_HEIGHT] = snapshot.cover_height
+            attributes[ATTR_COVER_SETTING] = snapshot.cover_setting
+            attributes[ATTR_SUN_STATE] = snapshot.sun_state
+            attributes[ATTR_SUN_OUT] = snapshot.sun_out
+            if (sun_filter := self._coordinator.sun_filter) is not None:
+                attributes[ATTR_CLOUD_COVERAGE] = sun_filter.cloud_coverage
+                attributes[ATTR_IRRADIANCE] = sun_filter.irradiance
+        elif self._key == ATTR_COVER_SETTING:
+            if self._coordinator.command_group is not None:
+                attributes[ATTR_COMMAND_QUEUE] = self._coordinator.command_group.stats
+            attributes[ATTR_TRAVEL_TIME] = dict(
+                self._coordinator.travel.seconds_per_percent
+            )
+        elif self._key == ATTR_GLAZING_IRRADIANCE:
+            if (sun_filter := self._coordinator.sun_filter) is not None:
+                attributes[ATTR_CLOUD_COVERAGE] = sun_filter.cloud_coverage
+
+        return attributes
+
+
+class DPKSmartBlindSunSensor(SensorEntity):
+    """Sun position shared by every blind."""
+
+    _attr_should_poll = False
+    _attr_attribution = ATTRIBUTION
+
+    def __init__(self, sensor: SensorEntityDescription) -> None:
+        """Initialize the sensor class."""
+        self.entity_description = sensor
+        self._key = sensor.key
+        self._attr_name = sensor.name
+        self._attr_unique_id = f"{DOMAIN}-sun-{sensor.key}"
+        self._attr_device_info = DeviceInfo(
+            entry_type=DeviceEntryType.SERVICE,
+            identifiers={(DOMAIN, DEFAULT_NAME)},
+            manufacturer=MANUFACTURER,
+            name=DEFAULT_NAME,
+        )
+
+    async def async_added_to_hass(self) -> None:
+        """Start from the shared sun position and follow each tick's."""
+        position = async_get_solar(self.hass).position(dt_util.now())
+        self._attr_native_value = round(position[SUN_POSITION_INDEX[self._key]], 1)
+        self.async_on_remove(
+            async_dispatcher_connect(
+                self.hass, SIGNAL_SUN_POSITION, self._async_sun_position
+            )
+        )
+
+    @callback
+    def _async_sun_position(self, position: tuple[float, float]) -> None:
+        """Follow the tick's position, whatever the weather; write when it moves."""
+        value = round(position[SUN_POSITION_INDEX[self._key]], 1)
+        if value == self._attr_native_value:
+            return
+        self._attr_native_value = value
+        self.async_write_ha_state()
+
+
+class DPKSmartBlindAnalyticsSensor(SensorEntity):
+    """Today's running total for one blind, with the last days as history."""
 
+    _attr_should_poll = False
+    _attr_attribution = ATTRIBUTION
+    # Resent whole on every change; the totals themselves are the record.
+    _unrecorded_attributes = frozenset({ATTR_HISTORY, ATTR_POSITION_MINUTES})
+
+    def __init__(
+        self,
+        name: str,
+        entry_id: str,
+        sensor: SensorEntityDescription,
+        analytics: BlindAnalytics,
+    ) -> None:
+        """Initialize the sensor class."""
+        self.entity_description = sensor
+        self._key = sensor.key
+        self._entry_id = entry_id
+        self._analytics = analytics
+        self._value = ANALYTICS_VALUES[sensor.key]
+
+        self._attr_name = f"{name} {sensor.name}"
+        self._attr_unique_id = f"{entry_id}-{name}-{sensor.name}"
+        self._attr_device_info = DeviceInfo(
+            entry_type=DeviceEntryType.SERVICE,
+            identifiers={(DOMAIN, DEFAULT_NAME)},
+            manufacturer=MANUFACTURER,
+            name=DEFAULT_NAME,
+        )
+        self._attr_native_value = self._value(analytics.today)
+
+    async def async_added_to_hass(self) -> None:
+        """Listen for the blind's accumulators changing."""
+        self.async_on_remove(
+            async_dispatcher_connect(
+                self.hass,
+                SIGNAL_ANALYTICS.format(self._entry_id),
+                self._async_analytics_changed,
+            )
+        )
+
+    @callback
+    def _async_analytics_changed(self, rolled_over: bool = False) -> None:  # noqa: FBT001, FBT002
+        """Most ticks leave a given total alone; only write when it moves."""
+        value = self._value(self._analytics.today)
+        if value == self._attr_native_value and not rolled_over:
+            return
+        self._attr_native_value = value
+        self.async_write_ha_state()
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return the closed days, and today's time at each position."""
+        attributes: dict[str, Any] = {
+            ATTR_HISTORY: {
+                f"{totals.day}": self._value(totals)
+                for totals in self._analytics.history
+            }
+        }
+        if self._key == ATTR_MOVES_TODAY:
+            attributes[ATTR_POSITION_MINUTES] = self._analytics.today.position_minutes
         return attributes
@@ -0,0 +1,83 @@
+"""Domain-wide settings for dpk_smart_blind."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+
+from .batch import async_get_batcher
+from .const import (
+    CONF_EXECUTOR_THRESHOLD,
+    CONF_SUN_POSITION_ENTITY,
+    DEFAULT_EXECUTOR_THRESHOLD,
+    DOMAIN,
+    SUN_ENTITY,
+)
+from .solar import async_get_solar
+
+DATA_SETTINGS = f"{DOMAIN}_settings"
+STORAGE_KEY = f"{DOMAIN}.settings"
+STORAGE_VERSION = 1
+
+DEFAULT_SETTINGS: dict[str, Any] = {
+    CONF_EXECUTOR_THRESHOLD: DEFAULT_EXECUTOR_THRESHOLD,
+    CONF_SUN_POSITION_ENTITY: False,
+}
+
+
+class DomainSettings:
+    """
+    Settings shared by every blind, stored once for the domain.
+
+    They are edited from the "Shared settings" step of any blind's options
+    and applied to the running batcher and sun position straight away, so no
+    blind needs reloading.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize."""
+        self._hass = hass
+        self._store: Store[dict[str, Any]] = Store(hass, STORAGE_VERSION, STORAGE_KEY)
+        self.data: dict[str, Any] = dict(DEFAULT_SETTINGS)
+
+    @property
+    def executor_threshold(self) -> int:
+        """Batch size from which calculations are sent to the executor."""
+        return int(self.data[CONF_EXECUTOR_THRESHOLD])
+
+    @property
+    def sun_position_from_entity(self) -> bool:
+        """Whether sun.sun's published position is used."""
+        return bool(self.data[CONF_SUN_POSITION_ENTITY])
+
+    async def async_load(self) -> None:
+        """Read the stored settings and apply them."""
+        self.data.update(await self._store.async_load() or {})
+        self.async_apply()
+
+    async def async_update(self, data: dict[str, Any]) -> None:
+        """Store new settings and apply them."""
+        self.data.update(data)
+        await self._store.async_save(self.data)
+        self.async_apply()
+
+    @callback
+    def async_apply(self) -> None:
+        """Hand the settings to the shared batcher and sun position."""
+        async_get_batcher(self._hass).threshold = self.executor_threshold
+        async_get_solar(self._hass).async_set_from_entity(
+            self._hass.states.get(SUN_ENTITY),
+            from_entity=self.sun_position_from_entity,
+        )
+
+
+@callback
+def async_get_settings(hass: HomeAssistant) -> DomainSettings:
+    """Return the shared domain settings."""
+    settings: DomainSettings | None = hass.data.get(DATA_SETTINGS)
+    if settings is None:
+        settings = DomainSettings(hass)
+        hass.data[DATA_SETTINGS] = settings
+    return settings
@@ -0,0 +1,92 @@
+"""Shared sun position for dpk_smart_blind."""
+
+from __future__ import annotations
+
+from datetime import timedelta
+from typing import TYPE_CHECKING
+from zoneinfo import ZoneInfo
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.sun import get_astral_location
+
+from .const import ATTR_AZIMUTH, ATTR_ELEVATION, DOMAIN
+from .core.solar import SolarModel
+
+if TYPE_CHECKING:
+    from datetime import datetime
+
+    from astral import Observer
+    from homeassistant.core import State
+
+DATA_SOLAR = f"{DOMAIN}_solar"
+
+# A published sun.sun position stands in for our own solve this close to it.
+SUN_ENTITY_TOLERANCE = timedelta(seconds=60)
+
+
+class SolarPosition(SolarModel):
+    """
+    Sun position at the home location, shared by every blind.
+
+    All blinds look out from the same place, so a position worked out for one
+    timestamp is reused by every other blind asking for that timestamp.
+
+    With `from_entity`, the azimuth and elevation sun.sun publishes are taken
+    as they arrive and used for calculations close to that moment; astral is
+    only solved between updates, e.g. for the position a few minutes back.
+    """
+
+    def __init__(
+        self, observer: Observer, time_zone: ZoneInfo, *, from_entity: bool = False
+    ) -> None:
+        """Initialize."""
+        super().__init__(observer, time_zone)
+        self._from_entity = from_entity
+        self._observed: tuple[datetime, float, float] | None = None
+
+    @property
+    def from_entity(self) -> bool:
+        """Whether sun.sun's published position is used."""
+        return self._from_entity
+
+    @callback
+    def async_set_from_entity(self, state: State | None, *, from_entity: bool) -> None:
+        """Switch to or from sun.sun's position, starting from its `state`."""
+        self._from_entity = from_entity
+        self._observed = None
+        self.async_observe(state)
+
+    @callback
+    def async_observe(self, state: State | None) -> bool:
+        """Take the position from a sun.sun state; False when not usable."""
+        if not self._from_entity or state is None:
+            return False
+        try:
+            azimuth = float(state.attributes[ATTR_AZIMUTH])
+            elevation = float(state.attributes[ATTR_ELEVATION])
+        except (KeyError, TypeError, ValueError):
+            return False
+        self._observed = (state.last_updated, azimuth, elevation)
+        return True
+
+    def observation(self, when: datetime) -> tuple[float, float] | None:
+        """sun.sun's (azimuth, elevation) if published close enough to `when`."""
+        observed = self._observed
+        if observed is not None and abs(when - observed[0]) <= SUN_ENTITY_TOLERANCE:
+            return observed[1], observed[2]
+        return None
+
+
+@callback
+def async_get_solar(hass: HomeAssistant, *, from_entity: bool = False) -> SolarPosition:
+    """Return the shared sun position, created on first use."""
+    solar: SolarPosition | None = hass.data.get(DATA_SOLAR)
+    if solar is None:
+        location, _ = get_astral_location(hass)
+        solar = SolarPosition(
+            location.observer,
+            ZoneInfo(hass.config.time_zone),
+            from_entity=from_entity,
+        )
+        hass.data[DATA_SOLAR] = solar
+    return solar
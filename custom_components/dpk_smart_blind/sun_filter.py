@@ -0,0 +1,252 @@
+"""Smoothed weather gating for dpk_smart_blind."""
+
+from __future__ import annotations
+
+import math
+from typing import TYPE_CHECKING
+
+from homeassistant.components.weather import ATTR_WEATHER_CLOUD_COVERAGE
+from homeassistant.const import STATE_UNAVAILABLE, STATE_UNKNOWN
+
+from .const import (
+    _LOGGER,
+    CONF_CLOUD_ENTER,
+    CONF_CLOUD_EXIT,
+    CONF_IRRADIANCE_ENTER,
+    CONF_IRRADIANCE_ENTITY,
+    CONF_IRRADIANCE_EXIT,
+    CONF_SUN_HIDDEN_DWELL,
+    CONF_SUN_OUT_DWELL,
+    CONF_WEATHER_ENTITY,
+    CONF_WEATHER_SMOOTHING,
+    CONF_WEATHER_STATE,
+    DEFAULT_CLOUD_ENTER,
+    DEFAULT_CLOUD_EXIT,
+    DEFAULT_IRRADIANCE_ENTER,
+    DEFAULT_IRRADIANCE_EXIT,
+    DEFAULT_SUN_HIDDEN_DWELL,
+    DEFAULT_SUN_OUT_DWELL,
+    DEFAULT_WEATHER_SMOOTHING,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+    from typing import Any
+
+    from homeassistant.core import State
+
+
+class HysteresisFilter:
+    """
+    Exponentially weighted moving average with a two-threshold latch.
+
+    The average is time-weighted, so irregular sample intervals are handled
+    without keeping any history. The latch turns on once the average crosses
+    `enter` and off again once it crosses `exit`, and each state must be held
+    for its minimum dwell before it may flip. With `on_below` set, low values
+    turn the latch on (cloud coverage); otherwise high values do (irradiance).
+    """
+
+    __slots__ = (
+        "_dwell_off",
+        "_dwell_on",
+        "_enter",
+        "_exit",
+        "_on_below",
+        "_tau",
+        "changed_at",
+        "is_on",
+        "sample",
+        "updated_at",
+        "value",
+    )
+
+    def __init__(  # noqa: PLR0913
+        self,
+        enter: float,
+        exit: float,  # noqa: A002
+        tau: float,
+        dwell_on: float,
+        dwell_off: float,
+        *,
+        on_below: bool,
+    ) -> None:
+        """Initialize."""
+        self._enter = enter
+        self._exit = exit
+        self._tau = tau
+        self._dwell_on = dwell_on
+        self._dwell_off = dwell_off
+        self._on_below = on_below
+        self.value: float | None = None
+        self.sample: float | None = None
+        self.updated_at = 0.0
+        self.changed_at = 0.0
+        self.is_on = False
+
+    def update(self, sample: float, now: float) -> bool:
+        """Feed a sample taken at `now` (seconds); return the latched state."""
+        self.sample = sample
+        if self.value is None:
+            """First sample decides the state outright; nothing to dwell on."""
+            self.value = sample
+            self.is_on = self._on_side(self._enter)
+            self.changed_at = now
+        else:
+            elapsed = max(0.0, now - self.updated_at)
+            alpha = 1.0 if self._tau <= 0 else 1.0 - math.exp(-elapsed / self._tau)
+            self.value += alpha * (sample - self.value)
+            held = now - self.changed_at
+            if self.is_on:
+                if held >= self._dwell_on and not self._on_side(self._exit):
+                    self.is_on = False
+                    self.changed_at = now
+            elif held >= self._dwell_off and self._on_side(self._enter):
+                self.is_on = True
+                self.changed_at = now
+        self.updated_at = now
+        return self.is_on
+
+    def advance(self, now: float) -> bool:
+        """
+        Hold the last sample until `now`; return the latched state.
+
+        A source that stays quiet still moves the average towards its last
+        value, and lets a dwell that has run out take effect.
+        """
+        if self.sample is None:
+            return self.is_on
+        return self.update(self.sample, now)
+
+    def flip_due(self, now: float) -> float | None:
+        """Seconds until the latch may flip, if the average already calls for it."""
+        if self.value is None:
+            return None
+        if self.is_on:
+            if self._on_side(self._exit):
+                return None
+            dwell = self._dwell_on
+        else:
+            if not self._on_side(self._enter):
+                return None
+            dwell = self._dwell_off
+        return max(0.0, dwell - (now - self.changed_at))
+
+    def clear(self) -> None:
+        """Forget every sample, as if the source had never reported."""
+        self.value = None
+        self.sample = None
+        self.is_on = False
+
+    def _on_side(self, threshold: float) -> bool:
+        if self._on_below:
+            return self.value <= threshold  # type: ignore[operator]
+        return self.value >= threshold  # type: ignore[operator]
+
+
+class SunOutFilter:
+    """Decide whether the sun is effectively out for a blind."""
+
+    __slots__ = ("_cloud", "_irradiance", "_states")
+
+    def __init__(self, options: Mapping[str, Any]) -> None:
+        """Initialize from config entry options."""
+        tau = options.get(CONF_WEATHER_SMOOTHING, DEFAULT_WEATHER_SMOOTHING) * 60
+        dwell_on = options.get(CONF_SUN_OUT_DWELL, DEFAULT_SUN_OUT_DWELL) * 60
+        dwell_off = options.get(CONF_SUN_HIDDEN_DWELL, DEFAULT_SUN_HIDDEN_DWELL) * 60
+        self._states: list[str] = options.get(CONF_WEATHER_STATE) or []
+        self._cloud: HysteresisFilter | None = None
+        self._irradiance: HysteresisFilter | None = None
+        if options.get(CONF_WEATHER_ENTITY):
+            self._cloud = HysteresisFilter(
+                options.get(CONF_CLOUD_ENTER, DEFAULT_CLOUD_ENTER),
+                options.get(CONF_CLOUD_EXIT, DEFAULT_CLOUD_EXIT),
+                tau,
+                dwell_on,
+                dwell_off,
+                on_below=True,
+            )
+        if options.get(CONF_IRRADIANCE_ENTITY):
+            self._irradiance = HysteresisFilter(
+                options.get(CONF_IRRADIANCE_ENTER, DEFAULT_IRRADIANCE_ENTER),
+                options.get(CONF_IRRADIANCE_EXIT, DEFAULT_IRRADIANCE_EXIT),
+                tau,
+                dwell_on,
+                dwell_off,
+                on_below=False,
+            )
+
+    @property
+    def sun_out(self) -> bool:
+        """
+        Filtered 'sun is effectively out' signal.
+
+        A local irradiance sensor is a direct measurement, so once it has
+        reported it takes precedence over the weather entity's coverage.
+        """
+        active = self._active
+        return True if active is None else active.is_on
+
+    @property
+    def cloud_coverage(self) -> float | None:
+        """Smoothed cloud coverage, %."""
+        if self._cloud is None or self._cloud.value is None:
+            return None
+        return round(self._cloud.value, 1)
+
+    @property
+    def irradiance(self) -> float | None:
+        """Smoothed irradiance, W/m²."""
+        if self._irradiance is None or self._irradiance.value is None:
+            return None
+        return round(self._irradiance.value, 1)
+
+    @property
+    def _active(self) -> HysteresisFilter | None:
+        """The filter `sun_out` currently follows."""
+        if self._irradiance is not None and self._irradiance.value is not None:
+            return self._irradiance
+        if self._cloud is not None and self._cloud.value is not None:
+            return self._cloud
+        return None
+
+    def advance(self, now: float) -> None:
+        """Hold each source's last sample until `now`."""
+        for latch in (self._cloud, self._irradiance):
+            if latch is not None:
+                latch.advance(now)
+
+    def flip_due(self, now: float) -> float | None:
+        """Seconds until `sun_out` may flip, if the average already calls for it."""
+        active = self._active
+        return None if active is None else active.flip_due(now)
+
+    def update_weather(self, state: State | None, now: float) -> None:
+        """Feed the weather entity's cloud coverage."""
+        if self._cloud is None or state is None:
+            return
+        if state.state in (STATE_UNKNOWN, STATE_UNAVAILABLE):
+            return
+        coverage = state.attributes.get(ATTR_WEATHER_CLOUD_COVERAGE)
+        if coverage is None:
+            """No numeric coverage; treat the configured conditions as clear."""
+            if not self._states:
+                """Nothing to judge the condition by; leave the sun out."""
+                return
+            coverage = 0.0 if state.state in self._states else 100.0
+        try:
+            self._cloud.update(float(coverage), now)
+        except (TypeError, ValueError):
+            _LOGGER.debug("Ignoring cloud coverage %s", coverage)
+
+    def update_irradiance(self, state: State | None, now: float) -> None:
+        """Feed the irradiance sensor; once it drops out, weather takes over."""
+        if self._irradiance is None:
+            return
+        if state is None or state.state in (STATE_UNKNOWN, STATE_UNAVAILABLE):
+            self._irradiance.clear()
+            return
+        try:
+            self._irradiance.update(float(state.state), now)
+        except ValueError:
+            _LOGGER.debug("Ignoring irradiance %s", state.state)
@@ -0,0 +1,196 @@
+"""Append-only binary tick log for dpk_smart_blind."""
+
+from __future__ import annotations
+
+import asyncio
+import struct
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from homeassistant.const import EVENT_HOMEASSISTANT_STOP
+from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, callback
+from homeassistant.helpers.event import async_track_time_interval
+
+from .const import _LOGGER, DOMAIN
+from .core.ticks import HEADER, RECORD, pack
+
+if TYPE_CHECKING:
+    from .data import BlindSnapshot
+
+DATA_TICK_LOG = f"{DOMAIN}_tick_log"
+
+# Buffers are written every few minutes, or sooner once one grows this big.
+FLUSH_INTERVAL = timedelta(minutes=5)
+FLUSH_BYTES = 64 * 1024
+
+# A log rolls over to .1 (then .2, ...) at this size or age.
+MAX_BYTES = 8 * 1024 * 1024
+MAX_AGE = timedelta(days=30)
+KEEP = 3
+
+
+class TickLog:
+    """One entry's log file: records are buffered on the loop and written off it."""
+
+    def __init__(self, path: Path) -> None:
+        """Initialize."""
+        self.path = path
+        self._buffer = bytearray()
+
+    def append(self, snapshot: BlindSnapshot) -> int:
+        """Buffer a record; return how many bytes are waiting."""
+        self._buffer += pack(snapshot)
+        return len(self._buffer)
+
+    def take(self) -> bytes:
+        """Hand over everything buffered so far."""
+        data, self._buffer = bytes(self._buffer), bytearray()
+        return data
+
+    def write(self, data: bytes) -> None:
+        """Append records to the file, rotating first if due. Blocking."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._trim()
+        if self._rotation_due():
+            self._rotate()
+        with self.path.open("ab") as file:
+            if file.tell() == 0:
+                file.write(HEADER)
+            file.write(data)
+
+    def _trim(self) -> None:
+        """
+        Cut off a record left short by a crash or power cut mid-write.
+
+        Appending after it would put every later record out of step with the
+        reader, so the file is truncated back to the last whole record.
+        """
+        try:
+            size = self.path.stat().st_size
+        except FileNotFoundError:
+            return
+        whole = 0 if size < len(HEADER) else size - (size - len(HEADER)) % RECORD.size
+        if whole == size:
+            return
+        _LOGGER.warning(
+            "Dropping %d bytes of a torn record from %s", size - whole, self.path
+        )
+        with self.path.open("r+b") as file:
+            file.truncate(whole)
+
+    def _rotation_due(self) -> bool:
+        try:
+            size = self.path.stat().st_size
+        except FileNotFoundError:
+            return False
+        if size >= MAX_BYTES:
+            return True
+        if size < len(HEADER) + RECORD.size:
+            return False
+        with self.path.open("rb") as file:
+            file.seek(len(HEADER))
+            (first,) = struct.unpack("<d", file.read(8))
+        return datetime.now().timestamp() - first >= MAX_AGE.total_seconds()  # noqa: DTZ005
+
+    def _rotate(self) -> None:
+        for index in range(KEEP - 1, 0, -1):
+            older = self.path.with_name(f"{self.path.name}.{index}")
+            if older.exists():
+                older.replace(self.path.with_name(f"{self.path.name}.{index + 1}"))
+        self.path.replace(self.path.with_name(f"{self.path.name}.1"))
+        _LOGGER.debug("rotated tick log %s", self.path)
+
+
+class TickLogWriter:
+    """
+    Background writer shared by every entry's tick log.
+
+    Ticks only append to an in-memory buffer. One timer flushes every buffer
+    in a single executor job, and writes are serialised so a slow disk never
+    has two jobs rotating the same file.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize."""
+        self._hass = hass
+        self._logs: dict[str, TickLog] = {}
+        self._lock = asyncio.Lock()
+        self._timer_unsub: CALLBACK_TYPE | None = None
+        self._stop_unsub: CALLBACK_TYPE | None = None
+
+    @callback
+    def async_register(self, entry_id: str) -> TickLog:
+        """Open an entry's log under .storage."""
+        log = TickLog(
+            Path(self._hass.config.path(".storage", DOMAIN, f"{entry_id}.ticks"))
+        )
+        self._logs[entry_id] = log
+        if self._timer_unsub is None:
+            self._timer_unsub = async_track_time_interval(
+                self._hass, self._async_timed_flush, FLUSH_INTERVAL
+            )
+            self._stop_unsub = self._hass.bus.async_listen_once(
+                EVENT_HOMEASSISTANT_STOP, self._async_stop
+            )
+        return log
+
+    async def async_unregister(self, entry_id: str) -> None:
+        """Write out an entry's remaining records and stop logging it."""
+        log = self._logs.pop(entry_id, None)
+        if not self._logs:
+            self._async_cancel_timers()
+        if log is not None:
+            await self._async_write([(log, log.take())])
+
+    @callback
+    def async_append(self, log: TickLog, snapshot: BlindSnapshot) -> None:
+        """Buffer a tick; a large buffer is flushed straight away."""
+        if log.append(snapshot) >= FLUSH_BYTES:
+            self._hass.async_create_task(self.async_flush())
+
+    async def async_flush(self) -> None:
+        """Write every buffer in one executor job."""
+        await self._async_write([(log, log.take()) for log in self._logs.values()])
+
+    async def _async_write(self, pending: list[tuple[TickLog, bytes]]) -> None:
+        pending = [(log, data) for log, data in pending if data]
+        if not pending:
+            return
+        async with self._lock:
+            await self._hass.async_add_executor_job(_write_all, pending)
+
+    async def _async_timed_flush(self, _now: datetime) -> None:
+        await self.async_flush()
+
+    async def _async_stop(self, _event: Event) -> None:
+        self._stop_unsub = None
+        self._async_cancel_timers()
+        await self.async_flush()
+
+    @callback
+    def _async_cancel_timers(self) -> None:
+        if self._timer_unsub is not None:
+            self._timer_unsub()
+            self._timer_unsub = None
+        if self._stop_unsub is not None:
+            self._stop_unsub()
+            self._stop_unsub = None
+
+
+def _write_all(pending: list[tuple[TickLog, bytes]]) -> None:
+    for log, data in pending:
+        try:
+            log.write(data)
+        except OSError:
+            _LOGGER.exception("Could not write tick log %s", log.path)
+
+
+@callback
+def async_get_tick_log_writer(hass: HomeAssistant) -> TickLogWriter:
+    """Return the shared tick log writer."""
+    writer: TickLogWriter | None = hass.data.get(DATA_TICK_LOG)
+    if writer is None:
+        writer = TickLogWriter(hass)
+        hass.data[DATA_TICK_LOG] = writer
+    return writer
@@ -0,0 +1,172 @@
+"""Websocket API for dpk_smart_blind."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+import voluptuous as vol
+from homeassistant.components import websocket_api
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later
+
+from .const import _LOGGER, DOMAIN
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from .coordinator import DPKTradingDataUpdateCoordinator
+    from .data import BlindSnapshot
+
+DATA_STATE_STREAM = f"{DOMAIN}_state_stream"
+
+# Entries refreshing close together are sent to subscribers as one message.
+FLUSH_DELAY = 0.5
+
+
+class BlindStateStream:
+    """Fan out per-tick calculation deltas to websocket subscribers."""
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize."""
+        self._hass = hass
+        self._coordinators: dict[str, DPKTradingDataUpdateCoordinator] = {}
+        self._subscribers: set[Callable[[dict[str, Any]], None]] = set()
+        self._published: dict[str, BlindSnapshot | None] = {}
+        self._dirty: set[str] = set()
+        self._removed: set[str] = set()
+        self._flush_unsub: CALLBACK_TYPE | None = None
+
+    @callback
+    def async_register(
+        self, entry_id: str, coordinator: DPKTradingDataUpdateCoordinator
+    ) -> CALLBACK_TYPE:
+        """Track an entry's coordinator; return a callable to stop tracking."""
+        self._coordinators[entry_id] = coordinator
+        remove_listener = coordinator.async_add_listener(
+            lambda: self._async_mark_dirty(entry_id)
+        )
+        self._async_mark_dirty(entry_id)
+
+        @callback
+        def unregister() -> None:
+            remove_listener()
+            self._coordinators.pop(entry_id, None)
+            self._dirty.discard(entry_id)
+            if self._subscribers and entry_id in self._published:
+                self._removed.add(entry_id)
+                self._async_schedule_flush()
+
+        return unregister
+
+    @callback
+    def async_subscribe(self, send: Callable[[dict[str, Any]], None]) -> CALLBACK_TYPE:
+        """Add a subscriber; it is sent a full snapshot straight away."""
+        if not self._subscribers:
+            """Nothing is tracked while nobody is listening; start afresh."""
+            self._published = {
+                entry_id: coordinator.data
+                for entry_id, coordinator in self._coordinators.items()
+            }
+            self._dirty.clear()
+            self._removed.clear()
+        self._subscribers.add(send)
+        send(
+            {
+                "type": "snapshot",
+                "entries": {
+                    entry_id: self._entry_data(entry_id, current)
+                    for entry_id, current in self._published.items()
+                },
+            }
+        )
+
+        @callback
+        def unsubscribe() -> None:
+            self._subscribers.discard(send)
+            if not self._subscribers and self._flush_unsub is not None:
+                self._flush_unsub()
+                self._flush_unsub = None
+
+        return unsubscribe
+
+    def _entry_data(
+        self, entry_id: str, snapshot: BlindSnapshot | None
+    ) -> dict[str, Any]:
+        coordinator = self._coordinators.get(entry_id)
+        name = coordinator.eto_client.name if coordinator is not None else None
+        return {"name": name, **(snapshot.as_dict() if snapshot else {})}
+
+    @callback
+    def _async_mark_dirty(self, entry_id: str) -> None:
+        if not self._subscribers:
+            return
+        self._dirty.add(entry_id)
+        self._async_schedule_flush()
+
+    @callback
+    def _async_schedule_flush(self) -> None:
+        if self._flush_unsub is None:
+            self._flush_unsub = async_call_later(
+                self._hass, FLUSH_DELAY, self._async_flush
+            )
+
+    @callback
+    def _async_flush(self, _now: Any = None) -> None:
+        """Send one message with the changed fields of every dirty entry."""
+        self._flush_unsub = None
+        entries: dict[str, dict[str, Any] | None] = {}
+        for entry_id in self._dirty:
+            coordinator = self._coordinators.get(entry_id)
+            if coordinator is None or coordinator.data is None:
+                continue
+            if entry_id not in self._published:
+                entries[entry_id] = self._entry_data(entry_id, coordinator.data)
+            elif changed := coordinator.data.diff(self._published[entry_id]):
+                entries[entry_id] = changed
+            self._published[entry_id] = coordinator.data
+        for entry_id in self._removed:
+            self._published.pop(entry_id, None)
+            entries[entry_id] = None
+        self._dirty.clear()
+        self._removed.clear()
+        if not entries:
+            return
+        message = {"type": "delta", "entries": entries}
+        _LOGGER.debug("state stream delta for %d entries", len(entries))
+        for send in list(self._subscribers):
+            send(message)
+
+
+@callback
+def async_get_state_stream(hass: HomeAssistant) -> BlindStateStream:
+    """Return the shared state stream."""
+    stream: BlindStateStream | None = hass.data.get(DATA_STATE_STREAM)
+    if stream is None:
+        stream = BlindStateStream(hass)
+        hass.data[DATA_STATE_STREAM] = stream
+    return stream
+
+
+@callback
+def async_setup(hass: HomeAssistant) -> None:
+    """Register the websocket commands."""
+    websocket_api.async_register_command(hass, websocket_subscribe)
+
+
+@websocket_api.websocket_command({vol.Required("type"): f"{DOMAIN}/subscribe"})
+@callback
+def websocket_subscribe(
+    hass: HomeAssistant,
+    connection: websocket_api.ActiveConnection,
+    msg: dict[str, Any],
+) -> None:
+    """Stream a snapshot then per-tick deltas of every blind's calculation."""
+
+    @callback
+    def forward(message: dict[str, Any]) -> None:
+        connection.send_message(websocket_api.event_message(msg["id"], message))
+
+    connection.send_result(msg["id"])
+    connection.subscriptions[msg["id"]] = async_get_state_stream(hass).async_subscribe(
+        forward
+    )
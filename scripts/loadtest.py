@@ -0,0 +1,260 @@
+"""
+Scale load test for dpk_smart_blind.
+
+Sets up N config entries against the stand-in Home Assistant shipped with
+pytest-homeassistant-custom-component, with fake covers, sun and weather, and
+reports per entry count:
+
+  * setup time, from domain setup until every entry has loaded and done its
+    first refresh, as at boot
+  * memory per entry, from tracemalloc
+  * event-loop lag, sampled by a probe task throughout
+  * state writes per simulated hour, excluding the fakes' own writes
+  * teardown time through async_unload_entry
+
+Usage:
+
+    python3 -m pip install --requirement requirements_loadtest.txt
+    python3 scripts/loadtest.py 10 100 500
+"""
+
+# ruff: noqa: T201 INP001
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+import tracemalloc
+from dataclasses import dataclass, field
+from datetime import timedelta
+from pathlib import Path
+from typing import Any
+
+import astral.sun
+from homeassistant import loader
+from homeassistant.const import EVENT_STATE_CHANGED
+from homeassistant.core import Event, HomeAssistant, ServiceCall, callback
+from homeassistant.helpers.sun import get_astral_location
+from homeassistant.setup import async_setup_component
+from homeassistant.util import dt as dt_util
+from pytest_homeassistant_custom_component.common import (
+    MockConfigEntry,
+    async_fire_time_changed,
+    async_test_home_assistant,
+)
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from custom_components.dpk_smart_blind.const import (
+    CONF_AZIMUTH,
+    CONF_DEFAULT_HEIGHT,
+    CONF_DELTA_POSITION,
+    CONF_DELTA_TIME,
+    CONF_DISTANCE,
+    CONF_ENTITY,
+    CONF_FOV_LEFT,
+    CONF_FOV_RIGHT,
+    CONF_HEIGHT_WIN,
+    CONF_WEATHER_ENTITY,
+    CONF_WEATHER_STATE,
+    DOMAIN,
+)
+
+SUN = "sun.sun"
+WEATHER = "weather.home"
+PROBE_INTERVAL = 0.01
+SIMULATED_MINUTES = 60
+
+
+@dataclass
+class LagProbe:
+    """Measure how late the event loop wakes a sleeping task."""
+
+    samples: list[float] = field(default_factory=list)
+    _task: asyncio.Task | None = None
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            start = loop.time()
+            await asyncio.sleep(PROBE_INTERVAL)
+            self.samples.append(max(0.0, loop.time() - start - PROBE_INTERVAL))
+
+    def start(self) -> None:
+        """Start sampling."""
+        self.samples.clear()
+        self._task = asyncio.get_running_loop().create_task(self._run())
+
+    def stop(self) -> dict[str, float]:
+        """Stop sampling and summarise lag in milliseconds."""
+        if self._task is not None:
+            self._task.cancel()
+        if len(self.samples) < 2:  # noqa: PLR2004
+            return {"p50": 0.0, "p95": 0.0, "max": 0.0}
+        quantiles = statistics.quantiles(self.samples, n=20, method="inclusive")
+        return {
+            "p50": statistics.median(self.samples) * 1000,
+            "p95": quantiles[-1] * 1000,
+            "max": max(self.samples) * 1000,
+        }
+
+
+def _options(index: int) -> dict[str, Any]:
+    return {
+        CONF_AZIMUTH: (90 + index * 7) % 360,
+        CONF_FOV_LEFT: 80,
+        CONF_FOV_RIGHT: 80,
+        CONF_ENTITY: f"cover.loadtest_{index}",
+        CONF_HEIGHT_WIN: 2.1,
+        CONF_DISTANCE: 0.5,
+        CONF_DEFAULT_HEIGHT: 100,
+        CONF_DELTA_POSITION: 5,
+        CONF_DELTA_TIME: 5,
+        CONF_WEATHER_ENTITY: WEATHER,
+        CONF_WEATHER_STATE: ["sunny", "partlycloudy"],
+    }
+
+
+def _set_sun(hass: HomeAssistant, when: Any) -> None:
+    observer = get_astral_location(hass)[0].observer
+    elevation = astral.sun.elevation(observer, when)
+    hass.states.async_set(
+        SUN,
+        "above_horizon" if elevation > 0 else "below_horizon",
+        {
+            "azimuth": round(astral.sun.azimuth(observer, when), 2),
+            "elevation": round(elevation, 2),
+        },
+    )
+
+
+def _register_fake_covers(hass: HomeAssistant, count: int) -> None:
+    for index in range(count):
+        hass.states.async_set(
+            f"cover.loadtest_{index}", "open", {"current_position": 100}
+        )
+
+    async def set_position(call: ServiceCall) -> None:
+        entity_ids = call.data["entity_id"]
+        for entity_id in [entity_ids] if isinstance(entity_ids, str) else entity_ids:
+            position = call.data["position"]
+            hass.states.async_set(
+                entity_id,
+                "closed" if position == 0 else "open",
+                {"current_position": position},
+            )
+
+    hass.services.async_register("cover", "set_cover_position", set_position)
+
+
+async def run(count: int) -> dict[str, Any]:
+    """Run one load test with `count` entries."""
+    async with async_test_home_assistant() as hass:
+        hass.data.pop(loader.DATA_CUSTOM_COMPONENTS, None)
+        await hass.config.async_set_time_zone("Europe/London")
+        hass.config.latitude, hass.config.longitude = 51.5, -0.1
+        """Timers only fire forwards from now; the fake sun runs from 11:00."""
+        fire_time = dt_util.utcnow()
+        sun_time = fire_time.replace(hour=11, minute=0)
+
+        _set_sun(hass, sun_time)
+        hass.states.async_set(WEATHER, "sunny", {"cloud_coverage": 10})
+        _register_fake_covers(hass, count)
+
+        entries = [
+            MockConfigEntry(
+                domain=DOMAIN, data={"name": f"Blind {i}"}, options=_options(i)
+            )
+            for i in range(count)
+        ]
+        for entry in entries:
+            entry.add_to_hass(hass)
+
+        probe = LagProbe()
+        tracemalloc.start()
+        memory_before = tracemalloc.get_traced_memory()[0]
+        probe.start()
+        began = time.perf_counter()
+        assert await async_setup_component(hass, DOMAIN, {})  # noqa: S101
+        await hass.async_block_till_done()
+        setup_time = time.perf_counter() - began
+        setup_lag = probe.stop()
+        memory_per_entry = (tracemalloc.get_traced_memory()[0] - memory_before) / count
+        tracemalloc.stop()
+
+        fakes = {SUN, WEATHER} | {_options(i)[CONF_ENTITY] for i in range(count)}
+        writes = 0
+
+        @callback
+        def count_writes(event: Event) -> None:
+            nonlocal writes
+            if event.data["entity_id"] not in fakes:
+                writes += 1
+
+        unsub = hass.bus.async_listen(EVENT_STATE_CHANGED, count_writes)
+        probe.start()
+        began = time.perf_counter()
+        for minute in range(1, SIMULATED_MINUTES + 1):
+            _set_sun(hass, sun_time + timedelta(minutes=minute))
+            if minute % 15 == 0:
+                hass.states.async_set(
+                    WEATHER, "partlycloudy", {"cloud_coverage": 10 + minute % 40}
+                )
+            async_fire_time_changed(hass, fire_time + timedelta(minutes=minute))
+            await hass.async_block_till_done()
+        run_time = time.perf_counter() - began
+        run_lag = probe.stop()
+        unsub()
+
+        began = time.perf_counter()
+        await asyncio.gather(
+            *(hass.config_entries.async_unload(entry.entry_id) for entry in entries)
+        )
+        await hass.async_block_till_done()
+        teardown_time = time.perf_counter() - began
+
+        return {
+            "entries": count,
+            "setup_s": setup_time,
+            "kib_per_entry": memory_per_entry / 1024,
+            "setup_lag_ms": setup_lag,
+            "hour_s": run_time,
+            "hour_lag_ms": run_lag,
+            "writes_per_hour": writes * 60 / SIMULATED_MINUTES,
+            "teardown_s": teardown_time,
+        }
+
+
+def _report(results: list[dict[str, Any]]) -> None:
+    header = (
+        f"{'entries':>8} {'setup s':>9} {'KiB/entry':>10} "
+        f"{'setup lag p95/max ms':>21} {'hour s':>8} {'hour lag p95/max ms':>20} "
+        f"{'writes/h':>9} {'teardown s':>11}"
+    )
+    print(header)
+    print("-" * len(header))
+    for r in results:
+        setup_lag = f"{r['setup_lag_ms']['p95']:.1f}/{r['setup_lag_ms']['max']:.1f}"
+        hour_lag = f"{r['hour_lag_ms']['p95']:.1f}/{r['hour_lag_ms']['max']:.1f}"
+        print(
+            f"{r['entries']:>8} {r['setup_s']:>9.3f} {r['kib_per_entry']:>10.1f} "
+            f"{setup_lag:>21} {r['hour_s']:>8.3f} {hour_lag:>20} "
+            f"{r['writes_per_hour']:>9.0f} {r['teardown_s']:>11.3f}"
+        )
+
+
+def main() -> None:
+    """Parse arguments and run each load test in its own event loop."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "counts", nargs="*", type=int, default=[10, 100, 500], help="entry counts"
+    )
+    args = parser.parse_args()
+    _report([asyncio.run(run(count)) for count in args.counts])
+
+
+if __name__ == "__main__":
+    main()
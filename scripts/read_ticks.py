@@ -0,0 +1,82 @@
+"""
+Summarise or export a dpk_smart_blind tick log.
+
+Tick logs are written under <config>/.storage/dpk_smart_blind/ when the
+blind's "Tick log" option is on, one file per config entry, rotated to
+.1, .2, ... by size and age. The file is memory-mapped, so even months of
+ticks load without reading the whole file.
+
+Usage:
+
+    python3 scripts/read_ticks.py <entry_id>.ticks [<entry_id>.ticks.1 ...]
+    python3 scripts/read_ticks.py <entry_id>.ticks --csv ticks.csv
+"""
+
+# ruff: noqa: T201 INP001
+
+from __future__ import annotations
+
+import argparse
+import sys
+from datetime import UTC, datetime
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(
+    0,
+    str(
+        Path(__file__).resolve().parent.parent / "custom_components" / "dpk_smart_blind"
+    ),
+)
+
+from core.ticks import FLAG_SUN_IN_WINDOW, FLAG_SUN_OUT, SUN_STATES, read_tick_log
+
+
+def _when(epoch: float) -> str:
+    return f"{datetime.fromtimestamp(epoch, UTC):%Y-%m-%d %H:%M:%S}Z"
+
+
+def summarise(ticks: np.ndarray) -> None:
+    """Print the time span, state mix and cover setting range."""
+    first, last = np.nanmin(ticks["time"]), np.nanmax(ticks["time"])
+    print(f"{len(ticks)} ticks, {_when(first)} .. {_when(last)}")
+    codes, counts = np.unique(ticks["sun_state"], return_counts=True)
+    for code, count in zip(codes, counts, strict=True):
+        name = SUN_STATES[code] if code < len(SUN_STATES) else "unknown"
+        print(f"  {name:>10}: {count}")
+    print(f"  sun out: {np.count_nonzero(ticks['flags'] & FLAG_SUN_OUT)}")
+    print(f"  in window: {np.count_nonzero(ticks['flags'] & FLAG_SUN_IN_WINDOW)}")
+    setting = ticks["cover_setting"][~np.isnan(ticks["cover_setting"])]
+    if setting.size:
+        print(f"  cover setting: {setting.min():.0f}..{setting.max():.0f}%")
+
+
+def main() -> None:
+    """Read each log in the order given and summarise or export them."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("logs", nargs="+", type=Path, help="tick log files")
+    parser.add_argument("--csv", type=Path, help="write every tick to this file")
+    args = parser.parse_args()
+
+    ticks = np.concatenate([read_tick_log(path) for path in args.logs])
+    ticks = ticks[np.argsort(ticks["time"], kind="stable")]
+    if not len(ticks):
+        print("no ticks")
+        return
+    if args.csv is None:
+        summarise(ticks)
+        return
+    np.savetxt(
+        args.csv,
+        ticks,
+        fmt=["%.3f", "%.2f", "%.2f", "%.2f", "%.0f", "%d", "%d"],
+        delimiter=",",
+        header=",".join(ticks.dtype.names),
+        comments="",
+    )
+    print(f"wrote {len(ticks)} ticks to {args.csv}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,385 @@
+"""
+Offline replay of recorder history for dpk_smart_blind.
+
+Reads sun.sun, weather, irradiance and cover states from a copy of a
+Home Assistant recorder database and runs them through each blind's
+calculation, weather gating and cover decisions on a simulated clock, with
+ticks every few minutes as the scheduler would fire them. Reports per
+simulated day:
+
+  * ticks calculated
+  * cover commands the blind would have sent
+  * overrides, i.e. settled cover moves it did not ask for
+  * compute time spent in the calculation and decisions
+
+Blinds are read from the config directory's `.storage`, so the replay uses
+the options the blinds run with. The database is opened read-only; point
+`--db` at a copy rather than the live file while Home Assistant runs.
+
+Commands are not fed back: the covers move as they did in the recording.
+Holding off while a cover travels is not simulated either, as the learned
+travel times are not recorded.
+
+Usage:
+
+    python3 scripts/replay.py /config --days 7
+    python3 scripts/replay.py /config --db backup.db --blind Study --commands
+"""
+
+# ruff: noqa: T201 INP001
+
+from __future__ import annotations
+
+import argparse
+import json
+import sqlite3
+import sys
+import time
+from collections import defaultdict
+from dataclasses import dataclass, field
+from datetime import UTC, date, datetime, timedelta
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+from zoneinfo import ZoneInfo
+
+from astral import Observer
+from homeassistant.components.cover import (
+    ATTR_CURRENT_POSITION,
+    ATTR_CURRENT_TILT_POSITION,
+)
+from homeassistant.const import STATE_CLOSING, STATE_OPENING
+from homeassistant.core import State
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from custom_components.dpk_smart_blind.api import window_config
+from custom_components.dpk_smart_blind.const import (
+    CONF_DELTA_POSITION,
+    CONF_DELTA_TILT,
+    CONF_ENTITY,
+    CONF_IRRADIANCE_ENTITY,
+    CONF_WEATHER_ENTITY,
+    DEFAULT_DELTA_TILT,
+    DOMAIN,
+    SUN_ENTITY,
+)
+from custom_components.dpk_smart_blind.core import (
+    BlindSnapshot,
+    CalculationMemo,
+    CoverPolicy,
+    WindowCalculator,
+)
+from custom_components.dpk_smart_blind.scheduler import TICK_MINUTES
+from custom_components.dpk_smart_blind.solar import SolarPosition
+from custom_components.dpk_smart_blind.sun_filter import SunOutFilter
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator, Mapping
+
+# Rows fetched from the database at a time.
+BATCH_SIZE = 10_000
+
+STATES_QUERY = """
+    SELECT states_meta.entity_id, states.state, state_attributes.shared_attrs,
+        states.last_updated_ts
+    FROM states
+    JOIN states_meta ON states.metadata_id = states_meta.metadata_id
+    LEFT JOIN state_attributes
+        ON states.attributes_id = state_attributes.attributes_id
+    WHERE states_meta.entity_id IN ({entities})
+        AND states.last_updated_ts >= ? AND states.last_updated_ts < ?
+    ORDER BY states.last_updated_ts
+"""
+
+
+@dataclass(slots=True)
+class DayStats:
+    """What one blind did over one simulated day."""
+
+    ticks: int = 0
+    commands: int = 0
+    overrides: int = 0
+    compute: float = 0.0  # seconds
+
+
+@dataclass(slots=True)
+class ReplayBlind:
+    """One blind's calculation and decisions, driven by recorded states."""
+
+    name: str
+    options: Mapping[str, Any]
+    calculator: WindowCalculator
+    sun_filter: SunOutFilter
+    policy: CoverPolicy
+    snapshot: BlindSnapshot = field(default_factory=BlindSnapshot)
+    position: int | None = None
+    travel: str | None = None
+    tilt: int | None = None
+    settled: int | None = None
+    days: defaultdict[date, DayStats] = field(
+        default_factory=lambda: defaultdict(DayStats)
+    )
+    commands: list[tuple[datetime, str, int]] = field(default_factory=list)
+
+    @classmethod
+    def from_entry(cls, entry: Mapping[str, Any], solar: SolarPosition) -> ReplayBlind:
+        """Build from a stored config entry."""
+        options = entry["options"]
+        return cls(
+            name=entry["title"],
+            options=options,
+            calculator=WindowCalculator(
+                window_config(options), solar, memo=CalculationMemo()
+            ),
+            sun_filter=SunOutFilter(options),
+            policy=CoverPolicy(
+                entry["title"],
+                options[CONF_DELTA_POSITION],
+                options.get(CONF_DELTA_TILT, DEFAULT_DELTA_TILT),
+            ),
+        )
+
+    @property
+    def entities(self) -> set[str]:
+        """Entities whose states this blind reacts to."""
+        return {
+            entity
+            for entity in (
+                self.options[CONF_ENTITY],
+                self.options.get(CONF_WEATHER_ENTITY),
+                self.options.get(CONF_IRRADIANCE_ENTITY),
+            )
+            if entity
+        }
+
+    def tick(self, now: datetime) -> None:
+        """Calculate at `now` and decide on a command, as a refresh would."""
+        start = time.perf_counter()
+        self.sun_filter.advance(now.timestamp())
+        sun_out = self.sun_filter.sun_out
+        cloud_coverage = self.sun_filter.cloud_coverage
+        if sun_out:
+            data = self.calculator.calculate(now, self.snapshot, cloud_coverage)
+        else:
+            data = self.calculator.hold(now, self.snapshot, cloud_coverage)
+        self.snapshot = data
+        target = None
+        if data.sun_out:
+            if self.calculator.tilt_mode:
+                target = self.policy.tilt_target(data, self.tilt)
+            else:
+                target = self.policy.position_target(data, self.position, self.travel)
+        stats = self.days[now.date()]
+        stats.compute += time.perf_counter() - start
+        stats.ticks += 1
+        if target is not None:
+            stats.commands += 1
+            kind = "tilt" if self.calculator.tilt_mode else "position"
+            self.commands.append((now, kind, target))
+
+    def state_changed(self, state: State, now: datetime) -> bool:
+        """Take a recorded state; True when it calls for a refresh."""
+        entity_id = state.entity_id
+        if entity_id == self.options[CONF_ENTITY]:
+            self._cover_changed(state, now)
+            return False
+        was_out = self.sun_filter.sun_out
+        if entity_id == self.options.get(CONF_WEATHER_ENTITY):
+            self.sun_filter.update_weather(state, now.timestamp())
+        if entity_id == self.options.get(CONF_IRRADIANCE_ENTITY):
+            self.sun_filter.update_irradiance(state, now.timestamp())
+        return self.sun_filter.sun_out != was_out
+
+    def _cover_changed(self, state: State, now: datetime) -> None:
+        """Count a settled move the blind did not ask for as an override."""
+        position = state.attributes.get(ATTR_CURRENT_POSITION)
+        if position is not None:
+            self.position = int(position)
+        tilt = state.attributes.get(ATTR_CURRENT_TILT_POSITION)
+        if tilt is not None:
+            self.tilt = int(tilt)
+        self.travel = (
+            state.state if state.state in (STATE_OPENING, STATE_CLOSING) else None
+        )
+        if self.travel is not None or self.position is None:
+            return
+        if self.position == self.settled:
+            return
+        seeded, self.settled = self.settled is not None, self.position
+        if seeded and self.policy.is_override(self.position):
+            self.days[now.date()].overrides += 1
+
+
+def load_json(path: Path) -> dict[str, Any]:
+    """Read one of Home Assistant's `.storage` files."""
+    return json.loads(path.read_text(encoding="utf-8"))["data"]
+
+
+def stream_states(
+    connection: sqlite3.Connection, entities: set[str], start: float, end: float
+) -> Iterator[tuple[str, str, dict[str, Any], float]]:
+    """Yield (entity_id, state, attributes, timestamp) in recorded order."""
+    cursor = connection.execute(
+        STATES_QUERY.format(entities=",".join("?" * len(entities))),
+        (*sorted(entities), start, end),
+    )
+    attributes_cache: dict[str, dict[str, Any]] = {}
+    while rows := cursor.fetchmany(BATCH_SIZE):
+        for entity_id, state, shared_attrs, timestamp in rows:
+            """Attributes are shared between rows; parse each text once."""
+            attributes = attributes_cache.get(shared_attrs or "{}")
+            if attributes is None:
+                attributes = json.loads(shared_attrs or "{}")
+                attributes_cache[shared_attrs or "{}"] = attributes
+            yield entity_id, state, attributes, timestamp
+
+
+def recorded_range(connection: sqlite3.Connection) -> tuple[float, float]:
+    """First and last state timestamps in the database."""
+    first, last = connection.execute(
+        "SELECT MIN(last_updated_ts), MAX(last_updated_ts) FROM states"
+    ).fetchone()
+    if first is None:
+        msg = "the database holds no states"
+        raise SystemExit(msg)
+    return first, last
+
+
+def replay(  # noqa: PLR0913
+    connection: sqlite3.Connection,
+    blinds: list[ReplayBlind],
+    solar: SolarPosition,
+    tz: ZoneInfo,
+    start: float,
+    end: float,
+) -> int:
+    """Run every recorded state and tick between `start` and `end`."""
+    watchers: defaultdict[str, list[ReplayBlind]] = defaultdict(list)
+    for blind in blinds:
+        for entity in blind.entities:
+            watchers[entity].append(blind)
+    step = TICK_MINUTES * 60
+    next_tick = (start // step + 1) * step
+    rows = 0
+
+    def run_ticks(until: float) -> None:
+        nonlocal next_tick
+        while next_tick < until:
+            now = datetime.fromtimestamp(next_tick, tz)
+            for blind in blinds:
+                blind.tick(now)
+            next_tick += step
+
+    for entity_id, state, attributes, timestamp in stream_states(
+        connection, {SUN_ENTITY, *watchers}, start, end
+    ):
+        run_ticks(timestamp)
+        rows += 1
+        now = datetime.fromtimestamp(timestamp, tz)
+        recorded = State(entity_id, state, attributes, last_updated=now)
+        if entity_id == SUN_ENTITY:
+            """sun.sun's position is used at once, as the coordinator does."""
+            if solar.async_observe(recorded):
+                for blind in blinds:
+                    blind.tick(now)
+            continue
+        for blind in watchers[entity_id]:
+            if blind.state_changed(recorded, now):
+                blind.tick(now)
+    run_ticks(end)
+    return rows
+
+
+def report(blind: ReplayBlind, *, commands: bool) -> None:
+    """Print one blind's days, and each command when asked for."""
+    print(f"{blind.name} ({blind.options[CONF_ENTITY]})")
+    print(f"  {'day':<10} {'ticks':>6} {'commands':>9} {'overrides':>10} {'ms':>8}")
+    total = DayStats()
+    for day, stats in sorted(blind.days.items()):
+        print(
+            f"  {day.isoformat():<10} {stats.ticks:>6} {stats.commands:>9} "
+            f"{stats.overrides:>10} {stats.compute * 1000:>8.1f}"
+        )
+        total.ticks += stats.ticks
+        total.commands += stats.commands
+        total.overrides += stats.overrides
+        total.compute += stats.compute
+    print(
+        f"  {'total':<10} {total.ticks:>6} {total.commands:>9} "
+        f"{total.overrides:>10} {total.compute * 1000:>8.1f}"
+    )
+    if commands:
+        for now, kind, target in blind.commands:
+            print(f"    {now:%Y-%m-%d %H:%M} {kind} {target}%")
+
+
+def main() -> None:
+    """Replay the recorded range, or the part of it asked for."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("config", type=Path, help="Home Assistant config directory")
+    parser.add_argument(
+        "--db", type=Path, help="recorder database, default home-assistant_v2.db"
+    )
+    parser.add_argument("--blind", action="append", help="only blinds with this name")
+    parser.add_argument("--start", type=date.fromisoformat, help="first day, local")
+    parser.add_argument("--end", type=date.fromisoformat, help="last day, local")
+    parser.add_argument("--days", type=int, help="only the last DAYS recorded")
+    parser.add_argument(
+        "--sun-entity",
+        action="store_true",
+        help="use sun.sun's position, as with sun_position_from_entity",
+    )
+    parser.add_argument("--commands", action="store_true", help="list each command")
+    args = parser.parse_args()
+
+    storage = args.config / ".storage"
+    core_config = load_json(storage / "core.config")
+    tz = ZoneInfo(core_config["time_zone"])
+    solar = SolarPosition(
+        Observer(
+            core_config["latitude"],
+            core_config["longitude"],
+            core_config.get("elevation", 0),
+        ),
+        tz,
+        from_entity=args.sun_entity,
+    )
+    blinds = [
+        ReplayBlind.from_entry(entry, solar)
+        for entry in load_json(storage / "core.config_entries")["entries"]
+        if entry["domain"] == DOMAIN
+        and (args.blind is None or entry["title"] in args.blind)
+    ]
+    if not blinds:
+        print("no blinds")
+        return
+
+    db = args.db or args.config / "home-assistant_v2.db"
+    connection = sqlite3.connect(f"file:{db}?mode=ro&immutable=1", uri=True)
+    try:
+        first, last = recorded_range(connection)
+        start, end = first, last + 1
+        if args.days is not None:
+            start = max(first, last - args.days * 86400)
+        if args.start is not None:
+            start = datetime.combine(args.start, datetime.min.time(), tz).timestamp()
+        if args.end is not None:
+            end = datetime.combine(
+                args.end + timedelta(days=1), datetime.min.time(), tz
+            ).timestamp()
+        began = time.perf_counter()
+        rows = replay(connection, blinds, solar, tz, start, end)
+        elapsed = time.perf_counter() - began
+    finally:
+        connection.close()
+
+    print(
+        f"{rows} states, {datetime.fromtimestamp(start, UTC):%Y-%m-%d %H:%M}Z .. "
+        f"{datetime.fromtimestamp(end, UTC):%Y-%m-%d %H:%M}Z in {elapsed:.2f}s"
+    )
+    for blind in blinds:
+        report(blind, commands=args.commands)
+
+
+if __name__ == "__main__":
+    main()
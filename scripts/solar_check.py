@@ -0,0 +1,81 @@
+"""
+Benchmark the vectorised solar position engine against astral.
+
+Times `core.solar.solar_position` and `astral.sun.azimuth`/`elevation` over
+random locations from 80S to 80N across ten years and reports seconds per
+million samples. Agreement with astral is checked by tests/test_solar.py.
+
+Usage:
+
+    python3 scripts/solar_check.py
+    python3 scripts/solar_check.py --samples 2000000
+"""
+
+# ruff: noqa: T201 INP001
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from datetime import UTC, datetime
+from pathlib import Path
+
+import astral
+import astral.sun
+import numpy as np
+
+sys.path.insert(
+    0,
+    str(
+        Path(__file__).resolve().parent.parent / "custom_components" / "dpk_smart_blind"
+    ),
+)
+
+from core.solar import solar_position
+
+START = datetime(2020, 1, 1, tzinfo=UTC)
+WEEKS = 52 * 10
+
+ASTRAL_BENCH_SAMPLES = 20_000
+
+
+def benchmark(samples: int) -> None:
+    """Time both implementations and report seconds per million samples."""
+    rng = np.random.default_rng(0)
+    epoch = START.timestamp() + rng.uniform(0, WEEKS * 7 * 86400, samples)
+    lat = rng.uniform(-80, 80, samples)
+    lon = rng.uniform(-180, 180, samples)
+
+    began = time.perf_counter()
+    solar_position(epoch, lat, lon)
+    vectorised = (time.perf_counter() - began) / samples * 1e6
+
+    count = min(samples, ASTRAL_BENCH_SAMPLES)
+    when = [datetime.fromtimestamp(t, UTC) for t in epoch[:count]]
+    observers = [
+        astral.Observer(la, lo) for la, lo in zip(lat[:count], lon[:count], strict=True)
+    ]
+    began = time.perf_counter()
+    for t, observer in zip(when, observers, strict=True):
+        astral.sun.azimuth(observer, t)
+        astral.sun.elevation(observer, t)
+    scalar = (time.perf_counter() - began) / count * 1e6
+
+    print(f"  numpy  {vectorised:8.3f} s per million ({samples} samples)")
+    print(f"  astral {scalar:8.3f} s per million (extrapolated from {count})")
+    print(f"  speed-up x{scalar / vectorised:.0f}")
+
+
+def main() -> None:
+    """Benchmark both implementations."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--samples", type=int, default=1_000_000, help="benchmark sample count"
+    )
+    args = parser.parse_args()
+    benchmark(args.samples)
+
+
+if __name__ == "__main__":
+    main()
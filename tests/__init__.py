@@ -0,0 +1 @@
+"""Tests for dpk_smart_blind."""
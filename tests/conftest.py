@@ -0,0 +1,9 @@
+"""Fixtures for dpk_smart_blind tests."""
+
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def auto_enable_custom_integrations(enable_custom_integrations: None) -> None:  # noqa: ARG001
+    """Load dpk_smart_blind from custom_components in every test."""
+    return
@@ -0,0 +1,35 @@
+"""Constants for dpk_smart_blind tests."""
+
+from homeassistant.const import CONF_NAME
+
+from custom_components.dpk_smart_blind.const import (
+    CONF_AZIMUTH,
+    CONF_COMMAND_SPACING,
+    CONF_DEFAULT_HEIGHT,
+    CONF_DELTA_POSITION,
+    CONF_DELTA_TIME,
+    CONF_DISTANCE,
+    CONF_ENTITY,
+    CONF_FOV_LEFT,
+    CONF_FOV_RIGHT,
+    CONF_HEIGHT_WIN,
+    CONF_WEATHER_ENTITY,
+    CONF_WEATHER_STATE,
+)
+
+MOCK_DATA = {CONF_NAME: "Study"}
+
+MOCK_OPTIONS = {
+    CONF_AZIMUTH: 180,
+    CONF_FOV_LEFT: 90,
+    CONF_FOV_RIGHT: 90,
+    CONF_ENTITY: "cover.study",
+    CONF_HEIGHT_WIN: 2.1,
+    CONF_DISTANCE: 0.5,
+    CONF_DEFAULT_HEIGHT: 100,
+    CONF_DELTA_POSITION: 5,
+    CONF_DELTA_TIME: 5,
+    CONF_WEATHER_ENTITY: "weather.home",
+    CONF_WEATHER_STATE: ["sunny"],
+    CONF_COMMAND_SPACING: 0,
+}
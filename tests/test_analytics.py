@@ -0,0 +1,62 @@
+"""Tests for the daily analytics accumulators."""
+
+from datetime import date, datetime, timedelta
+from zoneinfo import ZoneInfo
+
+from custom_components.dpk_smart_blind.analytics import BlindAnalytics, DailyTotals
+
+TZ = ZoneInfo("Europe/London")
+START = datetime(2024, 6, 21, 22, 0, tzinfo=TZ)
+
+
+def test_durations_are_integrated() -> None:
+    """Time is credited to whatever held since the last call."""
+    analytics = BlindAnalytics(DailyTotals(START.date()))
+    analytics.record_tick(START, sun_in_window=True)
+    analytics.record_position(START, 40)
+    analytics.record_tick(START + timedelta(minutes=30), sun_in_window=False)
+    analytics.record_position(START + timedelta(minutes=45), 80)
+    analytics.record_override(START + timedelta(minutes=50))
+
+    today = analytics.today
+    assert today.sun_in_window_minutes == 30
+    assert today.moves == 1
+    assert today.overrides == 1
+    assert today.position_minutes == {40: 45, 80: 5}
+
+
+def test_midnight_splits_the_interval() -> None:
+    """Crossing midnight closes the day and starts the next at zero."""
+    analytics = BlindAnalytics(DailyTotals(START.date()), days=2)
+    analytics.record_tick(START, sun_in_window=True)
+    assert analytics.advance(START + timedelta(hours=3))
+
+    assert [day.day for day in analytics.history] == [date(2024, 6, 21)]
+    assert analytics.history[0].sun_in_window_minutes == 120
+    assert analytics.today.day == date(2024, 6, 22)
+    assert analytics.today.sun_in_window_minutes == 60
+
+    analytics.advance(START + timedelta(days=3))
+    assert [day.day for day in analytics.history] == [
+        date(2024, 6, 22),
+        date(2024, 6, 23),
+    ]
+
+
+def test_storage_round_trip() -> None:
+    """What is saved comes back as it was."""
+    analytics = BlindAnalytics(DailyTotals(START.date()))
+    analytics.record_position(START, 40)
+    analytics.record_position(START + timedelta(hours=3), 60)
+    restored = BlindAnalytics.from_dict(analytics.as_dict(), date(2024, 6, 22))
+    assert restored.today == analytics.today
+    assert restored.history == analytics.history
+    assert BlindAnalytics.from_dict(None, date(2024, 6, 22)).today.moves == 0
+
+
+def test_position_bands() -> None:
+    """A band runs from its own value up to, not including, the next."""
+    analytics = BlindAnalytics(DailyTotals(START.date()))
+    for minute, position in enumerate((5, 9, 10, 15, 25, 35, 100, 0)):
+        analytics.record_position(START + timedelta(minutes=minute), position)
+    assert analytics.today.position_minutes == {0: 2, 10: 2, 20: 1, 30: 1, 100: 1}
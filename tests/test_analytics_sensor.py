@@ -0,0 +1,64 @@
+"""Tests for the per-blind analytics sensors."""
+
+import pytest
+from homeassistant.components.recorder import Recorder
+from homeassistant.components.recorder.history import get_significant_states
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import entity_registry as er
+from homeassistant.util import dt as dt_util
+from pytest_homeassistant_custom_component.common import (
+    MockConfigEntry,
+    async_mock_service,
+)
+from pytest_homeassistant_custom_component.components.recorder.common import (
+    async_wait_recording_done,
+)
+
+from custom_components.dpk_smart_blind.const import (
+    ATTR_HISTORY,
+    ATTR_POSITION_MINUTES,
+    DOMAIN,
+)
+
+from .const import MOCK_DATA, MOCK_OPTIONS
+
+
+@pytest.fixture(autouse=True)
+def auto_enable_custom_integrations(
+    recorder_mock: Recorder,  # noqa: ARG001
+    enable_custom_integrations: None,  # noqa: ARG001
+) -> None:
+    """Start the recorder before hass, as the shared fixture would not."""
+    return
+
+
+async def test_history_not_recorded(hass: HomeAssistant) -> None:
+    """The state keeps its history attributes but the recorder leaves them out."""
+    start = dt_util.utcnow()
+    hass.states.async_set("sun.sun", "above_horizon", {"azimuth": 180, "elevation": 40})
+    hass.states.async_set("weather.home", "sunny", {"cloud_coverage": 10})
+    hass.states.async_set("cover.study", "open", {"current_position": 100})
+    async_mock_service(hass, "cover", "set_cover_position")
+    entry = MockConfigEntry(domain=DOMAIN, data=MOCK_DATA, options=MOCK_OPTIONS)
+    entry.add_to_hass(hass)
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    entity_id = next(
+        entity.entity_id
+        for entity in er.async_entries_for_config_entry(
+            er.async_get(hass), entry.entry_id
+        )
+        if entity.unique_id.endswith("Moves Today")
+    )
+    state = hass.states.get(entity_id)
+    assert ATTR_HISTORY in state.attributes
+    assert ATTR_POSITION_MINUTES in state.attributes
+
+    await async_wait_recording_done(hass)
+    states = await hass.async_add_executor_job(
+        get_significant_states, hass, start, None, [entity_id]
+    )
+    recorded = states[entity_id][-1]
+    assert ATTR_HISTORY not in recorded.attributes
+    assert ATTR_POSITION_MINUTES not in recorded.attributes
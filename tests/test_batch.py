@@ -0,0 +1,94 @@
+"""Tests for the batched executor offload."""
+
+import asyncio
+import threading
+from collections.abc import Callable
+from datetime import datetime, timedelta
+
+import pytest
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+from pytest_homeassistant_custom_component.common import async_fire_time_changed
+
+from custom_components.dpk_smart_blind.batch import CalculationBatcher
+
+
+def _job(seen: list[tuple[datetime, int]], value: int) -> Callable[[datetime], int]:
+    def job(now: datetime) -> int:
+        seen.append((now, threading.get_ident()))
+        return value
+
+    return job
+
+
+async def test_small_batch_runs_inline(hass: HomeAssistant) -> None:
+    """Below the threshold the jobs run on the loop, sharing one `now`."""
+    batcher = CalculationBatcher(hass, threshold=4)
+    seen: list[tuple[datetime, int]] = []
+    results = await asyncio.gather(
+        *(batcher.async_run(_job(seen, i)) for i in range(3))
+    )
+    assert results == [0, 1, 2]
+    assert {now for now, _ in seen} == {seen[0][0]}
+    assert {thread for _, thread in seen} == {threading.get_ident()}
+
+
+async def test_large_batch_is_one_executor_job(hass: HomeAssistant) -> None:
+    """From the threshold up the batch runs off the loop, in one job."""
+    batcher = CalculationBatcher(hass, threshold=4)
+    seen: list[tuple[datetime, int]] = []
+    results = await asyncio.gather(
+        *(batcher.async_run(_job(seen, i)) for i in range(6))
+    )
+    assert results == list(range(6))
+    assert len({now for now, _ in seen}) == 1
+    threads = {thread for _, thread in seen}
+    assert len(threads) == 1
+    assert threading.get_ident() not in threads
+
+
+@pytest.mark.parametrize("count", [2, 5])
+async def test_failure_reaches_only_its_caller(hass: HomeAssistant, count: int) -> None:
+    """One blind's exception does not fail the rest of the batch."""
+    batcher = CalculationBatcher(hass, threshold=4)
+
+    def fail(_now: datetime) -> int:
+        msg = "bad options"
+        raise ValueError(msg)
+
+    seen: list[tuple[datetime, int]] = []
+    results = await asyncio.gather(
+        batcher.async_run(fail),
+        *(batcher.async_run(_job(seen, i)) for i in range(count - 1)),
+        return_exceptions=True,
+    )
+    assert isinstance(results[0], ValueError)
+    assert results[1:] == list(range(count - 1))
+
+
+async def test_hold_gathers_boot_refreshes(hass: HomeAssistant) -> None:
+    """Entries set up together share one first batch."""
+    batcher = CalculationBatcher(hass, threshold=10)
+    batcher.async_hold(3, 2.0)
+    seen: list[tuple[datetime, int]] = []
+    first = [asyncio.create_task(batcher.async_run(_job(seen, i))) for i in range(2)]
+    await asyncio.sleep(0.1)
+    assert not seen
+
+    assert await batcher.async_run(_job(seen, 2)) == 2
+    assert await asyncio.gather(*first) == [0, 1]
+    assert len(seen) == 3
+    assert len({now for now, _ in seen}) == 1
+
+
+async def test_hold_released_by_timeout(hass: HomeAssistant) -> None:
+    """A blind that never turns up does not hold the rest back for long."""
+    batcher = CalculationBatcher(hass, threshold=10)
+    batcher.async_hold(3, 2.0)
+    seen: list[tuple[datetime, int]] = []
+    task = asyncio.create_task(batcher.async_run(_job(seen, 0)))
+    await asyncio.sleep(0.1)
+    assert not task.done()
+
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=3))
+    assert await task == 0
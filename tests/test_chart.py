@@ -0,0 +1,120 @@
+"""Tests for the daily sun-path chart."""
+
+from datetime import date, datetime
+from pathlib import Path
+from xml.etree import ElementTree as ET
+from zoneinfo import ZoneInfo
+
+from astral import Observer
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import entity_registry as er
+from pytest_homeassistant_custom_component.common import (
+    MockConfigEntry,
+    async_mock_service,
+)
+
+from custom_components.dpk_smart_blind.chart import chart_directory, write_chart
+from custom_components.dpk_smart_blind.const import ATTR_CHART_URL, DOMAIN
+from custom_components.dpk_smart_blind.core.chart import (
+    COLOR_IN_FOV,
+    TRACK_STEP,
+    SunTrackCache,
+    sun_chart_svg,
+)
+from custom_components.dpk_smart_blind.core.config import WindowConfig
+from custom_components.dpk_smart_blind.core.solar import SolarModel
+
+from .const import MOCK_DATA, MOCK_OPTIONS
+
+TZ = ZoneInfo("Europe/London")
+SVG = "{http://www.w3.org/2000/svg}"
+
+
+def _config(azimuth: float, fov: float) -> WindowConfig:
+    return WindowConfig(
+        azimuth=azimuth,
+        fov_left=fov,
+        fov_right=fov,
+        distance=0.5,
+        window_height=2.1,
+        default_height=100.0,
+        delta_time=5.0,
+        tilt_mode=False,
+        slat_width=25.0,
+        slat_spacing=21.0,
+    )
+
+
+def _in_fov(svg: str) -> list[ET.Element]:
+    return [
+        line
+        for line in ET.fromstring(svg).iter(f"{SVG}polyline")  # noqa: S314
+        if line.get("stroke") == COLOR_IN_FOV
+    ]
+
+
+def test_track_cached_per_day() -> None:
+    """The track starts at local midnight and is rebuilt for the next day."""
+    tracks = SunTrackCache(SolarModel(Observer(51.5, -0.1), TZ))
+    track = tracks.day(datetime(2024, 6, 21, 13, tzinfo=TZ))
+    assert track.day == date(2024, 6, 21)
+    assert track.start == datetime(2024, 6, 21, tzinfo=TZ).timestamp()
+    assert len(track.azimuth) == 24 * 3600 // TRACK_STEP + 1
+    assert tracks.day(datetime(2024, 6, 21, 20, tzinfo=TZ)) is track
+    assert tracks.day(datetime(2024, 6, 22, 1, tzinfo=TZ)).day == date(2024, 6, 22)
+
+
+def test_sun_chart_svg() -> None:
+    """The path is picked out where the sun is in view, and not otherwise."""
+    tracks = SunTrackCache(SolarModel(Observer(51.5, -0.1), TZ))
+    summer = tracks.day(datetime(2024, 6, 21, 12, tzinfo=TZ))
+    svg = sun_chart_svg(summer, _config(180, 90), "Study & Hall")
+    title = ET.fromstring(svg).find(f"{SVG}title")  # noqa: S314
+    assert title.text == "Study & Hall 2024-06-21"
+    assert len(_in_fov(svg)) == 1
+
+    winter = tracks.day(datetime(2024, 12, 21, 12, tzinfo=TZ))
+    assert _in_fov(sun_chart_svg(winter, _config(0, 30), "Study")) == []
+
+
+def test_write_chart(tmp_path: Path) -> None:
+    """New content gets a new name and the old chart goes."""
+    first = write_chart(tmp_path, "abc", date(2024, 6, 21), "<svg/>")
+    assert write_chart(tmp_path, "abc", date(2024, 6, 21), "<svg/>") == first
+    second = write_chart(tmp_path, "abc", date(2024, 6, 21), "<svg></svg>")
+    assert second != first
+    assert [path.name for path in tmp_path.iterdir()] == [second]
+    assert (tmp_path / second).read_text(encoding="utf-8") == "<svg></svg>"
+
+    blocked = tmp_path / "file"
+    blocked.touch()
+    assert write_chart(blocked, "abc", date(2024, 6, 21), "<svg/>") is None
+
+
+async def test_image_entity(hass: HomeAssistant, tmp_path: Path) -> None:
+    """The chart is served by the entity and as a static file under www."""
+    hass.config.config_dir = str(tmp_path)
+    hass.states.async_set("sun.sun", "above_horizon", {"azimuth": 180, "elevation": 40})
+    hass.states.async_set("weather.home", "sunny", {"cloud_coverage": 10})
+    hass.states.async_set("cover.study", "open", {"current_position": 100})
+    async_mock_service(hass, "cover", "set_cover_position")
+    entry = MockConfigEntry(domain=DOMAIN, data=MOCK_DATA, options=MOCK_OPTIONS)
+    entry.add_to_hass(hass)
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    entity_id = next(
+        entity.entity_id
+        for entity in er.async_entries_for_config_entry(
+            er.async_get(hass), entry.entry_id
+        )
+        if entity.domain == "image"
+    )
+    url = hass.states.get(entity_id).attributes[ATTR_CHART_URL]
+    name = url.rsplit("/", 1)[-1]
+    assert url == f"/local/{DOMAIN}/{name}"
+    assert (chart_directory(hass) / name).read_text(encoding="utf-8").startswith("<svg")
+
+    assert await hass.config_entries.async_remove(entry.entry_id)
+    await hass.async_block_till_done()
+    assert list(chart_directory(hass).iterdir()) == []
@@ -0,0 +1,85 @@
+"""Tests for the cover command queue."""
+
+import asyncio
+
+from homeassistant.core import HomeAssistant, ServiceCall
+
+from custom_components.dpk_smart_blind.command_queue import (
+    CoverCommandGroup,
+    CoverCommandQueue,
+)
+
+
+async def test_unexpected_error_keeps_worker(hass: HomeAssistant) -> None:
+    """A cover raising something other than HomeAssistantError is counted."""
+    calls: list[ServiceCall] = []
+
+    async def _set_position(call: ServiceCall) -> None:
+        calls.append(call)
+        if len(calls) == 1:
+            msg = "bridge fell over"
+            raise ValueError(msg)
+
+    hass.services.async_register("cover", "set_cover_position", _set_position)
+    group = CoverCommandGroup(hass, "bridge", concurrency=1, spacing=0)
+    group.start()
+
+    group.async_set_position("cover.study", 40)
+    await hass.async_block_till_done()
+    group.async_set_position("cover.study", 60)
+    await hass.async_block_till_done()
+
+    assert len(calls) == 2
+    assert group.stats["failed"] == 1
+    assert group.stats["sent"] == 1
+    group.stop()
+
+
+async def test_configure_lets_sends_finish(hass: HomeAssistant) -> None:
+    """Changing the concurrency does not cancel commands being sent."""
+    started = asyncio.Event()
+    release = asyncio.Event()
+
+    async def _set_position(_call: ServiceCall) -> None:
+        started.set()
+        await release.wait()
+
+    hass.services.async_register("cover", "set_cover_position", _set_position)
+    group = CoverCommandGroup(hass, "bridge", concurrency=2, spacing=0)
+    group.start()
+
+    group.async_set_position("cover.study", 40)
+    await started.wait()
+    group.configure(1, 0, 10)
+    group.configure(3, 0, 10)
+    assert len(group._workers) == 3
+
+    release.set()
+    await hass.async_block_till_done()
+    assert group.stats["sent"] == 1
+    assert group.stats["failed"] == 0
+
+    group.async_set_position("cover.kitchen", 20)
+    await hass.async_block_till_done()
+    assert group.stats["sent"] == 2
+    group.stop()
+
+
+async def test_group_takes_most_conservative_limits(hass: HomeAssistant) -> None:
+    """Blinds sharing a bridge get the same limits whatever order they load in."""
+    queue = CoverCommandQueue(hass)
+    group = queue.async_get_group("study", "bridge", 3, 0.5, 10)
+    assert queue.async_get_group("lounge", "bridge", 1, 0.2, 20) is group
+    assert queue.async_get_group("hall", "bridge", 2, 1.0, 5) is group
+    assert (group._concurrency, group._spacing, group._timeout) == (1, 1.0, 20)
+
+    """Reloading an entry with the same options changes nothing."""
+    queue.async_release("study")
+    queue.async_get_group("study", "bridge", 3, 0.5, 10)
+    assert (group._concurrency, group._spacing, group._timeout) == (1, 1.0, 20)
+
+    queue.async_release("lounge")
+    assert (group._concurrency, group._spacing, group._timeout) == (2, 1.0, 10)
+    queue.async_release("hall")
+    queue.async_release("study")
+    assert queue.stats == {}
@@ -0,0 +1,50 @@
+"""Tests for the Home Assistant-free calculation core."""
+
+import subprocess
+import sys
+from pathlib import Path
+
+INTEGRATION = (
+    Path(__file__).resolve().parent.parent / "custom_components" / "dpk_smart_blind"
+)
+
+SCRIPT = """
+import sys
+from datetime import datetime
+from zoneinfo import ZoneInfo
+
+from astral import Observer
+
+from core import SolarModel, WindowCalculator, WindowConfig
+
+tz = ZoneInfo("Europe/London")
+config = WindowConfig(
+    azimuth=180.0,
+    fov_left=90.0,
+    fov_right=90.0,
+    distance=0.5,
+    window_height=2.1,
+    default_height=100.0,
+    delta_time=5.0,
+    tilt_mode=True,
+    slat_width=25.0,
+    slat_spacing=21.0,
+)
+calculator = WindowCalculator(config, SolarModel(Observer(51.5, -0.1), tz))
+result = calculator.solve(datetime(2024, 6, 21, 13, tzinfo=tz), 170.0)
+print(result.sun_state.name, "homeassistant" in sys.modules)
+"""
+
+
+def test_runs_without_home_assistant() -> None:
+    """The core calculates a window without importing Home Assistant."""
+    result = subprocess.run(  # noqa: S603
+        [sys.executable, "-c", SCRIPT],
+        capture_output=True,
+        text=True,
+        check=False,
+        cwd=INTEGRATION,
+        timeout=60,
+    )
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.split() == ["IN_FRONT", "False"]
@@ -0,0 +1,78 @@
+"""Tests for the cover move decisions."""
+
+from custom_components.dpk_smart_blind.core.const import (
+    STATE_CLOSING,
+    STATE_OPENING,
+    StateOfSunInWindow,
+)
+from custom_components.dpk_smart_blind.core.decision import CoverPolicy
+from custom_components.dpk_smart_blind.core.snapshot import BlindSnapshot
+
+
+def _data(setting: float, *, sun_out: bool = True) -> BlindSnapshot:
+    return BlindSnapshot(
+        cover_setting=setting,
+        sun_state=StateOfSunInWindow.IN_FRONT,
+        sun_out=sun_out,
+    )
+
+
+def test_gated_or_unchanged_setting_not_sent() -> None:
+    """Nothing is sent while the sun is in, or for a setting already sent."""
+    policy = CoverPolicy("Study", 5, 5)
+    assert policy.position_target(_data(40, sun_out=False), 100, None) is None
+    assert policy.position_target(_data(40), 100, None) == 40
+    assert policy.position_target(_data(40), 100, None) is None
+
+
+def test_stopped_cover_within_delta() -> None:
+    """A settled cover close enough to the target is left alone."""
+    policy = CoverPolicy("Study", 5, 5)
+    assert policy.position_target(_data(43), 40, None) is None
+    assert policy.position_target(_data(50), 40, None) == 50
+
+
+def test_travelling_to_our_target_suppresses_nearby() -> None:
+    """A cover on its way to what we asked for needs no second command."""
+    policy = CoverPolicy("Study", 5, 5)
+    assert policy.position_target(_data(80), 20, None) == 80
+    assert policy.position_target(_data(83), 40, STATE_OPENING) is None
+    assert policy.position_target(_data(60), 40, STATE_OPENING) == 60
+
+
+def test_travelling_elsewhere_is_not_redundant() -> None:
+    """A move someone else started does not swallow our command."""
+    policy = CoverPolicy("Study", 5, 5)
+    assert policy.position_target(_data(70), 40, STATE_OPENING) == 70
+
+    policy = CoverPolicy("Study", 5, 5)
+    assert policy.position_target(_data(80), 20, None) == 80
+    assert policy.position_target(_data(10), 60, STATE_CLOSING) == 10
+
+
+def test_commanded_target_follows_direction() -> None:
+    """Our last target only counts while the cover moves towards it."""
+    policy = CoverPolicy("Study", 5, 5)
+    assert policy.commanded_target(40, STATE_OPENING) is None
+    policy.position_target(_data(80), 20, None)
+    assert policy.commanded_target(40, STATE_OPENING) == 80
+    assert policy.commanded_target(40, STATE_CLOSING) is None
+
+
+def test_tilt_delta() -> None:
+    """A tilt is only sent once it moves past the delta."""
+    policy = CoverPolicy("Study", 5, 5)
+    data = BlindSnapshot(
+        cover_tilt=53, sun_state=StateOfSunInWindow.IN_FRONT, sun_out=True
+    )
+    assert policy.tilt_target(data, 50) is None
+    assert policy.tilt_target(data, 40) == 53
+
+
+def test_override() -> None:
+    """A settled position far from the last command is an override."""
+    policy = CoverPolicy("Study", 5, 5)
+    assert policy.is_override(40)
+    policy.position_target(_data(40), 100, None)
+    assert not policy.is_override(44)
+    assert policy.is_override(60)
@@ -0,0 +1,77 @@
+"""Tests for the entities each blind creates."""
+
+from homeassistant.const import CONF_NAME
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import entity_registry as er
+from pytest_homeassistant_custom_component.common import (
+    MockConfigEntry,
+    async_mock_service,
+)
+
+from custom_components.dpk_smart_blind.const import (
+    ATTR_AZIMUTH,
+    ATTR_ELEVATION,
+    CONF_ENTITY,
+    CONF_TILT_MODE,
+    DOMAIN,
+)
+
+from .const import MOCK_DATA, MOCK_OPTIONS
+
+
+async def test_lightweight_defaults(hass: HomeAssistant) -> None:
+    """Diagnostics start disabled and the sun position is published once."""
+    hass.states.async_set("sun.sun", "above_horizon", {"azimuth": 180, "elevation": 40})
+    hass.states.async_set("weather.home", "sunny", {"cloud_coverage": 10})
+    async_mock_service(hass, "cover", "set_cover_position")
+    entries = [
+        MockConfigEntry(domain=DOMAIN, data=MOCK_DATA, options=MOCK_OPTIONS),
+        MockConfigEntry(
+            domain=DOMAIN,
+            data={CONF_NAME: "Kitchen"},
+            options={
+                **MOCK_OPTIONS,
+                CONF_ENTITY: "cover.kitchen",
+                CONF_TILT_MODE: True,
+            },
+        ),
+    ]
+    for entry in entries:
+        hass.states.async_set(
+            entry.options[CONF_ENTITY], "open", {"current_position": 100}
+        )
+        entry.add_to_hass(hass)
+        assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    registry = er.async_get(hass)
+    for entry in entries:
+        blind = er.async_entries_for_config_entry(registry, entry.entry_id)
+        diagnostics = [e for e in blind if e.entity_category is not None]
+        assert diagnostics
+        for entity in diagnostics:
+            assert entity.disabled_by is er.RegistryEntryDisabler.INTEGRATION
+            assert hass.states.get(entity.entity_id) is None
+        assert any(e.unique_id.endswith("Height") for e in blind)
+
+    tilt = [
+        [
+            e
+            for e in er.async_entries_for_config_entry(registry, entry.entry_id)
+            if e.unique_id.endswith("Tilt")
+        ]
+        for entry in entries
+    ]
+    assert [len(sensors) for sensors in tilt] == [0, 1]
+
+    for key in (ATTR_AZIMUTH, ATTR_ELEVATION):
+        entity_id = registry.async_get_entity_id(
+            "sensor", DOMAIN, f"{DOMAIN}-sun-{key}"
+        )
+        assert hass.states.get(entity_id) is not None
+    shared = [
+        e
+        for e in registry.entities.values()
+        if e.platform == DOMAIN and e.unique_id.startswith(f"{DOMAIN}-sun-")
+    ]
+    assert len(shared) == 2
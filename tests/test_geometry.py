@@ -0,0 +1,91 @@
+"""Tests for the window shading geometry."""
+
+import math
+
+import numpy as np
+import pytest
+
+from custom_components.dpk_smart_blind.core.config import WindowConfig
+from custom_components.dpk_smart_blind.core.geometry import WindowGeometry
+
+
+def _config(**fields: object) -> WindowConfig:
+    return WindowConfig(
+        **{
+            "azimuth": 180.0,
+            "fov_left": 90.0,
+            "fov_right": 90.0,
+            "distance": 0.5,
+            "window_height": 2.1,
+            "default_height": 100.0,
+            "delta_time": 5.0,
+            "tilt_mode": False,
+            "slat_width": 25.0,
+            "slat_spacing": 21.0,
+            **fields,
+        }
+    )
+
+
+def test_profile_angle() -> None:
+    """Straight ahead it is the elevation; off to the side it steepens."""
+    geometry = WindowGeometry.from_config(_config())
+    assert geometry.profile_angle(180, 30) == pytest.approx(30)
+    oblique = geometry.profile_angle(240, 30)
+    assert oblique == pytest.approx(
+        math.degrees(math.atan(math.tan(math.radians(30)) / math.cos(math.radians(60))))
+    )
+    assert oblique > 30
+    assert geometry.profile_angle(270, 30) == 90
+
+
+def test_cover_height_follows_profile() -> None:
+    """The sun may reach the shaded area's edge and no further."""
+    geometry = WindowGeometry.from_config(_config())
+    assert geometry.cover_height(180, 45) == pytest.approx(0.5)
+    assert geometry.cover_height(240, 45) == pytest.approx(1.0)
+    assert geometry.cover_height(180, 80) == 2.1
+    assert geometry.cover_height(0, 45) == 2.1
+
+
+def test_vectorised_matches_scalar() -> None:
+    """The day-table path agrees with the per-tick one."""
+    geometry = WindowGeometry.from_config(_config(azimuth=135.0))
+    azimuth, elevation = np.meshgrid(np.arange(0, 360, 7.5), np.arange(1, 89, 4.0))
+    expected = [
+        geometry.cover_height(a, e)
+        for a, e in zip(azimuth.ravel(), elevation.ravel(), strict=True)
+    ]
+    np.testing.assert_allclose(
+        geometry.cover_heights(azimuth.ravel(), elevation.ravel()), expected
+    )
+
+
+def test_most_protective_zone_wins() -> None:
+    """A zone closer to the glass keeps the cover lower than the shaded area."""
+    geometry = WindowGeometry.from_config(_config(zones=((0.3, 0.1),)))
+    assert geometry.cover_height(180, 45) == pytest.approx(0.4)
+    reach = math.tan(math.radians(80))
+    assert geometry.cover_height(180, 80) == pytest.approx(0.1 + 0.3 * reach)
+    assert geometry.cover_height(0, 45) == 2.1
+
+
+def test_zone_below_sill() -> None:
+    """A zone below the window can call for cover past the sill."""
+    geometry = WindowGeometry.from_config(_config(zones=((0.2, -0.3),)))
+    assert geometry.cover_height(180, 45) == pytest.approx(-0.1)
+
+
+def test_vectorised_matches_scalar_with_zones() -> None:
+    """Both paths pick the same zone at every sun position."""
+    geometry = WindowGeometry.from_config(
+        _config(azimuth=200.0, zones=((0.3, 0.1), (1.5, 0.7), (0.2, -0.3)))
+    )
+    azimuth, elevation = np.meshgrid(np.arange(0, 360, 7.5), np.arange(1, 89, 4.0))
+    expected = [
+        geometry.cover_height(a, e)
+        for a, e in zip(azimuth.ravel(), elevation.ravel(), strict=True)
+    ]
+    np.testing.assert_allclose(
+        geometry.cover_heights(azimuth.ravel(), elevation.ravel()), expected
+    )
@@ -0,0 +1,58 @@
+"""Tests for the clear-sky direct-beam irradiance."""
+
+from datetime import datetime
+from zoneinfo import ZoneInfo
+
+import numpy as np
+import pytest
+from astral import Observer
+
+from custom_components.dpk_smart_blind.core.irradiance import (
+    CURVE_STEP,
+    ClearSkyCurve,
+    ClearSkyDay,
+    clear_sky_beam,
+    cloud_attenuation,
+)
+from custom_components.dpk_smart_blind.core.solar import SolarModel
+
+TZ = ZoneInfo("Europe/London")
+
+
+def test_clear_sky_beam() -> None:
+    """Overhead sun loses about a quarter to the air; none with the sun down."""
+    beam = clear_sky_beam(np.array([-5.0, 10.0, 90.0]), 172)
+    assert beam[0] == 0
+    assert beam[1] < beam[2]
+    assert beam[2] == pytest.approx(
+        1367 * (1 + 0.033 * np.cos(2 * np.pi * 172 / 365)) * 0.7, rel=0.01
+    )
+
+
+def test_cloud_attenuation() -> None:
+    """Overcast leaves a quarter of the beam; out-of-range cover is clamped."""
+    assert cloud_attenuation(0) == 1
+    assert cloud_attenuation(100) == pytest.approx(0.25)
+    assert cloud_attenuation(150) == cloud_attenuation(100)
+
+
+def test_on_surface() -> None:
+    """Samples are interpolated and a surface facing away gets nothing."""
+    day = ClearSkyDay(0.0, 2 * CURVE_STEP, ((0, 100, 0), (0, 300, 0), (0, 300, 0)))
+    assert day.on_surface(CURVE_STEP / 2, (0, 1, 0)) == pytest.approx(200)
+    assert day.on_surface(CURVE_STEP * 5, (0, 1, 0)) == pytest.approx(300)
+    assert day.on_surface(CURVE_STEP / 2, (0, -1, 0)) == 0
+
+
+def test_curve_follows_the_sun() -> None:
+    """A south window gets most at noon, and the curve is rebuilt each day."""
+    curve = ClearSkyCurve(SolarModel(Observer(51.5, -0.1), TZ))
+    south = (0.0, -1.0, 0.0)
+    noon = curve.irradiance(datetime(2024, 6, 21, 13, tzinfo=TZ), south)
+    morning = curve.irradiance(datetime(2024, 6, 21, 9, tzinfo=TZ), south)
+    assert noon > morning > 0
+    assert curve.irradiance(datetime(2024, 6, 21, 23, tzinfo=TZ), south) == 0
+
+    today = curve.day(datetime(2024, 6, 21, 13, tzinfo=TZ))
+    assert curve.day(datetime(2024, 6, 21, 18, tzinfo=TZ)) is today
+    assert not curve.day(datetime(2024, 6, 22, 1, tzinfo=TZ)).covers(today.start)
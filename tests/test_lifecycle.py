@@ -0,0 +1,52 @@
+"""Tests for the per-blind timer and subscription owner."""
+
+from datetime import timedelta
+from unittest.mock import AsyncMock, MagicMock
+
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+from pytest_homeassistant_custom_component.common import async_fire_time_changed
+
+from custom_components.dpk_smart_blind.lifecycle import EntryLifecycle
+
+
+async def test_rearming_replaces_timer(hass: HomeAssistant) -> None:
+    """Only the newest wakeup for a purpose fires."""
+    lifecycle = EntryLifecycle(hass, "Study")
+    first, second = MagicMock(), MagicMock()
+    lifecycle.async_call_later("dwell", 10, first)
+    lifecycle.async_call_later("dwell", 20, second)
+    assert lifecycle.pending("dwell")
+
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=30))
+    await hass.async_block_till_done()
+    first.assert_not_called()
+    second.assert_called_once()
+    assert not lifecycle.pending("dwell")
+    stats = lifecycle.stats
+    assert (stats["armed"], stats["fired"], stats["cancelled"]) == (2, 1, 1)
+    assert stats["timers"] == 0
+
+
+async def test_close_releases_everything(hass: HomeAssistant) -> None:
+    """Closing cancels timers, awaits async unsubscribes and refuses new ones."""
+    lifecycle = EntryLifecycle(hass, "Study")
+    action = MagicMock()
+    unsubscribe = AsyncMock()
+    lifecycle.async_call_later("arrival", 10, action)
+    lifecycle.async_add("weather", unsubscribe)
+    assert lifecycle.stats["pending"] == ["arrival", "weather"]
+
+    await lifecycle.async_close()
+    unsubscribe.assert_awaited_once()
+    late = MagicMock()
+    lifecycle.async_add("cover", late)
+    lifecycle.async_call_later("dwell", 10, action)
+    late.assert_called_once()
+
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=30))
+    await hass.async_block_till_done()
+    action.assert_not_called()
+    assert lifecycle.stats["closed"]
+    assert lifecycle.stats["pending"] == []
+    assert lifecycle.stats["cancelled"] == 2
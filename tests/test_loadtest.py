@@ -0,0 +1,23 @@
+"""Tests for the load-test harness."""
+
+import subprocess
+import sys
+from pathlib import Path
+
+SCRIPT = Path(__file__).resolve().parent.parent / "scripts" / "loadtest.py"
+
+
+def test_reports_each_count() -> None:
+    """A small run sets up, ticks and unloads every entry and reports a row."""
+    result = subprocess.run(  # noqa: S603
+        [sys.executable, str(SCRIPT), "1", "3"],
+        capture_output=True,
+        text=True,
+        check=False,
+        timeout=120,
+    )
+    assert result.returncode == 0, result.stderr
+    rows = [line.split() for line in result.stdout.splitlines()[2:]]
+    assert [row[0] for row in rows] == ["1", "3"]
+    for row in rows:
+        assert float(row[-2]) > 0  # writes per simulated hour
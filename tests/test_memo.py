@@ -0,0 +1,76 @@
+"""Tests for sharing results between identical windows."""
+
+from dataclasses import replace
+from datetime import datetime
+from zoneinfo import ZoneInfo
+
+from astral import Observer
+
+from custom_components.dpk_smart_blind.core.config import WindowConfig
+from custom_components.dpk_smart_blind.core.const import StateOfSunInWindow
+from custom_components.dpk_smart_blind.core.memo import (
+    CalculationMemo,
+    WindowResult,
+    geometry_key,
+)
+from custom_components.dpk_smart_blind.core.snapshot import BlindSnapshot
+from custom_components.dpk_smart_blind.core.solar import SolarModel
+from custom_components.dpk_smart_blind.core.window import WindowCalculator
+
+CONFIG = WindowConfig(
+    azimuth=180.0,
+    fov_left=90.0,
+    fov_right=90.0,
+    distance=0.5,
+    window_height=2.1,
+    default_height=100.0,
+    delta_time=5.0,
+    tilt_mode=False,
+    slat_width=25.0,
+    slat_spacing=21.0,
+)
+RESULT = WindowResult(180.0, 40.0, StateOfSunInWindow.IN_FRONT, 2.5, 0.4, 40.0)
+
+
+def test_lru() -> None:
+    """Hits refresh an entry; the least recently used one is dropped."""
+    memo = CalculationMemo(size=2)
+    computed: list[str] = []
+
+    def compute(key: str) -> WindowResult:
+        computed.append(key)
+        return RESULT
+
+    for key in ("a", "b", "a", "c", "a", "b"):
+        memo.get(key, lambda key=key: compute(key))
+    assert computed == ["a", "b", "c", "b"]
+    assert (memo.hits, memo.misses) == (2, 4)
+
+    memo.clear()
+    memo.get("a", lambda: compute("a"))
+    assert computed[-1] == "a"
+
+
+def test_geometry_key() -> None:
+    """Settings that only differ in representation share a key."""
+    assert geometry_key(CONFIG) == geometry_key(replace(CONFIG, azimuth=540.0))
+    assert geometry_key(CONFIG) == geometry_key(replace(CONFIG, default_height=50.0))
+    assert geometry_key(CONFIG) != geometry_key(replace(CONFIG, zones=((1.0, 0.2),)))
+
+
+def test_identical_windows_share_a_result() -> None:
+    """The second of two matching windows in a tick is a memo hit."""
+    solar = SolarModel(Observer(51.5, -0.1), ZoneInfo("Europe/London"))
+    memo = CalculationMemo()
+    now = datetime(2024, 6, 21, 13, 0, tzinfo=ZoneInfo("Europe/London"))
+    first = WindowCalculator(CONFIG, solar, memo=memo)
+    second = WindowCalculator(replace(CONFIG, default_height=50.0), solar, memo=memo)
+    other = WindowCalculator(replace(CONFIG, azimuth=200.0), solar, memo=memo)
+
+    results = [
+        calculator.calculate(now, BlindSnapshot())
+        for calculator in (first, second, other)
+    ]
+    assert results[0] == results[1]
+    assert results[0].cover_setting != results[2].cover_setting
+    assert (memo.hits, memo.misses) == (1, 2)
@@ -0,0 +1,129 @@
+"""Tests for the cover curve preview."""
+
+from datetime import date
+from zoneinfo import ZoneInfo
+
+import numpy as np
+from astral import Observer
+from homeassistant.core import HomeAssistant
+from homeassistant.data_entry_flow import FlowResultType
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.dpk_smart_blind.config_flow import (
+    PREVIEW_ACCEPT,
+    PREVIEW_ACTION,
+    PREVIEW_DATE,
+    PREVIEW_UPDATE,
+)
+from custom_components.dpk_smart_blind.const import (
+    CONF_AZIMUTH,
+    CONF_DEFAULT_HEIGHT,
+    CONF_DELTA_POSITION,
+    CONF_ENTITY,
+    CONF_FOV_LEFT,
+    CONF_FOV_RIGHT,
+    CONF_TILT_MODE,
+    DOMAIN,
+)
+from custom_components.dpk_smart_blind.core.tilt import TILT_OPEN
+from custom_components.dpk_smart_blind.preview import (
+    cover_curve,
+    preview_placeholders,
+    solar_track,
+)
+
+from .const import MOCK_DATA, MOCK_OPTIONS
+
+LONDON = Observer(51.5, -0.1)
+TZ = ZoneInfo("Europe/London")
+
+
+def test_south_window_midsummer() -> None:
+    """The cover is left alone until the sun arrives, then back to default."""
+    track = solar_track(LONDON, date(2024, 6, 21), TZ)
+    curve = cover_curve(MOCK_OPTIONS, track, LONDON)
+    assert curve.entry is not None
+    assert curve.exit is not None
+
+    """Field of view is 90..270 degrees; the sun crosses both edges."""
+    first = curve.times.index(curve.entry)
+    after = curve.times.index(curve.exit)
+    assert track.azimuth[first - 1] < 90 <= track.azimuth[first]
+    assert track.azimuth[after - 1] < 270 <= track.azimuth[after]
+    assert np.isnan(curve.positions[:first]).all()
+    assert (curve.positions[after:] == MOCK_OPTIONS[CONF_DEFAULT_HEIGHT]).all()
+    noon = curve.positions[first:after]
+    assert ((noon >= 0) & (noon <= 100)).all()
+
+    """The cover is only sent a new position once it has moved past the delta."""
+    steps = np.diff(noon)[np.diff(noon) != 0]
+    assert (abs(steps) > MOCK_OPTIONS[CONF_DELTA_POSITION]).all()
+
+
+def test_tilt_mode_previews_tilt() -> None:
+    """Venetian windows preview the slat tilt, opened level once the sun leaves."""
+    options = {**MOCK_OPTIONS, CONF_TILT_MODE: True}
+    track = solar_track(LONDON, date(2024, 12, 21), TZ)
+    curve = cover_curve(options, track, LONDON)
+    assert curve.tilt
+    first = curve.times.index(curve.entry)
+    after = curve.times.index(curve.exit)
+    assert 0 <= curve.positions[first:after].min() < TILT_OPEN
+    assert (curve.positions[after:] == TILT_OPEN).all()
+    assert preview_placeholders(curve)["curve"].startswith("| Time | Tilt |")
+
+
+def test_sun_never_in_window() -> None:
+    """A north window in midwinter gets no table, just a note."""
+    options = {**MOCK_OPTIONS, CONF_AZIMUTH: 0, CONF_FOV_LEFT: 30, CONF_FOV_RIGHT: 30}
+    track = solar_track(LONDON, date(2024, 12, 21), TZ)
+    curve = cover_curve(options, track, LONDON)
+    assert curve.entry is None
+    assert np.isnan(curve.positions).all()
+    placeholders = preview_placeholders(curve)
+    assert placeholders["entry"] == "-"
+    assert "does not enter" in placeholders["curve"]
+
+
+async def test_options_flow_preview(hass: HomeAssistant) -> None:
+    """Window settings are previewed before moving on to the climate step."""
+    entry = MockConfigEntry(domain=DOMAIN, data=MOCK_DATA, options=MOCK_OPTIONS)
+    entry.add_to_hass(hass)
+
+    result = await hass.config_entries.options.async_init(entry.entry_id)
+    result = await hass.config_entries.options.async_configure(
+        result["flow_id"], {"next_step_id": "blind"}
+    )
+    assert result["step_id"] == "window"
+    result = await hass.config_entries.options.async_configure(
+        result["flow_id"], {CONF_AZIMUTH: 180, CONF_ENTITY: "cover.study"}
+    )
+    assert result["type"] is FlowResultType.FORM
+    assert result["step_id"] == "preview"
+    assert result["description_placeholders"]["curve"].startswith("| Time |")
+
+    result = await hass.config_entries.options.async_configure(
+        result["flow_id"],
+        {PREVIEW_DATE: "2024-12-21", PREVIEW_ACTION: PREVIEW_UPDATE},
+    )
+    assert result["step_id"] == "preview"
+    assert result["description_placeholders"]["date"] == "2024-12-21"
+
+    result = await hass.config_entries.options.async_configure(
+        result["flow_id"], {PREVIEW_ACTION: PREVIEW_ACCEPT}
+    )
+    assert result["step_id"] == "climate"
+
+
+def test_clock_change_days() -> None:
+    """Samples follow real time across a clock change and are labelled locally."""
+    spring = solar_track(LONDON, date(2024, 3, 31), TZ)
+    autumn = solar_track(LONDON, date(2024, 10, 27), TZ)
+    assert len(spring.times) == 23 * 6
+    assert len(autumn.times) == 25 * 6
+    assert spring.times[12].hour == 3  # 01:00 GMT jumped to 02:00 BST
+    assert [t.hour for t in autumn.times[6:19:6]] == [1, 1, 2]
+
+    """Solar noon is near 12:00 GMT: 13:00 BST in spring, 11:40 GMT in autumn."""
+    noon = [track.times[int(np.argmax(track.elevation))] for track in (spring, autumn)]
+    assert [f"{t:%H}" for t in noon] == ["13", "11"]
@@ -0,0 +1,94 @@
+"""Tests for the offline recorder replay."""
+
+import json
+import sqlite3
+import subprocess
+import sys
+from datetime import date, datetime, time
+from pathlib import Path
+from zoneinfo import ZoneInfo
+
+from custom_components.dpk_smart_blind.const import DOMAIN
+
+from .const import MOCK_OPTIONS
+
+SCRIPT = Path(__file__).resolve().parent.parent / "scripts" / "replay.py"
+TZ = ZoneInfo("Europe/London")
+DAY = date(2024, 6, 21)
+
+SCHEMA = """
+    CREATE TABLE states_meta (metadata_id INTEGER PRIMARY KEY, entity_id TEXT);
+    CREATE TABLE state_attributes (
+        attributes_id INTEGER PRIMARY KEY, shared_attrs TEXT
+    );
+    CREATE TABLE states (
+        state_id INTEGER PRIMARY KEY,
+        metadata_id INTEGER,
+        state TEXT,
+        attributes_id INTEGER,
+        last_updated_ts REAL
+    );
+"""
+
+# (local time, entity, state, attributes) recorded over midsummer's day.
+RECORDED = [
+    ("00:00", "cover.study", "open", {"current_position": 100}),
+    ("00:01", "weather.home", "sunny", {"cloud_coverage": 10}),
+    ("16:00", "cover.study", "open", {"current_position": 20}),
+    ("23:59", "weather.home", "sunny", {"cloud_coverage": 10}),
+]
+
+
+def _write_storage(config: Path) -> None:
+    storage = config / ".storage"
+    storage.mkdir()
+    core_config = {"time_zone": "Europe/London", "latitude": 51.5, "longitude": -0.1}
+    entries = {
+        "entries": [{"domain": DOMAIN, "title": "Study", "options": MOCK_OPTIONS}]
+    }
+    for key, data in (("core.config", core_config), ("core.config_entries", entries)):
+        (storage / key).write_text(json.dumps({"data": data}), encoding="utf-8")
+
+
+def _write_db(path: Path) -> None:
+    connection = sqlite3.connect(path)
+    connection.executescript(SCHEMA)
+    entities = sorted({entity for _, entity, _, _ in RECORDED})
+    connection.executemany(
+        "INSERT INTO states_meta VALUES (?, ?)", enumerate(entities, 1)
+    )
+    for row, (clock, entity, state, attributes) in enumerate(RECORDED, 1):
+        when = datetime.combine(DAY, time.fromisoformat(clock), TZ)
+        connection.execute(
+            "INSERT INTO state_attributes VALUES (?, ?)", (row, json.dumps(attributes))
+        )
+        connection.execute(
+            "INSERT INTO states VALUES (?, ?, ?, ?, ?)",
+            (row, entities.index(entity) + 1, state, row, when.timestamp()),
+        )
+    connection.commit()
+    connection.close()
+
+
+def test_replays_a_recorded_day(tmp_path: Path) -> None:
+    """Every tick of the day is calculated and the sunny spell moves the blind."""
+    _write_storage(tmp_path)
+    _write_db(tmp_path / "home-assistant_v2.db")
+    result = subprocess.run(  # noqa: S603
+        [sys.executable, str(SCRIPT), str(tmp_path), "--commands"],
+        capture_output=True,
+        text=True,
+        check=False,
+        timeout=120,
+    )
+    assert result.returncode == 0, result.stderr
+    lines = result.stdout.splitlines()
+    assert lines[0].startswith("4 states")
+    assert lines[1] == "Study (cover.study)"
+    day, ticks, commands, overrides, _ = lines[3].split()
+    assert day == DAY.isoformat()
+    assert int(ticks) == 24 * 60 // 5 - 1
+    assert int(commands) > 0
+    assert int(overrides) == 1
+    assert all(" position " in line for line in lines[5:])
+    assert len(lines[5:]) == int(commands)
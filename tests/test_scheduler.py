@@ -0,0 +1,65 @@
+"""Tests for the domain-wide tick scheduler."""
+
+from datetime import timedelta
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from freezegun.api import FrozenDateTimeFactory
+from homeassistant.core import HomeAssistant
+from pytest_homeassistant_custom_component.common import (
+    MockConfigEntry,
+    async_mock_service,
+)
+
+from custom_components.dpk_smart_blind.const import DOMAIN
+from custom_components.dpk_smart_blind.scheduler import TICK_MINUTES, TickScheduler
+
+from .const import MOCK_DATA, MOCK_OPTIONS
+
+
+def _coordinator(name: str, error: Exception | None = None) -> MagicMock:
+    coordinator = MagicMock()
+    coordinator.name = name
+    coordinator.async_refresh = AsyncMock(side_effect=error)
+    return coordinator
+
+
+async def test_failed_refresh_does_not_stop_others(
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Every blind is refreshed and the failure is logged against its blind."""
+    coordinators = [
+        _coordinator("Study"),
+        _coordinator("Kitchen", RuntimeError("boom")),
+        _coordinator("Lounge"),
+    ]
+    await TickScheduler._async_refresh(coordinators)
+
+    for coordinator in coordinators:
+        coordinator.async_refresh.assert_awaited_once()
+    assert "Kitchen: tick refresh failed" in caplog.text
+    assert "Study" not in caplog.text
+    assert "boom" in caplog.text
+
+
+async def test_unchanged_decision_does_not_notify(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> None:
+    """A tick that only moves the sun leaves the blind's entities asleep."""
+    freezer.move_to("2024-06-21T10:00:00+00:00")  # 03:00 in the test time zone
+    hass.states.async_set("weather.home", "sunny", {"cloud_coverage": 10})
+    hass.states.async_set("cover.study", "open", {"current_position": 100})
+    async_mock_service(hass, "cover", "set_cover_position")
+    entry = MockConfigEntry(domain=DOMAIN, data=MOCK_DATA, options=MOCK_OPTIONS)
+    entry.add_to_hass(hass)
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+    coordinator = entry.runtime_data.coordinator
+    listener = MagicMock()
+    coordinator.async_add_listener(listener)
+
+    before = coordinator.data
+    freezer.tick(timedelta(minutes=TICK_MINUTES))
+    await coordinator.async_refresh()
+    assert coordinator.data.azimuth != before.azimuth
+    listener.assert_not_called()
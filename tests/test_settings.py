@@ -0,0 +1,71 @@
+"""Tests for the settings shared by every blind."""
+
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+from homeassistant.data_entry_flow import FlowResultType
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.dpk_smart_blind.batch import async_get_batcher
+from custom_components.dpk_smart_blind.const import (
+    CONF_EXECUTOR_THRESHOLD,
+    CONF_SUN_POSITION_ENTITY,
+    DOMAIN,
+)
+from custom_components.dpk_smart_blind.settings import STORAGE_KEY
+from custom_components.dpk_smart_blind.solar import async_get_solar
+
+from .const import MOCK_DATA, MOCK_OPTIONS
+
+
+async def _setup(hass: HomeAssistant) -> MockConfigEntry:
+    hass.states.async_set("sun.sun", "above_horizon", {"azimuth": 180, "elevation": 40})
+    entry = MockConfigEntry(domain=DOMAIN, data=MOCK_DATA, options=MOCK_OPTIONS)
+    entry.add_to_hass(hass)
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+    return entry
+
+
+async def test_stored_settings_applied_at_setup(
+    hass: HomeAssistant, hass_storage: dict[str, Any]
+) -> None:
+    """Settings saved earlier are in force before the blinds start."""
+    hass_storage[STORAGE_KEY] = {
+        "version": 1,
+        "key": STORAGE_KEY,
+        "data": {CONF_EXECUTOR_THRESHOLD: 12, CONF_SUN_POSITION_ENTITY: True},
+    }
+    await _setup(hass)
+    assert async_get_batcher(hass).threshold == 12
+    assert async_get_solar(hass).from_entity
+
+
+async def test_options_step_updates_every_blind(
+    hass: HomeAssistant, hass_storage: dict[str, Any]
+) -> None:
+    """The shared step applies and stores its settings without a reload."""
+    entry = await _setup(hass)
+    assert async_get_batcher(hass).threshold == 4
+    assert not async_get_solar(hass).from_entity
+
+    result = await hass.config_entries.options.async_init(entry.entry_id)
+    assert result["type"] is FlowResultType.MENU
+    assert "shared" in result["menu_options"]
+    result = await hass.config_entries.options.async_configure(
+        result["flow_id"], {"next_step_id": "shared"}
+    )
+    assert result["step_id"] == "shared"
+    result = await hass.config_entries.options.async_configure(
+        result["flow_id"],
+        {CONF_EXECUTOR_THRESHOLD: 8, CONF_SUN_POSITION_ENTITY: True},
+    )
+    await hass.async_block_till_done()
+
+    assert result["type"] is FlowResultType.CREATE_ENTRY
+    assert entry.options == MOCK_OPTIONS
+    assert async_get_batcher(hass).threshold == 8
+    solar = async_get_solar(hass)
+    assert solar.from_entity
+    assert solar.observation(hass.states.get("sun.sun").last_updated) == (180, 40)
+    assert hass_storage[STORAGE_KEY]["data"][CONF_SUN_POSITION_ENTITY]
@@ -0,0 +1,57 @@
+"""Tests for the calculation snapshot."""
+
+from dataclasses import FrozenInstanceError, replace
+
+import pytest
+
+from custom_components.dpk_smart_blind.core.const import CalcField, StateOfSunInWindow
+from custom_components.dpk_smart_blind.core.snapshot import BlindSnapshot
+
+
+def _snapshot(
+    now: str = "2024-06-21T12:00:00+00:00", **fields: object
+) -> BlindSnapshot:
+    return BlindSnapshot(
+        now=now,
+        azimuth=180.0,
+        elevation=40.0,
+        cover_setting=35.0,
+        sun_state=StateOfSunInWindow.IN_FRONT,
+        **fields,
+    )
+
+
+def test_equal_on_decisions() -> None:
+    """A tick that only moves the clock and the sun compares equal."""
+    assert _snapshot() == _snapshot(now="2024-06-21T12:05:00+00:00")
+    assert _snapshot() == replace(
+        _snapshot(), azimuth=181.2, elevation=40.3, glazing_irradiance=410
+    )
+    assert _snapshot() != _snapshot(cover_height=1.0)
+    assert _snapshot() != _snapshot(cover_tilt=40.0)
+
+
+def test_immutable() -> None:
+    """Entities can hold on to a snapshot safely."""
+    with pytest.raises(FrozenInstanceError):
+        _snapshot().cover_setting = 50.0  # type: ignore[misc]
+
+
+def test_lookup_by_field_and_key() -> None:
+    """Fields are found by CalcField or by its attribute key."""
+    snapshot = _snapshot()
+    assert snapshot[CalcField.COVER_SETTING] == 35.0
+    assert snapshot[CalcField.SUN_STATE.value] == StateOfSunInWindow.IN_FRONT
+    assert snapshot.as_dict().keys() == {field.value for field in CalcField}
+
+
+def test_diff() -> None:
+    """Only the fields that changed are reported."""
+    previous = _snapshot()
+    current = _snapshot(now="2024-06-21T12:05:00+00:00", cover_height=1.0)
+    assert current.diff(previous) == {
+        CalcField.NOW.value: "2024-06-21T12:05:00+00:00",
+        CalcField.COVER_HEIGHT.value: 1.0,
+    }
+    assert current.diff(current) == {}
+    assert current.diff(None) == current.as_dict()
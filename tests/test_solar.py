@@ -0,0 +1,102 @@
+"""Tests for the vectorised solar position."""
+
+from datetime import UTC, datetime, timedelta
+from zoneinfo import ZoneInfo
+
+import astral
+import astral.sun
+import numpy as np
+import pytest
+
+from custom_components.dpk_smart_blind.core.solar import SolarModel, solar_position
+
+LOCATIONS = (
+    (-80.0, -170.0),
+    (-33.9, 151.2),
+    (0.0, -0.1),
+    (40.7, -74.0),
+    (51.5, -0.1),
+    (64.1, -21.9),
+    (80.0, 170.0),
+)
+YEARS = (2000, 2024, 2050)
+
+# Both sides run the NOAA equations, so any difference is rounding.
+TOLERANCE = 1e-6  # degrees
+# Azimuth swings wildly for tiny changes in position near the zenith.
+AZIMUTH_ZENITH_CUTOFF = 89.5
+
+
+def _azimuth_error(actual: np.ndarray, expected: np.ndarray) -> np.ndarray:
+    return np.abs((actual - expected + 180.0) % 360.0 - 180.0)
+
+
+def _astral(observer: astral.Observer, when: datetime) -> tuple[float, float]:
+    return astral.sun.azimuth(observer, when), astral.sun.elevation(observer, when)
+
+
+@pytest.mark.parametrize("year", YEARS)
+@pytest.mark.parametrize(("latitude", "longitude"), LOCATIONS)
+def test_matches_astral(year: int, latitude: float, longitude: float) -> None:
+    """Every week of the year, at a spread of times of day, within tolerance."""
+    start = datetime(year, 1, 1, tzinfo=UTC)
+    times = [
+        start + timedelta(weeks=week, minutes=(week * 97) % 1440, seconds=week % 60)
+        for week in range(52)
+    ]
+    observer = astral.Observer(latitude, longitude)
+    expected = np.array([_astral(observer, when) for when in times])
+
+    azimuth, elevation = solar_position(
+        np.array([when.timestamp() for when in times]), latitude, longitude
+    )
+
+    assert np.abs(elevation - expected[:, 1]).max() <= TOLERANCE
+    below_zenith = expected[:, 1] < AZIMUTH_ZENITH_CUTOFF
+    assert _azimuth_error(azimuth, expected[:, 0])[below_zenith].max() <= TOLERANCE
+
+
+@pytest.mark.parametrize(
+    ("zone", "local"),
+    [
+        ("Pacific/Auckland", (2024, 6, 22, 8)),  # 2024-06-21 20:00Z
+        ("America/Los_Angeles", (2024, 12, 21, 20)),  # 2024-12-22 04:00Z
+    ],
+)
+def test_julian_day_from_utc_date(zone: str, local: tuple[int, ...]) -> None:
+    """
+    Either side of UTC midnight the UTC date is used, not the local one.
+
+    astral reads the Julian day from a datetime's own date, so a local time
+    whose date differs from UTC's is solved a day out. Both the vectorised
+    engine and SolarModel's scalar solve agree with astral given UTC.
+    """
+    tz = ZoneInfo(zone)
+    when = datetime(*local, tzinfo=tz)
+    assert when.date() != when.astimezone(UTC).date()
+    observer = astral.Observer(51.5, -0.1)
+    expected = _astral(observer, when.astimezone(UTC))
+
+    azimuth, elevation = solar_position(
+        np.array([when.timestamp()]), observer.latitude, observer.longitude
+    )
+    model = SolarModel(observer, tz).position(when)
+
+    assert abs(elevation[0] - expected[1]) <= TOLERANCE
+    assert _azimuth_error(azimuth, np.array([expected[0]]))[0] <= TOLERANCE
+    assert model == pytest.approx(expected, abs=TOLERANCE)
+    assert abs(_astral(observer, when)[1] - expected[1]) > TOLERANCE
+
+
+def test_broadcasts_observers() -> None:
+    """One call covers many observers at one time."""
+    when = datetime(2024, 3, 20, 12, tzinfo=UTC)
+    latitude = np.array([lat for lat, _ in LOCATIONS])
+    longitude = np.array([lon for _, lon in LOCATIONS])
+
+    _, elevation = solar_position(when.timestamp(), latitude, longitude)
+
+    expected = [
+        astral.sun.elevation(astral.Observer(lat, lon), when) for lat, lon in LOCATIONS
+    ]
+    assert elevation == pytest.approx(expected, abs=TOLERANCE)
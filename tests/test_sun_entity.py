@@ -0,0 +1,67 @@
+"""Tests for taking the sun position from sun.sun."""
+
+from typing import Any
+from zoneinfo import ZoneInfo
+
+from astral import Observer
+from homeassistant.core import HomeAssistant, State
+from homeassistant.util import dt as dt_util
+from pytest_homeassistant_custom_component.common import (
+    MockConfigEntry,
+    async_mock_service,
+)
+
+from custom_components.dpk_smart_blind.const import CONF_SUN_POSITION_ENTITY, DOMAIN
+from custom_components.dpk_smart_blind.settings import STORAGE_KEY
+from custom_components.dpk_smart_blind.solar import (
+    SUN_ENTITY_TOLERANCE,
+    SolarPosition,
+)
+
+from .const import MOCK_DATA, MOCK_OPTIONS
+
+
+def test_observation_only_near_its_time() -> None:
+    """The published position stands in for a solve close to when it came."""
+    solar = SolarPosition(Observer(51.5, -0.1), ZoneInfo("UTC"), from_entity=True)
+    published = dt_util.utcnow()
+    state = State(
+        "sun.sun",
+        "above_horizon",
+        {"azimuth": 123.4, "elevation": 33.3},
+        last_updated=published,
+    )
+    assert solar.async_observe(state)
+    assert solar.observation(published + SUN_ENTITY_TOLERANCE) == (123.4, 33.3)
+    assert solar.observation(published + SUN_ENTITY_TOLERANCE * 2) is None
+    assert not solar.async_observe(State("sun.sun", "above_horizon", {}))
+
+    solar.async_set_from_entity(state, from_entity=False)
+    assert solar.observation(published) is None
+
+
+async def test_sun_update_recalculates(
+    hass: HomeAssistant, hass_storage: dict[str, Any]
+) -> None:
+    """Each sun.sun update is calculated with the position it publishes."""
+    hass_storage[STORAGE_KEY] = {
+        "version": 1,
+        "key": STORAGE_KEY,
+        "data": {CONF_SUN_POSITION_ENTITY: True},
+    }
+    hass.states.async_set("sun.sun", "above_horizon", {"azimuth": 180, "elevation": 40})
+    hass.states.async_set("weather.home", "sunny", {"cloud_coverage": 10})
+    hass.states.async_set("cover.study", "open", {"current_position": 100})
+    async_mock_service(hass, "cover", "set_cover_position")
+    entry = MockConfigEntry(domain=DOMAIN, data=MOCK_DATA, options=MOCK_OPTIONS)
+    entry.add_to_hass(hass)
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+    coordinator = entry.runtime_data.coordinator
+    assert (coordinator.data.azimuth, coordinator.data.elevation) == (180, 40)
+
+    hass.states.async_set(
+        "sun.sun", "above_horizon", {"azimuth": 123.4, "elevation": 33.3}
+    )
+    await hass.async_block_till_done()
+    assert (coordinator.data.azimuth, coordinator.data.elevation) == (123.4, 33.3)
@@ -0,0 +1,163 @@
+"""Tests for the smoothed weather gating."""
+
+from datetime import timedelta
+from unittest.mock import MagicMock, patch
+
+import pytest
+from homeassistant.core import HomeAssistant, State
+from homeassistant.util import dt as dt_util
+from pytest_homeassistant_custom_component.common import (
+    MockConfigEntry,
+    async_fire_time_changed,
+    async_mock_service,
+)
+
+from custom_components.dpk_smart_blind.const import (
+    CONF_IRRADIANCE_ENTITY,
+    CONF_WEATHER_ENTITY,
+    CONF_WEATHER_SMOOTHING,
+    CONF_WEATHER_STATE,
+    DOMAIN,
+)
+from custom_components.dpk_smart_blind.sun_filter import HysteresisFilter, SunOutFilter
+
+from .const import MOCK_DATA, MOCK_OPTIONS
+
+
+def _cloud(
+    tau: float = 600, dwell_on: float = 0, dwell_off: float = 0
+) -> HysteresisFilter:
+    return HysteresisFilter(40, 70, tau, dwell_on, dwell_off, on_below=True)
+
+
+def test_quiet_source_keeps_averaging() -> None:
+    """A sample that is never repeated still pulls the average over time."""
+    latch = _cloud()
+    assert latch.update(10, 0)
+    assert latch.update(90, 60)
+    assert latch.value < 70
+
+    assert not latch.advance(3600)
+    assert latch.value == pytest.approx(90, abs=0.5)
+
+
+def test_expired_dwell_acts_on_advance() -> None:
+    """A flip held back by its dwell happens once time moves on."""
+    latch = _cloud(tau=0, dwell_on=900)
+    latch.update(10, 0)
+    assert latch.update(90, 100)
+    assert latch.flip_due(100) == 800
+
+    assert latch.advance(899)
+    assert not latch.advance(900)
+    assert latch.flip_due(900) is None
+
+
+def test_flip_due_none_while_settled() -> None:
+    """Nothing is due while the average agrees with the latch."""
+    latch = _cloud()
+    assert latch.flip_due(0) is None
+    latch.update(10, 0)
+    assert latch.flip_due(10) is None
+    assert latch.advance(10)
+
+
+def test_unavailable_irradiance_hands_back_to_weather() -> None:
+    """Irradiance takes precedence only while the sensor reports."""
+    sun_filter = SunOutFilter(
+        {
+            CONF_WEATHER_ENTITY: "weather.home",
+            CONF_WEATHER_STATE: ["sunny"],
+            CONF_IRRADIANCE_ENTITY: "sensor.irradiance",
+        }
+    )
+    sun_filter.update_weather(
+        State("weather.home", "cloudy", {"cloud_coverage": 90}), 0
+    )
+    assert not sun_filter.sun_out
+
+    sun_filter.update_irradiance(State("sensor.irradiance", "800"), 0)
+    assert sun_filter.sun_out
+    assert sun_filter.irradiance == 800
+
+    sun_filter.update_irradiance(State("sensor.irradiance", "unavailable"), 10)
+    assert not sun_filter.sun_out
+    assert sun_filter.irradiance is None
+
+
+def test_conditions_without_coverage_or_states() -> None:
+    """With no coverage and no clear conditions listed, the weather is ignored."""
+    sun_filter = SunOutFilter({CONF_WEATHER_ENTITY: "weather.home"})
+    sun_filter.update_weather(State("weather.home", "cloudy"), 0)
+    assert sun_filter.cloud_coverage is None
+    assert sun_filter.sun_out
+
+    listed = SunOutFilter(
+        {CONF_WEATHER_ENTITY: "weather.home", CONF_WEATHER_STATE: ["sunny"]}
+    )
+    listed.update_weather(State("weather.home", "cloudy"), 0)
+    assert listed.cloud_coverage == 100
+    assert not listed.sun_out
+
+
+@pytest.fixture
+def clock() -> MagicMock:
+    """Stand-in for time.monotonic where the integration reads it."""
+    fake = MagicMock()
+    fake.monotonic.return_value = 1000.0
+    with (
+        patch("custom_components.dpk_smart_blind.time", fake),
+        patch("custom_components.dpk_smart_blind.coordinator.time", fake),
+    ):
+        yield fake
+
+
+async def _setup(hass: HomeAssistant, **options: object) -> MockConfigEntry:
+    hass.states.async_set("sun.sun", "above_horizon", {"azimuth": 180, "elevation": 40})
+    hass.states.async_set("weather.home", "cloudy", {"cloud_coverage": 90})
+    hass.states.async_set("cover.study", "open", {"current_position": 100})
+    async_mock_service(hass, "cover", "set_cover_position")
+    entry = MockConfigEntry(
+        domain=DOMAIN, data=MOCK_DATA, options={**MOCK_OPTIONS, **options}
+    )
+    entry.add_to_hass(hass)
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+    return entry
+
+
+async def test_tick_ages_quiet_weather(hass: HomeAssistant, clock: MagicMock) -> None:
+    """A weather entity that reports once is still followed at each tick."""
+    entry = await _setup(hass)
+    coordinator = entry.runtime_data.coordinator
+    assert not coordinator.sun_out
+
+    clock.monotonic.return_value = 1001.0
+    hass.states.async_set("weather.home", "sunny", {"cloud_coverage": 10})
+    await hass.async_block_till_done()
+    assert not coordinator.sun_out
+
+    clock.monotonic.return_value = 1000.0 + 3600
+    await coordinator.async_refresh()
+    assert coordinator.sun_out
+    assert coordinator.data.sun_out
+
+
+async def test_dwell_wakes_coordinator(hass: HomeAssistant, clock: MagicMock) -> None:
+    """Once a held flip's dwell runs out the blind refreshes without a tick."""
+    entry = await _setup(hass, **{CONF_WEATHER_SMOOTHING: 0})
+    coordinator = entry.runtime_data.coordinator
+    lifecycle = entry.runtime_data.lifecycle
+
+    clock.monotonic.return_value = 1100.0
+    hass.states.async_set("weather.home", "sunny", {"cloud_coverage": 10})
+    await hass.async_block_till_done()
+    assert not coordinator.sun_out
+    assert lifecycle.pending("dwell")
+
+    clock.monotonic.return_value = 1000.0 + 600
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=500))
+    await hass.async_block_till_done()
+    assert coordinator.sun_out
+    assert coordinator.data.sun_out
+    assert not lifecycle.pending("dwell")
@@ -0,0 +1,53 @@
+"""Tests for the shared sun position sensors."""
+
+from datetime import timedelta
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import entity_registry as er
+from homeassistant.util import dt as dt_util
+from pytest_homeassistant_custom_component.common import (
+    MockConfigEntry,
+    async_fire_time_changed,
+    async_mock_service,
+)
+
+from custom_components.dpk_smart_blind.const import (
+    ATTR_AZIMUTH,
+    ATTR_ELEVATION,
+    DOMAIN,
+)
+from custom_components.dpk_smart_blind.solar import async_get_solar
+
+from .const import MOCK_DATA, MOCK_OPTIONS
+
+
+async def test_position_follows_tick_while_overcast(hass: HomeAssistant) -> None:
+    """The sun sensors move on each tick even while the weather gates the blind."""
+    hass.states.async_set("sun.sun", "above_horizon", {"azimuth": 180, "elevation": 40})
+    hass.states.async_set("weather.home", "cloudy", {"cloud_coverage": 90})
+    hass.states.async_set("cover.study", "open", {"current_position": 100})
+    async_mock_service(hass, "cover", "set_cover_position")
+    entry = MockConfigEntry(domain=DOMAIN, data=MOCK_DATA, options=MOCK_OPTIONS)
+    entry.add_to_hass(hass)
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+    assert not entry.runtime_data.coordinator.sun_out
+
+    registry = er.async_get(hass)
+    azimuth = registry.async_get_entity_id(
+        "sensor", DOMAIN, f"{DOMAIN}-sun-{ATTR_AZIMUTH}"
+    )
+    elevation = registry.async_get_entity_id(
+        "sensor", DOMAIN, f"{DOMAIN}-sun-{ATTR_ELEVATION}"
+    )
+    before = hass.states.get(azimuth).state
+
+    tick = (dt_util.now() + timedelta(hours=2)).replace(second=0, microsecond=0)
+    tick = tick.replace(minute=tick.minute - tick.minute % 5)
+    async_fire_time_changed(hass, tick)
+    await hass.async_block_till_done()
+
+    expected = async_get_solar(hass).position(tick)
+    assert hass.states.get(azimuth).state != before
+    assert float(hass.states.get(azimuth).state) == round(expected[0], 1)
+    assert float(hass.states.get(elevation).state) == round(expected[1], 1)
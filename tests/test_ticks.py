@@ -0,0 +1,103 @@
+"""Tests for the tick log."""
+
+import subprocess
+import sys
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from custom_components.dpk_smart_blind.core.const import StateOfSunInWindow
+from custom_components.dpk_smart_blind.core.snapshot import BlindSnapshot
+from custom_components.dpk_smart_blind.core.ticks import (
+    FLAG_SUN_IN_WINDOW,
+    FLAG_SUN_OUT,
+    HEADER,
+    RECORD,
+    SUN_STATES,
+    read_tick_log,
+)
+from custom_components.dpk_smart_blind.tick_log import TickLog
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+def _snapshot(now: str, setting: float | None) -> BlindSnapshot:
+    return BlindSnapshot(
+        now=now,
+        azimuth=181.5,
+        elevation=32.25,
+        cover_setting=setting,
+        sun_state=StateOfSunInWindow.IN_FRONT,
+        sun_out=True,
+        sun_in_window=True,
+    )
+
+
+def _write(path: Path) -> None:
+    log = TickLog(path)
+    log.append(_snapshot("2024-06-21T12:00:00+00:00", 40))
+    log.append(_snapshot("2024-06-21T12:05:00+00:00", None))
+    log.write(log.take())
+
+
+def test_round_trip(tmp_path: Path) -> None:
+    """Records written by the integration read back field for field."""
+    path = tmp_path / "entry.ticks"
+    _write(path)
+    with path.open("ab") as file:
+        file.write(b"\x00" * 5)  # torn record from a crash
+
+    ticks = read_tick_log(path)
+    assert len(ticks) == 2
+    assert ticks["time"][1] - ticks["time"][0] == 300
+    assert ticks["azimuth"][0] == pytest.approx(181.5)
+    assert ticks["cover_setting"][0] == 40
+    assert np.isnan(ticks["cover_setting"][1])
+    assert ticks["sun_state"][0] == SUN_STATES.index(StateOfSunInWindow.IN_FRONT)
+    assert ticks["flags"][0] == FLAG_SUN_OUT | FLAG_SUN_IN_WINDOW
+
+
+def test_rejects_other_files(tmp_path: Path) -> None:
+    """A file without the header is not mistaken for a log."""
+    path = tmp_path / "other.ticks"
+    path.write_bytes(b"x" * (len(HEADER) + 26))
+    with pytest.raises(ValueError, match="not a tick log"):
+        read_tick_log(path)
+
+
+def test_reader_script_without_home_assistant(tmp_path: Path) -> None:
+    """scripts/read_ticks.py never imports Home Assistant."""
+    path = tmp_path / "entry.ticks"
+    _write(path)
+    code = (
+        "import runpy, sys\n"
+        f"sys.argv = ['read_ticks.py', {str(path)!r}]\n"
+        f"runpy.run_path({str(ROOT / 'scripts' / 'read_ticks.py')!r}, "
+        "run_name='__main__')\n"
+        "assert 'homeassistant' not in sys.modules\n"
+    )
+    result = subprocess.run(  # noqa: S603
+        [sys.executable, "-c", code], capture_output=True, text=True, check=False
+    )
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.startswith("2 ticks")
+
+
+def test_append_after_torn_tail(tmp_path: Path) -> None:
+    """Records written after a crash line up with the ones before it."""
+    path = tmp_path / "entry.ticks"
+    now = datetime.now(UTC).replace(microsecond=0)
+    log = TickLog(path)
+    for minutes in (0, 5, 10):
+        log.append(_snapshot((now + timedelta(minutes=minutes)).isoformat(), 40))
+        if minutes == 5:
+            log.write(log.take()[:-5])  # power cut part way through a record
+    log.write(log.take())
+
+    assert (path.stat().st_size - len(HEADER)) % RECORD.size == 0
+    ticks = read_tick_log(path)
+    assert len(ticks) == 2
+    assert ticks["time"][1] - ticks["time"][0] == 600
+    assert ticks["cover_setting"][1] == 40
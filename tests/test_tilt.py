@@ -0,0 +1,47 @@
+"""Tests for venetian slat tilt."""
+
+import numpy as np
+import pytest
+
+from custom_components.dpk_smart_blind.core.config import WindowConfig
+from custom_components.dpk_smart_blind.core.tilt import (
+    MAX_PROFILE,
+    TILT_OPEN,
+    SlatTable,
+    cutoff_angle,
+)
+
+
+def test_cutoff_angle() -> None:
+    """Slats as wide as their spacing shut out a level sun, not a high one."""
+    angle = cutoff_angle(np.array([0.0, 30.0, 60.0, 90.0]), 25.0, 25.0)
+    assert angle == pytest.approx([90.0, 30.0, 0.0, 0.0])
+
+
+def test_narrow_slats_face_the_beam() -> None:
+    """Where the gap cannot be covered the slats turn square on to the sun."""
+    angle = cutoff_angle(np.array([0.0, 20.0]), 10.0, 25.0)
+    assert angle == pytest.approx([90.0, 70.0])
+
+
+def test_table_matches_direct_calculation() -> None:
+    """Lookups interpolate the grid to within a hair of the exact tilt."""
+    table = SlatTable.from_config(
+        WindowConfig(
+            azimuth=180.0,
+            fov_left=90.0,
+            fov_right=90.0,
+            distance=0.5,
+            window_height=2.1,
+            default_height=100.0,
+            delta_time=5.0,
+            tilt_mode=True,
+            slat_width=25.0,
+            slat_spacing=21.0,
+        )
+    )
+    for profile in (0.0, 12.3, 33.3, 57.75):
+        exact = TILT_OPEN * (1 - cutoff_angle(np.array(profile), 25.0, 21.0) / 90)
+        assert table.tilt_position(profile) == pytest.approx(float(exact), abs=0.1)
+    assert table.tilt_position(-5.0) == table.tilt_position(0.0)
+    assert table.tilt_position(MAX_PROFILE + 5) == TILT_OPEN
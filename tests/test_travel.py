@@ -0,0 +1,101 @@
+"""Tests for learned cover travel times."""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+from homeassistant.core import HomeAssistant
+from pytest_homeassistant_custom_component.common import (
+    MockConfigEntry,
+    async_mock_service,
+)
+
+from custom_components.dpk_smart_blind.const import DOMAIN
+from custom_components.dpk_smart_blind.core.const import STATE_CLOSING, STATE_OPENING
+from custom_components.dpk_smart_blind.core.travel import (
+    TRAVEL_SMOOTHING,
+    TravelEstimator,
+)
+
+from .const import MOCK_DATA, MOCK_OPTIONS
+
+
+def test_learns_each_direction() -> None:
+    """Each direction keeps its own smoothed seconds per percent."""
+    travel = TravelEstimator()
+    travel.start(STATE_OPENING, 0, 100)
+    assert travel.settle(100, 150) == 0.5
+    travel.start(STATE_OPENING, 0, 200)
+    assert travel.settle(50, 250) == pytest.approx(0.5 + TRAVEL_SMOOTHING * 0.5)
+    assert travel.seconds_per_percent[STATE_CLOSING] is None
+
+
+def test_short_or_unknown_moves_ignored() -> None:
+    """Nudges and moves without a start position teach nothing."""
+    travel = TravelEstimator()
+    travel.start(STATE_CLOSING, 50, 0)
+    assert travel.settle(48, 10) is None
+    travel.start(STATE_CLOSING, None, 0)
+    assert travel.settle(0, 10) is None
+    assert travel.seconds_per_percent[STATE_CLOSING] is None
+
+
+def test_arrival() -> None:
+    """A move under way is predicted to end at its target, or the end stop."""
+    travel = TravelEstimator()
+    travel.start(STATE_CLOSING, 100, 0)
+    assert travel.arrival(None) is None
+    travel.settle(0, 40)
+
+    travel.start(STATE_CLOSING, 80, 1000)
+    travel.start(STATE_CLOSING, 70, 1005)  # still the same move
+    assert travel.arrival(40) == 1000 + 0.4 * 40
+    assert travel.arrival(None) == 1000 + 0.4 * 80
+
+
+@pytest.fixture
+def clock() -> MagicMock:
+    """Stand-in for time.monotonic where the integration reads it."""
+    fake = MagicMock()
+    fake.monotonic.return_value = 1000.0
+    with (
+        patch("custom_components.dpk_smart_blind.time", fake),
+        patch("custom_components.dpk_smart_blind.coordinator.time", fake),
+    ):
+        yield fake
+
+
+async def test_blind_waits_for_moving_cover(
+    hass: HomeAssistant, clock: MagicMock
+) -> None:
+    """Once a cover's speed is known the blind sits out its moves."""
+    hass.states.async_set("sun.sun", "above_horizon", {"azimuth": 180, "elevation": 40})
+    hass.states.async_set("weather.home", "sunny", {"cloud_coverage": 10})
+    hass.states.async_set("cover.study", "open", {"current_position": 100})
+    async_mock_service(hass, "cover", "set_cover_position")
+    entry = MockConfigEntry(domain=DOMAIN, data=MOCK_DATA, options=MOCK_OPTIONS)
+    entry.add_to_hass(hass)
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+    coordinator = entry.runtime_data.coordinator
+    lifecycle = entry.runtime_data.lifecycle
+
+    hass.states.async_set("cover.study", "closing", {"current_position": 100})
+    await hass.async_block_till_done()
+    assert not coordinator.async_defer_while_travelling()
+    clock.monotonic.return_value = 1050.0
+    hass.states.async_set("cover.study", "closed", {"current_position": 0})
+    await hass.async_block_till_done()
+    hass.states.async_set("cover.study", "open", {"current_position": 100})
+    await hass.async_block_till_done()
+
+    clock.monotonic.return_value = 2000.0
+    hass.states.async_set("cover.study", "closing", {"current_position": 100})
+    await hass.async_block_till_done()
+    assert coordinator.async_defer_while_travelling()
+    assert lifecycle.pending("arrival")
+
+    clock.monotonic.return_value = 2030.0
+    hass.states.async_set("cover.study", "open", {"current_position": 40})
+    await hass.async_block_till_done()
+    assert not lifecycle.pending("arrival")
+    assert not coordinator.async_defer_while_travelling()
@@ -0,0 +1,64 @@
+"""Tests for the state stream websocket command."""
+
+from dataclasses import replace
+from datetime import timedelta
+
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+from pytest_homeassistant_custom_component.common import (
+    MockConfigEntry,
+    async_fire_time_changed,
+    async_mock_service,
+)
+from pytest_homeassistant_custom_component.typing import WebSocketGenerator
+
+from custom_components.dpk_smart_blind.const import (
+    ATTR_COVER_HEIGHT,
+    ATTR_COVER_SETTING,
+    DOMAIN,
+)
+from custom_components.dpk_smart_blind.websocket_api import FLUSH_DELAY
+
+from .const import MOCK_DATA, MOCK_OPTIONS
+
+
+def _flush(hass: HomeAssistant) -> None:
+    async_fire_time_changed(
+        hass, dt_util.utcnow() + timedelta(seconds=FLUSH_DELAY + 0.1)
+    )
+
+
+async def test_snapshot_then_deltas(
+    hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Subscribers get every blind once, then only what changed."""
+    hass.states.async_set("sun.sun", "above_horizon", {"azimuth": 180, "elevation": 40})
+    hass.states.async_set("weather.home", "sunny", {"cloud_coverage": 10})
+    hass.states.async_set("cover.study", "open", {"current_position": 100})
+    async_mock_service(hass, "cover", "set_cover_position")
+    entry = MockConfigEntry(domain=DOMAIN, data=MOCK_DATA, options=MOCK_OPTIONS)
+    entry.add_to_hass(hass)
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+    coordinator = entry.runtime_data.coordinator
+
+    client = await hass_ws_client(hass)
+    await client.send_json_auto_id({"type": f"{DOMAIN}/subscribe"})
+    assert (await client.receive_json())["success"]
+    event = (await client.receive_json())["event"]
+    assert event["type"] == "snapshot"
+    assert event["entries"][entry.entry_id]["name"] == "Study"
+    assert ATTR_COVER_SETTING in event["entries"][entry.entry_id]
+
+    coordinator.async_set_updated_data(replace(coordinator.data, cover_height=1.25))
+    _flush(hass)
+    event = (await client.receive_json())["event"]
+    assert event == {
+        "type": "delta",
+        "entries": {entry.entry_id: {ATTR_COVER_HEIGHT: 1.25}},
+    }
+
+    assert await hass.config_entries.async_unload(entry.entry_id)
+    _flush(hass)
+    event = (await client.receive_json())["event"]
+    assert event == {"type": "delta", "entries": {entry.entry_id: None}}